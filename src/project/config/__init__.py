@@ -3,14 +3,26 @@ subpackage.
 """
 
 __all__ = [
+    "OptunaTrialCallback",
     "ParentRunCallback",
+    "PrunedTrialStorage",
+    "SharedDataCallback",
+    "cpu_budget",
+    "current_trial",
     "make_cli",
     "make_db_engine",
     "make_model",
     "store",
 ]
 
-from .callbacks import ParentRunCallback
+from .budget import cpu_budget
+from .callbacks import (
+    OptunaTrialCallback,
+    ParentRunCallback,
+    PrunedTrialStorage,
+    SharedDataCallback,
+    current_trial,
+)
 from .make_cli import make_cli
 from .stores import store
 from .stores.db_store import make_db_engine
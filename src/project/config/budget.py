@@ -0,0 +1,43 @@
+"""Budget the cores of the entrypoints by the concurrent jobs of Hydra."""
+
+import joblib
+from hydra.core.hydra_config import HydraConfig
+from hydra.types import RunMode
+
+from ..util import CpuBudget, split_cores
+
+__all__ = [
+    "concurrent_jobs",
+    "cpu_budget",
+]
+
+
+def concurrent_jobs() -> int:
+    """Number of jobs of a multi-run running concurrently, including the current one.
+
+    Only the joblib launcher runs jobs concurrently, as many as its `n_jobs` and at
+    most as many as the sweeper launches at once, e.g. its `n_jobs` for Optuna.
+    """
+    if not HydraConfig.initialized():
+        return 1
+
+    hydra = HydraConfig.get()
+    n_jobs = hydra.launcher.get("n_jobs")
+    if hydra.mode != RunMode.MULTIRUN or not n_jobs:
+        return 1
+
+    n_jobs = joblib.effective_n_jobs(n_jobs)
+    batch_size = hydra.sweeper.get("n_jobs")
+    return min(n_jobs, batch_size) if batch_size else n_jobs
+
+
+def cpu_budget(processes: int = 1) -> CpuBudget:
+    """Split the available cores between the concurrent jobs and their processes.
+
+    Args:
+        processes: Number of processes each job wants to run concurrently.
+
+    Returns:
+        Allocation of the cores to the current job.
+    """
+    return split_cores(concurrent_jobs(), processes)
@@ -1,9 +1,20 @@
+import io
 import os
+from collections.abc import Sequence
+from contextlib import redirect_stderr
+from contextvars import ContextVar
+from datetime import date, timedelta
+from pathlib import Path
 from typing import Any
 
 from hydra import TaskFunction
+from hydra.core.utils import JobReturn, JobStatus
 from hydra.experimental.callback import Callback
-from omegaconf import DictConfig
+from omegaconf import DictConfig, OmegaConf
+
+JOB_ATTR = "hydra_job"  # User attribute of trials claimed by a job
+PRUNED_ATTR = "pruned"  # User attribute of trials pruned in their job
+_trial: ContextVar[Any] = ContextVar("trial", default=None)
 
 
 class ParentRunCallback(Callback):  # pragma: no cover
@@ -39,3 +50,215 @@ class ParentRunCallback(Callback):  # pragma: no cover
         if mlflow.active_run() != self._parent_run:
             mlflow.end_run()
             mlflow.start_run(run_id=self._parent_run.info.run_id)
+
+
+class SharedDataCallback(Callback):
+    """Load and process the data once and share it with all jobs during multi-run.
+
+    The processed data is written to the sweep directory and memory-mapped read-only
+    by the jobs in all workers instead of each job loading its own copy. The raw data
+    and the load metrics are shared along, such that the jobs keep the same artifacts
+    as if they loaded the data. Jobs that override the data config, e.g. the training
+    cutoff, load their data on their own.
+
+    Args:
+        filename: Name of the shared file in the sweep directory.
+
+    Notes:
+        This callback is only relevant for multi-run jobs.
+    """
+
+    data_keys = ["dataloader", "dataprocessor", "training_cutoff", "num_samples"]
+
+    def __init__(self, filename: str = "data.joblib") -> None:
+        self.filename = filename
+        self._path: Path | None = None
+        self._data_config: Any = None
+
+    def on_multirun_start(self, config: DictConfig, **kwargs: Any) -> None:
+        """Load, process, and share the data before any job."""
+        if not all(key in config for key in self.data_keys):
+            return
+
+        from hydra_zen import instantiate
+
+        from ..data import SharedData, collect_load_metrics, share_data
+        from ..util import write_parquet
+
+        end_date = date.fromisoformat(str(config.training_cutoff))
+        start_date = end_date - timedelta(days=config.num_samples - 1)
+        dataloader = instantiate(config.dataloader)
+        dataprocessor = instantiate(config.dataprocessor)
+        path = Path(config.hydra.sweep.dir) / self.filename
+        path.parent.mkdir(parents=True, exist_ok=True)
+        raw_path = path.with_suffix(".parquet")
+        with collect_load_metrics() as load_metrics:  # Like in each job
+            raw = dataloader({"start_date": start_date, "end_date": end_date})
+            X, y = dataprocessor(raw)
+            write_parquet(raw, raw_path)
+        share_data(SharedData(X, y, raw_path, load_metrics.summary()), path)
+        self._path = path
+        self._data_config = self._select_data_config(config)
+
+    def on_job_start(
+        self, config: DictConfig, *, task_function: TaskFunction, **kwargs: Any
+    ) -> None:
+        """Point the job to the shared data if its data config is unchanged."""
+        from ..data import ENV_VAR_SHARED_DATA
+
+        if self._path and self._select_data_config(config) == self._data_config:
+            os.environ[ENV_VAR_SHARED_DATA] = str(self._path)
+        else:
+            os.environ.pop(ENV_VAR_SHARED_DATA, None)
+
+    def on_job_end(self, config: DictConfig, job_return: Any, **kwargs: Any) -> None:
+        """Detach the process from the shared data after each job."""
+        from ..data import ENV_VAR_SHARED_DATA
+
+        os.environ.pop(ENV_VAR_SHARED_DATA, None)
+
+    def on_multirun_end(self, config: DictConfig, **kwargs: Any) -> None:
+        """Remove the shared data after all jobs."""
+        if self._path:
+            self._path.unlink(missing_ok=True)
+            self._path.with_suffix(".parquet").unlink(missing_ok=True)
+
+    def _select_data_config(self, config: DictConfig) -> Any:
+        """Resolved config of the data, which must be equal for all jobs to share."""
+        return OmegaConf.to_container(
+            OmegaConf.masked_copy(config, self.data_keys), resolve=True
+        )
+
+
+class OptunaTrialCallback(Callback):
+    """Connect each job of an Optuna sweep to its trial, e.g. to report scores.
+
+    The trial of the current job is returned by `current_trial`. It is the running
+    trial of the study with the parameters of the overrides of the job. Each trial is
+    claimed by one job with a user attribute, such that trials asked by concurrent
+    sweeps of the same study or failed before are not confused.
+
+    The sweeper only completes or fails trials. Jobs that raise `optuna.TrialPruned`
+    are therefore completed and marked, such that the `PrunedTrialStorage` of the
+    sweeper records them as pruned without a value. The objective of the study then
+    only compares the returned scores of completed trials, while the pruner compares
+    the reported intermediate scores.
+
+    Args:
+        pruner: Pruner that decides on the reported scores, e.g. `MedianPruner`.
+
+    Notes:
+        This callback is only relevant for HPO jobs with a named study in a storage.
+    """
+
+    def __init__(self, pruner: Any = None) -> None:
+        self.pruner = pruner
+        self._study: tuple[str, str] | None = None
+
+    def on_multirun_start(self, config: DictConfig, **kwargs: Any) -> None:
+        """Find the study of the sweeper before any job."""
+        study_name = config.hydra.sweeper.get("study_name")
+        storage = config.hydra.sweeper.get("storage")
+        if isinstance(storage, DictConfig):
+            storage = storage.get("url")
+        if study_name and storage:
+            self._study = (study_name, storage)
+
+    def on_job_start(
+        self, config: DictConfig, *, task_function: TaskFunction, **kwargs: Any
+    ) -> None:
+        """Load and claim the trial of the job."""
+        if self._study is None:
+            return
+
+        import optuna
+
+        study_name, url = self._study
+        storage = optuna.storages.get_storage(url)
+        study = optuna.load_study(
+            study_name=study_name, storage=storage, pruner=self.pruner
+        )
+        overrides = list(config.hydra.overrides.task)
+        _trial.set(_claim_trial(study, storage, overrides, config.hydra.job.id))
+
+    def on_job_end(
+        self, config: DictConfig, job_return: JobReturn, **kwargs: Any
+    ) -> None:
+        """Complete pruned trials with their last score and unset the trial."""
+        trial = _trial.get()
+        _trial.set(None)
+        if trial is None or job_return.status != JobStatus.FAILED:
+            return
+
+        import optuna
+
+        try:
+            with redirect_stderr(io.StringIO()):  # Reported by the sweeper, if at all
+                _ = job_return.return_value  # Raises the exception of the job
+        except optuna.TrialPruned:
+            frozen = trial.study.trials[trial.number]
+            trial.set_user_attr(PRUNED_ATTR, True)
+            job_return.status = JobStatus.COMPLETED
+            job_return.return_value = frozen.intermediate_values[frozen.last_step]
+        except Exception:  # Failed for other reasons and left to the sweeper
+            return
+
+
+class PrunedTrialStorage:
+    """Optuna storage that records the trials marked by `OptunaTrialCallback` as pruned.
+
+    Pass it as storage of the Optuna sweeper. Marked trials are recorded as pruned
+    without a value, as their last score is an intermediate one, e.g. out-of-bag,
+    unlike the returned score of completed trials. All other methods are delegated to
+    the storage of the URL.
+
+    Args:
+        url: Database URL of the storage, e.g. "sqlite:///optuna.db", or a storage.
+    """
+
+    def __init__(self, url: Any) -> None:
+        import optuna
+
+        self.url = url
+        self._storage: Any = optuna.storages.get_storage(url)
+
+    def __getattr__(self, name: str) -> Any:
+        """Delegate to the storage of the URL."""
+        return getattr(self._storage, name)
+
+    def set_trial_state_values(
+        self, trial_id: int, state: Any, values: Sequence[float] | None = None
+    ) -> bool:
+        """Record the completion of marked trials as pruned without a value."""
+        from optuna.trial import TrialState
+
+        pruned = self._storage.get_trial_user_attrs(trial_id).get(PRUNED_ATTR)
+        if state.is_finished() and pruned:
+            state, values = TrialState.PRUNED, None
+        return self._storage.set_trial_state_values(trial_id, state, values)
+
+
+def _claim_trial(study: Any, storage: Any, overrides: list[str], job: str) -> Any:
+    """Claim the running trial of a study with the parameters of the overrides.
+
+    Returns:
+        Trial of the job, or None if no unclaimed trial has the parameters.
+    """
+    import optuna
+    from optuna.trial import TrialState
+
+    for frozen in study.get_trials(deepcopy=False, states=[TrialState.RUNNING]):
+        params = {f"{name}={value}" for name, value in frozen.params.items()}
+        if params <= set(overrides) and JOB_ATTR not in frozen.user_attrs:
+            study_id = storage.get_study_id_from_name(study.study_name)
+            number = frozen.number
+            trial_id = storage.get_trial_id_from_study_id_trial_number(study_id, number)
+            trial = optuna.Trial(study, trial_id)
+            trial.set_user_attr(JOB_ATTR, job)
+            return trial
+    return None
+
+
+def current_trial() -> Any | None:
+    """Optuna trial of the current job, if connected by `OptunaTrialCallback`."""
+    return _trial.get()
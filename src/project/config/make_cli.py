@@ -7,6 +7,7 @@ from dotenv import find_dotenv, load_dotenv
 from hydra_zen import zen
 from hydra_zen.third_party.pydantic import pydantic_parser
 
+from ..data import cache_validation
 from .stores import store
 
 CONFIG_PATH = str(Path("config").resolve())  # Absolute path from CWD
@@ -23,6 +24,7 @@ def make_cli(func: Callable[..., Any]) -> Callable[[], None]:  # pragma: no cove
         config_path = "." if config_name in {"test", "prod"} else CONFIG_PATH
         store.add_to_hydra_store()
         entrypoint = zen(func, instantiation_wrapper=pydantic_parser)
-        entrypoint.hydra_main(config_path, config_name, version_base=None)
+        with cache_validation():  # Reuse validated data in all jobs of the run
+            entrypoint.hydra_main(config_path, config_name, version_base=None)
 
     return cli
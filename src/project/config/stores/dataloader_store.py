@@ -9,6 +9,9 @@ __all__ = []  # No exports. Use the global store
 
 dataloader_store = store(group="dataloader")
 
+# No store probes watermarks: The dummy sources have no update time to track and their
+# rows only depend on the date range, which is part of the cache key, see sql/watermark
+
 # Production data
 dataloader_store(
     data.fetch_data,
@@ -21,3 +24,33 @@ dataloader_store(
     ],
     name="prod",
 )
+
+# Production data fetched in parallel, e.g. for many identifiers. Not partitioned by
+# date, as the queries derive values from the days since the start date, see README
+dataloader_store(
+    data.fetch_data,
+    zen_partial=True,
+    db_engine=None,
+    sql_queries=builds(data.load_sql_files),
+    shard_size=1000,  # Identifiers per shard
+    max_workers=8,
+    hydra_defaults=[
+        "_self_",
+        {"/db@db_engine": "file"},  # Concurrent connections
+    ],
+    name="sharded",
+)
+
+# Production data loaded into Polars, e.g. for long training windows on many cores
+dataloader_store(
+    data.fetch_data_lazy,
+    zen_partial=True,
+    db_engine=None,
+    sql_queries=builds(data.load_sql_files),
+    max_workers=4,
+    hydra_defaults=[
+        "_self_",
+        {"/db@db_engine": "file"},  # Concurrent connections
+    ],
+    name="polars",
+)
@@ -15,3 +15,20 @@ dataprocessor(
     target_column="target",
     name="prod",
 )
+
+# Production data processor with compact float32 features, e.g. for tree models
+dataprocessor(
+    data.process_data,
+    zen_partial=True,
+    target_column="target",
+    data_model=data.CompactProcessedDataModel,
+    name="compact",
+)
+
+# Production data processor for Polars data of the dataloader "polars"
+dataprocessor(
+    data.process_data_lazy,
+    zen_partial=True,
+    target_column="target",
+    name="polars",
+)
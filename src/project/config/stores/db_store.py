@@ -1,30 +1,157 @@
 """Config store for database connections with SQLAlchemy engines."""
 
+import logging
+from typing import Any
+
 from dotenv import load_dotenv
 from hydra_zen import instantiate, store
 from sqlalchemy import URL, Engine
 from sqlalchemy import create_engine as sa_create_engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.ext.asyncio import create_async_engine as sa_create_async_engine
 
+from ...util import map_threaded
 from .util import builds
 
 __all__ = [
+    "create_async_engine",
     "create_engine",
     "db_store",
     "make_db_engine",
+    "warm_up_pool",
 ]
 
 db_store = store(group="db")
+logger = logging.getLogger(__name__)
 
 
-def make_db_engine(name: str) -> Engine:
+def make_db_engine(name: str) -> Engine | AsyncEngine:
     """Instantiate an SQLAlchemy Engine from the DB store for use in notebooks."""
     load_dotenv()  # Load secrets
     return instantiate(db_store.get_entry(group="db", name=name)["node"])
 
 
-def create_engine(url: URL | str, pool_recycle: int = -1) -> Engine:
-    """Type-safe version of SQLalchemy's create_engine for pydantic"""
-    return sa_create_engine(url, pool_recycle=pool_recycle)
+def create_engine(
+    url: URL | str,
+    pool_recycle: int = -1,
+    pool_size: int | None = None,
+    max_overflow: int | None = None,
+    pool_timeout: float | None = None,
+    pool_pre_ping: bool = False,
+    execution_options: dict[str, Any] | None = None,
+    connect_args: dict[str, Any] | None = None,
+    query_cache_size: int = 500,
+    warm_up: int = 0,
+) -> Engine:
+    """Type-safe version of SQLalchemy's create_engine for pydantic
+
+    Args:
+        url: Database URL.
+        pool_recycle: Seconds after which connections are recycled or -1 for never.
+        pool_size: Number of connections kept open in the pool. Defaults to the pool.
+        max_overflow: Number of connections beyond the pool size. Defaults to the pool.
+        pool_timeout: Seconds to wait for a connection. Defaults to the pool.
+        pool_pre_ping: Test connections for liveness before using them.
+        execution_options: Options for all connections, e.g. `stream_results` for
+            server-side cursors.
+        connect_args: Arguments of the database driver, e.g. statement timeouts.
+        query_cache_size: Number of statements kept compiled for the dialect.
+        warm_up: Number of connections to open right away instead of on first use.
+
+    Returns:
+        Database connection engine.
+    """
+    engine = sa_create_engine(
+        url,
+        **_engine_options(
+            pool_recycle=pool_recycle,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_timeout=pool_timeout,
+            pool_pre_ping=pool_pre_ping,
+            execution_options=execution_options,
+            connect_args=connect_args,
+            query_cache_size=query_cache_size,
+        ),
+    )
+    if warm_up:
+        warm_up_pool(engine, warm_up)
+    return engine
+
+
+def create_async_engine(
+    url: URL | str,
+    pool_recycle: int = -1,
+    pool_size: int | None = None,
+    max_overflow: int | None = None,
+    pool_timeout: float | None = None,
+    pool_pre_ping: bool = False,
+    execution_options: dict[str, Any] | None = None,
+    connect_args: dict[str, Any] | None = None,
+    query_cache_size: int = 500,
+) -> AsyncEngine:
+    """Type-safe version of SQLalchemy's create_async_engine for pydantic
+
+    Args:
+        url: Database URL with an asyncio driver, e.g. "postgresql+asyncpg".
+        pool_recycle: Seconds after which connections are recycled or -1 for never.
+        pool_size: Number of connections kept open in the pool. Defaults to the pool.
+        max_overflow: Number of connections beyond the pool size. Defaults to the pool.
+        pool_timeout: Seconds to wait for a connection. Defaults to the pool.
+        pool_pre_ping: Test connections for liveness before using them.
+        execution_options: Options for all connections.
+        connect_args: Arguments of the database driver, e.g. statement timeouts.
+        query_cache_size: Number of statements kept compiled for the dialect.
+
+    Returns:
+        Asyncio database connection engine.
+    """
+    return sa_create_async_engine(
+        url,
+        **_engine_options(
+            pool_recycle=pool_recycle,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_timeout=pool_timeout,
+            pool_pre_ping=pool_pre_ping,
+            execution_options=execution_options,
+            connect_args=connect_args,
+            query_cache_size=query_cache_size,
+        ),
+    )
+
+
+def _engine_options(
+    pool_size: int | None,
+    max_overflow: int | None,
+    pool_timeout: float | None,
+    execution_options: dict[str, Any] | None,
+    connect_args: dict[str, Any] | None,
+    **options: Any,
+) -> dict[str, Any]:
+    """Collect the engine options, leaving unset pool sizes to the pool's defaults."""
+    pool_options = {
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
+        "pool_timeout": pool_timeout,
+    }
+    return options | {
+        "execution_options": execution_options or {},
+        "connect_args": connect_args or {},
+        **{k: v for k, v in pool_options.items() if v is not None},
+    }
+
+
+def warm_up_pool(engine: Engine, connections: int) -> None:
+    """Open connections concurrently and return them to the pool for later use."""
+    logger.debug("Warm up %d database connections", connections)
+    opened = list(
+        map_threaded(
+            lambda _: engine.connect(), range(connections), max_workers=connections
+        )
+    )
+    for conn in opened:
+        conn.close()
 
 
 # Production
@@ -41,9 +168,37 @@ db_store(
         query=dict(),
     ),
     pool_recycle=1800,
+    pool_size=8,
+    max_overflow=4,
+    pool_timeout=60,
+    pool_pre_ping=True,
+    connect_args={"options": "-c statement_timeout=900000"},  # Milliseconds
+    warm_up=4,
     name="prod",
 )
 
+# Production for asyncio applications, see `project.data.afetch_data`
+db_store(
+    create_async_engine,
+    url=builds(
+        URL.create,
+        drivername="postgresql+asyncpg",
+        username="${oc.env:DB_PROD_USERNAME}",
+        password="${oc.env:DB_PROD_PASSWORD}",
+        host="localhost",
+        port="5432",
+        database="mydb",
+        query=dict(),
+    ),
+    pool_recycle=1800,
+    pool_size=8,
+    max_overflow=4,
+    pool_timeout=60,
+    pool_pre_ping=True,
+    connect_args={"server_settings": {"statement_timeout": "900000"}},
+    name="prod_async",
+)
+
 # In-memory sqlite for dev
 db_store(
     create_engine,
@@ -55,3 +210,28 @@ db_store(
     ),
     name="memory",
 )
+
+# File-based sqlite for dev with a pool of connections for concurrent queries. In
+# memory, sqlite is limited to one connection per thread that is not shared.
+db_store(
+    create_engine,
+    url=builds(
+        URL.create,
+        drivername="sqlite",
+        database="dev.sqlite",  # In the output directory of the run
+        query=dict(),
+    ),
+    name="file",
+)
+
+# In-memory sqlite for dev with asyncio
+db_store(
+    create_async_engine,
+    url=builds(
+        URL.create,
+        drivername="sqlite+aiosqlite",
+        database=":memory:",
+        query=dict(),
+    ),
+    name="memory_async",
+)
@@ -46,7 +46,6 @@ hydra_store(
                 "mlflow": {"handlers": [], "level": "WARNING", "propagate": True},
                 "mlflow.types.type_hints": {"level": "ERROR"},
                 "alembic": {"handlers": [], "level": "WARNING", "propagate": True},
-                "joblib_typed_cache": {"level": "DEBUG"},
                 "sqlalchemy.engine": {"handlers": [], "propagate": True},
             },
             "root": {"handlers": ["file", "json"]},
@@ -9,6 +9,7 @@ from sklearn.linear_model import LinearRegression
 from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import OneHotEncoder, StandardScaler
 
+from ...models import TransformerMemory
 from ...version import SERVICE
 from .util import build_columns, build_steps, build_transformers, builds
 
@@ -17,6 +18,7 @@ __all__ = [
 ]
 
 model_store = store(group="model")
+pipeline_memory_store = store(group="pipeline_memory")
 
 
 def make_model(name: str = "prod") -> Pipeline:
@@ -107,3 +109,12 @@ model_store(
     steps=build_steps(regressor=builds(LinearRegression)),
     name="baseline",
 )
+
+# Disk cache of fitted pipeline steps shared by all processes, e.g. trials of a sweep
+pipeline_memory_store(
+    TransformerMemory,
+    location="${oc.env:JOBLIB_CACHE_DIR,'~/.cache'}",
+    max_bytes="${oc.env:PIPELINE_CACHE_MAX_BYTES,null}",  # E.g. "10G"
+    policy="${oc.env:CACHE_POLICY,lru}",
+    name="shared",
+)
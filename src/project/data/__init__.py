@@ -1,10 +1,35 @@
 """Load, process, and validate data."""
 
 __all__ = [
+    "ENV_VAR_SHARED_DATA",
+    "SharedData",
+    "CompactProcessedDataModel",
+    "afetch_data",
+    "attach_shared_data",
+    "cache_validation",
+    "collect_load_metrics",
     "fetch_data",
+    "fetch_data_lazy",
     "load_sql_files",
+    "load_watermark_files",
+    "memory",
     "process_data",
+    "process_data_lazy",
+    "share_data",
 ]
 
-from .load import fetch_data, load_sql_files
-from .process import process_data
+from .load import (
+    ENV_VAR_SHARED_DATA,
+    SharedData,
+    afetch_data,
+    attach_shared_data,
+    collect_load_metrics,
+    fetch_data,
+    fetch_data_lazy,
+    load_sql_files,
+    load_watermark_files,
+    memory,
+    share_data,
+)
+from .process import process_data, process_data_lazy
+from .validate import CompactProcessedDataModel, cache_validation
@@ -1,6 +1,19 @@
 __all__ = [
+    "ENV_VAR_SHARED_DATA",
+    "SharedData",
+    "afetch_data",
+    "attach_shared_data",
+    "collect_load_metrics",
     "fetch_data",
+    "fetch_data_lazy",
     "load_sql_files",
+    "load_watermark_files",
+    "memory",
+    "share_data",
 ]
 
-from .core import fetch_data, load_sql_files
+from .aio import afetch_data
+from .core import fetch_data, load_sql_files, load_watermark_files, memory
+from .lazy import fetch_data_lazy
+from .metrics import collect_load_metrics
+from .shared import ENV_VAR_SHARED_DATA, SharedData, attach_shared_data, share_data
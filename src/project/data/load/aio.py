@@ -0,0 +1,95 @@
+"""Load data from asyncio database engines without blocking the event loop."""
+
+import asyncio
+import logging
+from collections.abc import Callable
+from functools import partial
+from typing import Any, Literal
+
+import pandas as pd
+import pandera.pandas as pa
+from frozendict import frozendict
+from sqlalchemy.ext.asyncio import AsyncEngine
+from structlog.contextvars import bind_contextvars, unbind_contextvars
+
+from ...types import SqlParams
+from ..validate import RawDataModel, split_schema
+from .core import make_reader, read_query
+from .join import join_one_to_one
+from .metrics import instrument, measure
+
+__all__ = [
+    "afetch_data",
+]
+
+logger = logging.getLogger(__name__)
+
+
+async def afetch_data(
+    params: SqlParams,
+    db_engine: AsyncEngine,
+    sql_queries: frozendict[str, str],
+    *,
+    data_model: type[pa.DataFrameModel] = RawDataModel,
+    reader: Literal["pandas", "arrow"] = "pandas",
+) -> pd.DataFrame:
+    """Fetch all data from the database asynchronously, like `fetch_data`.
+
+    The index is fetched first and all other queries are then issued concurrently, each
+    on its own connection from the pool of the engine. The columns of each query are
+    validated in a worker thread as soon as it arrives. The results are joined and
+    validated as with `fetch_data`, but are not cached.
+
+    Args:
+        params: Key-value substitutions for parameterized queries.
+        db_engine: Asyncio database connection engine, e.g. "db=prod_async".
+        sql_queries: Name-query pairs to fetch.
+        data_model: Data model for validation and conversion.
+        reader: Read query results with "pandas" or directly into typed "arrow"
+            buffers.
+
+    Returns:
+        DataFrame with collected data from all sources.
+    """
+    queries = dict(sql_queries)
+    bind_contextvars(**{k: str(v) for k, v in params.items()})
+    instrument(db_engine.sync_engine)
+    by_column, by_frame = split_schema(data_model)
+    read = partial(
+        _aread_query,
+        params=params,
+        db_engine=db_engine,
+        parse=by_column.validate,
+        read_sql=make_reader(reader, data_model),
+        parse_dates=["date"],  # Any possibly appearing date-columns
+    )
+
+    # Fetch index with identifiers first
+    df = await read("index", queries.pop("index"))
+    identifiers = df.columns.to_list()
+
+    # Fetch and left join the feature and target columns on the identifiers
+    dfs = await asyncio.gather(*(read(name, query) for name, query in queries.items()))
+    df = join_one_to_one(df, dfs, on=identifiers)
+    unbind_contextvars("query_name", *list(params))
+
+    logger.info("Validate raw data", extra={"num_samples": len(df)})
+    return await asyncio.to_thread(by_frame.validate, df)
+
+
+async def _aread_query(
+    name: str,
+    query: str,
+    params: SqlParams,
+    db_engine: AsyncEngine,
+    parse: Callable[[pd.DataFrame], pd.DataFrame],
+    **kwargs: Any,
+) -> pd.DataFrame:
+    """Read a query on its own connection, measure it, and parse it in a thread."""
+    with measure(name, cached=False) as metrics:
+        async with db_engine.connect() as conn:
+            df = await conn.run_sync(
+                lambda sync_conn: read_query(name, query, params, sync_conn, **kwargs)
+            )
+        metrics.record(df)
+    return await asyncio.to_thread(parse, df)
@@ -0,0 +1,143 @@
+"""Read SQL results directly into typed Arrow buffers."""
+
+from collections.abc import Mapping, Sequence
+from contextlib import nullcontext
+from typing import Any
+
+import pandas as pd
+import pyarrow as pa
+from pandera.pandas import DataFrameModel
+from sqlalchemy import Connection, Engine, Executable, Result
+
+__all__ = [
+    "declared_dtypes",
+    "read_sql_arrow",
+]
+
+
+def declared_dtypes(data_model: type[DataFrameModel]) -> dict[str, Any]:
+    """Collect the pandas data types of all columns declared in a data model.
+
+    Args:
+        data_model: Data model with declared column data types.
+
+    Returns:
+        Column names with their pandas data types.
+    """
+    dtypes = data_model.to_schema().dtypes
+    return {name: dtype.type for name, dtype in dtypes.items() if dtype is not None}
+
+
+def read_sql_arrow(
+    sql: Executable,
+    con: Engine | Connection,
+    *,
+    dtype: Mapping[str, Any] | None = None,
+    index_col: str | list[str] | None = None,
+    parse_dates: list[str] | None = None,
+    batch_size: int = 10_000,
+) -> pd.DataFrame:
+    """Read an SQL query column-wise into Arrow arrays of the given data types.
+
+    The rows are fetched in batches, with a server-side cursor if the driver supports
+    it. Each batch is converted straight from the driver's values into typed Arrow
+    buffers, such that only the values of one batch are held as Python objects. This
+    also skips the type inference of `pandas.read_sql`. Nullable integer, float, and
+    boolean columns arrive as the given pandas dtypes. Values that do not fit the data
+    type are kept as they are, leaving the error reporting to the data model
+    validation.
+
+    Args:
+        sql: SQL statement to execute.
+        con: Database connection engine or an open connection.
+        dtype: Pandas data types of the expected columns. Missing columns are ignored.
+        index_col: Column(s) to set as index.
+        parse_dates: Columns to parse as dates if not already typed. Missing columns
+            are ignored.
+        batch_size: Number of rows to fetch and convert at once.
+
+    Returns:
+        DataFrame with the query result.
+    """
+    dtypes = dict(dtype or {})
+    empty = pd.DataFrame({name: pd.Series(dtype=dt) for name, dt in dtypes.items()})
+    schema = pa.Schema.from_pandas(empty, preserve_index=False)
+    types = {field.name: field.type for field in schema}
+
+    with con.connect() if isinstance(con, Engine) else nullcontext(con) as conn:
+        result = conn.execute(sql, execution_options={"yield_per": batch_size})
+        names = list(result.keys())
+        chunks = _fetch_batches(result, [types.get(name) for name in names])
+
+    columns = {
+        name: _to_series(chunk, dtypes.get(name), types.get(name))
+        for name, chunk in zip(names, chunks)
+    }
+    df = pd.DataFrame(columns, copy=False)
+    df = _parse_dates(df, parse_dates or [])
+    return df if index_col is None else df.set_index(index_col)
+
+
+def _fetch_batches(
+    result: Result, arrow_types: list[pa.DataType | None]
+) -> list[list[pa.Array]]:
+    """Fetch the rows batch by batch and convert each column of a batch to Arrow."""
+    chunks: list[list[pa.Array]] = [[] for _ in arrow_types]
+    for rows in result.partitions():
+        for chunk, arrow_type, values in zip(chunks, arrow_types, zip(*rows)):
+            chunk.append(_to_arrow(values, arrow_type))
+    return chunks
+
+
+def _to_series(
+    chunks: Sequence[pa.Array], dtype: Any, arrow_type: pa.DataType | None
+) -> pd.Series:
+    """Convert the batches of a column to a Series, typed directly if possible."""
+    array = _combine(chunks, arrow_type)
+    if array.type == arrow_type and hasattr(dtype, "__from_arrow__"):
+        return pd.Series(dtype.__from_arrow__(array), copy=False)
+    return array.to_pandas()
+
+
+def _combine(
+    chunks: Sequence[pa.Array], arrow_type: pa.DataType | None
+) -> pa.ChunkedArray:
+    """Combine the batches of a column, casting them to a common type if they vary."""
+    if not chunks:  # No rows
+        chunks = [_to_arrow((), arrow_type)]
+    types = list(dict.fromkeys(chunk.type for chunk in chunks))
+    if len(types) > 1:  # Not all batches fit the data type
+        common = _common_type(types)
+        chunks = [chunk.cast(common) for chunk in chunks]
+    return pa.chunked_array(chunks)
+
+
+def _common_type(types: list[pa.DataType]) -> pa.DataType:
+    """Promote the types of batches to a common type, or to strings if incompatible."""
+    schemas = [pa.schema([("column", t)]) for t in types]
+    try:
+        return pa.unify_schemas(schemas, promote_options="permissive").field(0).type
+    except pa.ArrowException:
+        return pa.string()
+
+
+def _to_arrow(values: Sequence[Any], arrow_type: pa.DataType | None) -> pa.Array:
+    """Convert values to the Arrow type by construction, or by casting if needed."""
+    if arrow_type is None:
+        return pa.array(values, from_pandas=True)
+    try:
+        return pa.array(values, type=arrow_type, from_pandas=True)
+    except pa.ArrowException:
+        array = pa.array(values, from_pandas=True)
+    try:
+        return array.cast(arrow_type)  # E.g. integer to boolean or float to integer
+    except pa.ArrowException:
+        return array
+
+
+def _parse_dates(df: pd.DataFrame, columns: list[str]) -> pd.DataFrame:
+    """Parse columns that are not yet of datetime type as dates, if present."""
+    for col in columns:
+        if col in df and not pd.api.types.is_datetime64_any_dtype(df[col]):
+            df[col] = pd.to_datetime(df[col])
+    return df
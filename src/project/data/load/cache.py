@@ -0,0 +1,345 @@
+"""Disk cache for DataFrames in columnar files with a manifest of all entries."""
+
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+from collections.abc import Callable, Mapping, Sequence
+from contextlib import suppress
+from dataclasses import dataclass, field
+from datetime import UTC, date, datetime
+from functools import partial, wraps
+from pathlib import Path
+from typing import Any, ClassVar, Literal, Protocol, cast
+
+import joblib
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
+from joblib.func_inspect import filter_args
+
+from ...util import parse_bytes, select_evicted
+
+__all__ = [
+    "ArrowBackend",
+    "Backend",
+    "CacheStats",
+    "CachedFunc",
+    "FrameMemory",
+    "ParquetBackend",
+]
+
+METADATA_FILE = "metadata.json"
+logger = logging.getLogger(__name__)
+
+
+class Backend(Protocol):
+    """File format of the cached DataFrames."""
+
+    suffix: ClassVar[str]
+
+    def write(self, table: pa.Table, path: Path) -> None:
+        """Write an Arrow table to a file."""
+        ...
+
+    def read(self, path: Path) -> pa.Table:
+        """Read an Arrow table from a file."""
+        ...
+
+
+@dataclass(frozen=True)
+class ParquetBackend:
+    """Store DataFrames as compressed Parquet files."""
+
+    suffix: ClassVar[str] = ".parquet"
+    compression: str = "zstd"
+
+    def write(self, table: pa.Table, path: Path) -> None:
+        """Write an Arrow table to a Parquet file."""
+        pq.write_table(table, path, compression=self.compression)
+
+    def read(self, path: Path) -> pa.Table:
+        """Read an Arrow table from a memory-mapped Parquet file."""
+        return pq.read_table(path, memory_map=True)
+
+
+@dataclass(frozen=True)
+class ArrowBackend:
+    """Store DataFrames as Arrow IPC files. Uncompressed files are read zero-copy."""
+
+    suffix: ClassVar[str] = ".arrow"
+    compression: str | None = "zstd"
+
+    def write(self, table: pa.Table, path: Path) -> None:
+        """Write an Arrow table to an Arrow IPC file."""
+        feather.write_feather(
+            table, path, compression=self.compression or "uncompressed"
+        )
+
+    def read(self, path: Path) -> pa.Table:
+        """Read an Arrow table from a memory-mapped Arrow IPC file."""
+        return feather.read_table(path, memory_map=True)
+
+
+@dataclass
+class CacheStats:
+    """Statistics of the cache usage since the start of the process."""
+
+    hits: int = 0
+    misses: int = 0
+    bytes_read: int = 0  # Size of the files read from the cache
+    bytes_saved: int = 0  # In-memory size of the DataFrames served from the cache
+    bytes_written: int = 0
+    evictions: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of calls served from the cache."""
+        calls = self.hits + self.misses
+        return self.hits / calls if calls else 0.0
+
+    def add(self, **counts: int) -> None:
+        """Increment the counters thread-safely."""
+        with self._lock:
+            for name, count in counts.items():
+                setattr(self, name, getattr(self, name) + count)
+
+
+class CachedFunc[**P](Protocol):
+    """Function with its DataFrame results cached by `FrameMemory`."""
+
+    def __call__(self, *args: P.args, **kwargs: P.kwargs) -> pd.DataFrame: ...
+    def uncached(self, *args: P.args, **kwargs: P.kwargs) -> pd.DataFrame: ...
+    def call_with_hit(
+        self, *args: P.args, **kwargs: P.kwargs
+    ) -> tuple[pd.DataFrame, bool]: ...
+    def clear(self) -> None: ...
+
+
+class FrameMemory:
+    """Cache the DataFrame results of functions on disk in a columnar file format.
+
+    The interface mirrors `joblib.Memory`, but instead of pickles, every result is
+    stored in the file format of the backend next to a metadata file. The metadata of
+    all entries make up the manifest of the cache.
+
+    With a byte budget, the least recently (LRU) or least frequently (LFU) used entries
+    are evicted whenever a new entry exceeds the budget.
+
+    Args:
+        location: Directory of the cache. It is created on demand.
+        backend: File format of the cached DataFrames.
+        max_bytes: Budget for the total size of all files or None for no limit.
+        policy: Eviction policy, either "lru" or "lfu".
+    """
+
+    def __init__(
+        self,
+        location: str | Path,
+        backend: Backend | None = None,
+        *,
+        max_bytes: int | None = None,
+        policy: Literal["lru", "lfu"] = "lru",
+    ) -> None:
+        self.location = Path(location).expanduser() / "project"
+        self.backend = backend or ParquetBackend()
+        self.max_bytes = max_bytes
+        self.policy = policy
+        self.stats = CacheStats()
+
+    def cache[**P](
+        self,
+        func: Callable[P, pd.DataFrame] | None = None,
+        *,
+        ignore: Sequence[str] = (),
+        cache_validation_callback: Callable[[dict[str, Any]], bool] | None = None,
+        watermark: Callable[P, Any] | None = None,
+    ) -> Any:
+        """Decorate a function returning a DataFrame to cache its results.
+
+        Args:
+            func: Function to cache.
+            ignore: Names of arguments that do not affect the result.
+            cache_validation_callback: Decides by the metadata of a cached entry if it
+                is still valid, e.g. `joblib.expires_after`.
+            watermark: Cheap probe called with the same arguments as the function that
+                returns a token of the current state of the source, e.g. the latest
+                update time. Results are cached per token, such that they are reused
+                until the token changes.
+
+        Returns:
+            Cached function with the attributes `uncached`, `call_with_hit`, which also
+            returns whether the result was read from the cache, and `clear`, or a
+            decorator if no function is given.
+        """
+        if func is None:
+            return partial(
+                self.cache,
+                ignore=ignore,
+                cache_validation_callback=cache_validation_callback,
+                watermark=watermark,
+            )
+
+        func_name = getattr(func, "__qualname__", str(func))
+        directory = self.location / f"{func.__module__}.{func_name}"
+        is_valid = cache_validation_callback or (lambda _: True)
+        probe = watermark or (lambda *_, **__: None)
+
+        def call_with_hit(
+            *args: P.args, **kwargs: P.kwargs
+        ) -> tuple[pd.DataFrame, bool]:
+            """Return the result and whether it was read from the cache."""
+            arguments = filter_args(func, list(ignore), args, kwargs)
+            token = probe(*args, **kwargs)
+            key = arguments if token is None else (arguments, token)
+            entry = directory / joblib.hash(key)
+            metadata = _read_metadata(entry)
+            if metadata is not None and is_valid(metadata):
+                logger.debug("Read %s from cache", func_name)
+                with suppress(FileNotFoundError):  # Unless evicted concurrently
+                    return self._read(entry, metadata), True
+
+            self.stats.add(misses=1)
+            df = func(*args, **kwargs)
+            self._write(entry, df, arguments, token)
+            return df, False
+
+        @wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> pd.DataFrame:
+            """Return the cached result or call the function and cache its result."""
+            return call_with_hit(*args, **kwargs)[0]
+
+        setattr(wrapper, "uncached", func)
+        setattr(wrapper, "call_with_hit", call_with_hit)
+        setattr(wrapper, "clear", partial(shutil.rmtree, directory, ignore_errors=True))
+        return cast(CachedFunc[P], wrapper)
+
+    def manifest(self) -> pd.DataFrame:
+        """List the metadata of all cached entries.
+
+        Returns:
+            DataFrame with one row per entry including function, arguments, row count,
+            size in bytes, creation time, and path, sorted by creation time.
+        """
+        paths = self.location.glob(f"*/*/{METADATA_FILE}")
+        records = [_read_metadata(path.parent) for path in paths]
+        records = sorted(filter(None, records), key=lambda r: r["time"])
+        return pd.DataFrame.from_records(records)
+
+    def prune(
+        self,
+        max_bytes: int | str | None = None,
+        policy: Literal["lru", "lfu"] | None = None,
+    ) -> pd.DataFrame:
+        """Evict entries until the total size of the cache is within the budget.
+
+        Args:
+            max_bytes: Budget in bytes, optionally with a unit, e.g. "10G". Defaults to
+                the budget of the cache, or zero to clear the cache if neither is set.
+            policy: Eviction policy. Defaults to the policy of the cache.
+
+        Returns:
+            Manifest of the evicted entries.
+        """
+        budget = parse_bytes(
+            max_bytes if max_bytes is not None else self.max_bytes or 0
+        )
+        manifest = self.manifest()
+        if manifest.empty:
+            return manifest
+
+        evicted = select_evicted(manifest, budget, policy or self.policy)
+        for path in evicted["path"]:
+            shutil.rmtree(path, ignore_errors=True)
+        self.stats.add(evictions=len(evicted))
+        logger.debug("Evicted %d entries from cache", len(evicted))
+        return evicted.iloc[::-1].reset_index(drop=True)
+
+    def _read(self, entry: Path, metadata: dict[str, Any]) -> pd.DataFrame:
+        """Read a cached DataFrame and record the access."""
+        table = self.backend.read(entry / f"data{self.backend.suffix}")
+        df = table.to_pandas(split_blocks=True)
+        self.stats.add(
+            hits=1,
+            bytes_read=metadata["bytes"],
+            bytes_saved=int(df.memory_usage(deep=True).sum()),
+        )
+        metadata |= {"accessed": time.time(), "hits": metadata.get("hits", 0) + 1}
+        with suppress(FileNotFoundError):  # Evicted concurrently
+            _write_metadata(entry, metadata)
+        return df
+
+    def _write(
+        self, entry: Path, df: pd.DataFrame, arguments: dict[str, Any], token: Any
+    ) -> None:
+        """Write a DataFrame and its metadata to the cache."""
+        entry.mkdir(parents=True, exist_ok=True)
+        path = entry / f"data{self.backend.suffix}"
+        table = pa.Table.from_pandas(df)
+        _write_atomically(path, partial(self.backend.write, table))
+
+        now = time.time()
+        metadata = {
+            "function": entry.parent.name,
+            "arguments": _summarize(arguments),
+            "watermark": _summarize(token),
+            "rows": len(df),
+            "columns": len(df.columns),
+            "bytes": path.stat().st_size,
+            "created": datetime.fromtimestamp(now, UTC).isoformat(),
+            "time": now,  # Required by `joblib.expires_after`
+            "accessed": now,
+            "hits": 0,
+            "path": str(entry),
+        }
+        _write_metadata(entry, metadata)
+        self.stats.add(bytes_written=metadata["bytes"])
+        if self.max_bytes is not None:
+            self.prune()
+
+
+def _write_atomically(path: Path, write: Callable[[Path], Any]) -> None:
+    """Write to a temporary file first to never expose incomplete files."""
+    tmp = path.with_name(f".{os.getpid()}-{threading.get_ident()}-{path.name}")
+    write(tmp)
+    os.replace(tmp, path)
+
+
+def _write_metadata(entry: Path, metadata: dict[str, Any]) -> None:
+    """Write the metadata of an entry."""
+    text = json.dumps(metadata, indent=2)
+    _write_atomically(
+        entry / METADATA_FILE, partial(Path.write_text, data=text, encoding="utf-8")
+    )
+
+
+def _read_metadata(entry: Path) -> dict[str, Any] | None:
+    """Read the metadata of an entry or None if it does not exist."""
+    try:
+        return json.loads((entry / METADATA_FILE).read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+
+
+def _summarize(value: Any) -> Any:
+    """Summarize arguments in JSON format."""
+    if isinstance(value, Mapping):
+        return {str(k): _summarize(v) for k, v in value.items()}
+    if isinstance(value, tuple | list):
+        return [_summarize(v) for v in value]
+    if isinstance(value, str | int | float | None) and len(str(value)) <= 64:
+        return value
+    return _describe(value)
+
+
+def _describe(value: Any) -> str:
+    """Describe dates and types by name and other objects, e.g. queries, by hash."""
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, type):
+        return f"{value.__module__}.{value.__qualname__}"
+    return str(joblib.hash(value))
@@ -3,47 +3,86 @@
 import glob
 import logging
 import os
+from collections.abc import Callable, Mapping, Sequence
+from functools import partial
+from itertools import batched
 from pathlib import Path
+from typing import Any, Literal
 
 import pandas as pd
 import pandera.pandas as pa
 from frozendict import frozendict
 from joblib import expires_after
-from joblib_typed_cache import Memory
-from sqlalchemy import Engine, TextClause, bindparam, text
+from pandas.errors import MergeError
+from sqlalchemy import Connection, Engine, TextClause
 from structlog.contextvars import bind_contextvars, unbind_contextvars
 from tqdm.auto import tqdm
 
 from ...types import SqlParam, SqlParams
-from ..validate import RawDataModel
+from ...util import map_threaded, parse_bytes
+from ..validate import RawDataModel, split_schema
+from .arrow import declared_dtypes, read_sql_arrow
+from .cache import FrameMemory, ParquetBackend
+from .join import join_one_to_one
+from .metrics import instrument, mark_fetch, measure, measure_cached
+from .partition import split_periods, split_shards
+from .pushdown import compose_join, compose_schema
+from .statement import SqlStatement
+from .stream import filter_rows, read_sql_chunked
 
 PATH_SQL_PATTERN = str(Path(__file__).parent / "sql" / "*.sql")
+PATH_WATERMARK_PATTERN = str(Path(__file__).parent / "sql" / "watermark" / "*.sql")
 ENV_VAR_CACHE_DIR = "JOBLIB_CACHE_DIR"
-DEFAULT_CACHE_DIR = "~" + os.sep + ".cache"  # Joblib resolves the path automatically
+DEFAULT_CACHE_DIR = "~" + os.sep + ".cache"  # Resolved by the cache automatically
+ENV_VAR_CACHE_MAX_BYTES = "CACHE_MAX_BYTES"  # E.g. "20G". Unlimited if not set
+ENV_VAR_CACHE_POLICY = "CACHE_POLICY"  # Either "lru" (default) or "lfu"
 PATH_CACHE_DIR = os.environ.get(ENV_VAR_CACHE_DIR) or DEFAULT_CACHE_DIR
-memory = Memory(location=PATH_CACHE_DIR, verbose=0)
+CACHE_MAX_BYTES = os.environ.get(ENV_VAR_CACHE_MAX_BYTES)
+memory = FrameMemory(
+    location=PATH_CACHE_DIR,
+    backend=ParquetBackend("zstd"),
+    max_bytes=parse_bytes(CACHE_MAX_BYTES) if CACHE_MAX_BYTES else None,
+    policy="lfu" if os.environ.get(ENV_VAR_CACHE_POLICY) == "lfu" else "lru",
+)
 cache = memory.cache(cache_validation_callback=expires_after(hours=6))
+cache_period = memory.cache  # Periods of the past or with watermarks do not expire
 logger = logging.getLogger(__name__)
 
 
-def load_sql_files(pattern: str = PATH_SQL_PATTERN) -> frozendict[str, str]:
+def load_sql_files(pattern: str = PATH_SQL_PATTERN) -> frozendict[str, SqlStatement]:
     """Load sql files into name-content pairs.
 
     Args:
         pattern: Glob pattern for the sql files.
 
     Returns:
-        Dictionary with file names as keys and file content as values.
+        Dictionary with file names as keys and the parsed file content as values.
     """
     paths = map(Path, sorted(glob.glob(pattern, recursive=True)))
-    queries = frozendict({p.stem: p.read_text(encoding="utf-8") for p in paths})
-    return queries
+    return frozendict(
+        {p.stem: SqlStatement(p.read_text(encoding="utf-8")) for p in paths}
+    )
+
+
+def load_watermark_files(
+    pattern: str = PATH_WATERMARK_PATTERN,
+) -> frozendict[str, SqlStatement]:
+    """Load the watermark queries that probe the freshness of the equally named queries.
+
+    Args:
+        pattern: Glob pattern for the sql files.
+
+    Returns:
+        Dictionary with file names as keys and file content as values.
+    """
+    return load_sql_files(pattern)
 
 
 def bind_sql_params(query: str, **params: SqlParam) -> TextClause:
     """Prepare bound SQL parameters for multi-value substitutions.
 
     This is necessary to parameterize SQL statements like "WHERE col IN (1, 2, 3)".
+    Queries from `load_sql_files` are already parsed. Others are parsed once and cached.
 
     Args:
         query: SQL query with parameters as ':param'.
@@ -52,33 +91,305 @@ def bind_sql_params(query: str, **params: SqlParam) -> TextClause:
     Returns:
         SQL statement with selectively bound and expanded parameters.
     """
-    stmt = text(query)
-    used = stmt._bindparams.keys()
-    bound_params = (
-        bindparam(param, value, expanding=isinstance(value, tuple))
-        for param, value in params.items()
-        if param in used
-    )
-    return stmt.bindparams(*bound_params)
+    stmt = query if isinstance(query, SqlStatement) else SqlStatement(query)
+    return stmt.bind(params)
+
+
+def read_query(
+    name: str,
+    query: str,
+    params: SqlParams,
+    db_engine: Engine | Connection,
+    *,
+    read_sql: Callable[..., pd.DataFrame] | None = None,
+    keep: pd.MultiIndex | None = None,
+    **kwargs: Any,
+) -> pd.DataFrame:
+    """Read a single parameterized SQL query into a DataFrame.
+
+    The query name is bound to the logging context for the duration of the call.
+
+    Args:
+        name: Name of the query for logging.
+        query: SQL query with parameters as ':param'.
+        params: Key-value substitutions for parameterized query.
+        db_engine: Database connection engine or an open connection.
+        read_sql: Reader with the signature of `pandas.read_sql` (default).
+        keep: Identifiers of the rows to keep. Only passed on to the reader if given.
+        kwargs: Keyword arguments passed on to the reader.
+
+    Returns:
+        DataFrame with the query result.
+    """
+    bind_contextvars(query_name=name)
+    logger.debug(f"Fetch {name}")
+    mark_fetch()
+    read_sql = read_sql or pd.read_sql
+    if keep is not None:
+        kwargs["keep"] = keep
+    return read_sql(bind_sql_params(query, **params), db_engine, **kwargs)
+
+
+def read_watermark(query: str, params: SqlParams, db_engine: Engine) -> tuple[Any, ...]:
+    """Read the first row of a watermark query, e.g. the latest update or row count.
+
+    Args:
+        query: SQL query with parameters as ':param'.
+        params: Key-value substitutions for parameterized query.
+        db_engine: Database connection engine.
+
+    Returns:
+        Values of the first row or an empty tuple for no rows.
+    """
+    with db_engine.connect() as conn:
+        row = conn.execute(bind_sql_params(query, **params)).first()
+    return () if row is None else tuple(row)
+
+
+def read_columns(query: str, params: SqlParams, db_engine: Engine) -> list[str]:
+    """Read the column names of a query without fetching any rows.
+
+    Args:
+        query: SQL query with parameters as ':param'.
+        params: Key-value substitutions for parameterized query.
+        db_engine: Database connection engine.
+
+    Returns:
+        Column names of the query result.
+    """
+    with db_engine.connect() as conn:
+        result = conn.execute(bind_sql_params(compose_schema(query), **params))
+        return list(result.keys())
+
+
+def _probe_period(
+    name: str,
+    query: str,
+    params: SqlParams,
+    db_engine: Engine,
+    *,
+    watermark: str | None = None,
+    **kwargs: Any,
+) -> tuple[Any, ...] | None:
+    """Probe the watermark of a query for a period if it has one."""
+    return None if watermark is None else read_watermark(watermark, params, db_engine)
+
+
+@cache_period(ignore=["name", "db_engine", "read_sql"], watermark=_probe_period)
+def read_period(
+    name: str,
+    query: str,
+    params: SqlParams,
+    db_engine: Engine,
+    *,
+    watermark: str | None = None,
+    read_sql: Callable[..., pd.DataFrame] | None = None,
+    **kwargs: Any,
+) -> pd.DataFrame:
+    """Cached version of `read_query` for completed periods that no longer change.
+
+    With a watermark query, the cached result is reused until the watermark moves.
+    """
+    return read_query(name, query, params, db_engine, read_sql=read_sql, **kwargs)
+
+
+def read_queries(
+    queries: Mapping[str, str],
+    params: SqlParams,
+    db_engine: Engine,
+    *,
+    partition: str | None = None,
+    shard_size: int | None = None,
+    watermarks: Mapping[str, str] | None = None,
+    max_workers: int = 1,
+    keep: pd.MultiIndex | None = None,
+    parse: Callable[[pd.DataFrame], pd.DataFrame] | None = None,
+    **kwargs: Any,
+) -> list[pd.DataFrame]:
+    """Read several queries concurrently, optionally split into cached periods.
+
+    If partitioned, the date range of each query is split into periods, that are
+    fetched individually. All periods but the latest one are cached indefinitely, such
+    that shifted or overlapping date ranges only fetch the missing periods.
+
+    The loading of every query, period, and shard is measured and logged, see
+    `collect_load_metrics`.
+
+    Queries with a watermark query are cached in all periods. Before reading a period
+    from the cache, its watermark is probed and only periods with a moved watermark
+    are fetched again.
+
+    Periods and tuple parameters split into shards of `shard_size` are fetched in
+    parallel and concatenated in order. Each complete query is parsed, e.g. validated,
+    while the following queries are still being fetched.
+
+    Args:
+        queries: Name-query pairs to fetch.
+        params: Key-value substitutions for parameterized queries.
+        db_engine: Database connection engine.
+        partition: Period frequency alias of pandas, e.g. "M" for months, or None.
+        shard_size: Maximum number of values of tuple parameters per query or None.
+        watermarks: Watermark queries by the names of the queries they probe.
+        max_workers: Maximum number of queries or periods to run concurrently.
+        keep: Identifiers of the rows to keep, e.g. for streaming readers to filter
+            each chunk. Cached results are filtered after reading.
+        parse: Function applied to the result of each query, e.g. validation.
+        kwargs: Keyword arguments passed on to `read_query`.
+
+    Returns:
+        DataFrames of the queries in the same order.
+    """
+    periods = split_periods(params, partition)
+    latest = len(periods) - 1
+    shards = [
+        (shard, partition is not None and i < latest)
+        for i, period in enumerate(periods)
+        for shard in split_shards(period, shard_size)
+    ]
+    watermarks = watermarks or {}
+    instrument(db_engine)
+    tasks = [
+        (name, query, shard, cached, watermarks.get(name))
+        for name, query in queries.items()
+        for shard, cached in shards
+    ]
+    read = partial(_read_task, db_engine=db_engine, keep=keep, **kwargs)
+    results = map_threaded(read, *zip(*tasks), max_workers=max_workers)
+    frames = tqdm(results, total=len(tasks), desc="Load queries")
+    parse = parse or (lambda df: df)
+    return [parse(_concat(query)) for query in batched(frames, len(shards))]
+
+
+def _read_task(
+    name: str,
+    query: str,
+    params: SqlParams,
+    cached: bool,
+    watermark: str | None,
+    keep: pd.MultiIndex | None,
+    **kwargs: Any,
+) -> pd.DataFrame:
+    """Read a query from the cache or directly and measure it."""
+    cached = cached or watermark is not None
+    with measure(name, cached) as metrics:
+        if cached:
+            df = read_period(name, query, params, watermark=watermark, **kwargs)
+            df = filter_rows(df, keep)
+        else:
+            df = read_query(name, query, params, keep=keep, **kwargs)
+        metrics.record(df)
+    return df
+
+
+def _concat(frames: Sequence[pd.DataFrame]) -> pd.DataFrame:
+    """Concatenate the periods and shards of a query in order."""
+    frames = [df for df in frames if len(df)] or frames[:1]  # Untyped if empty
+    return frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+
 
+def make_reader(
+    reader: Literal["pandas", "arrow"],
+    data_model: type[pa.DataFrameModel],
+    chunksize: int | None = None,
+) -> Callable[..., pd.DataFrame]:
+    """Select the SQL reader.
 
-@cache(ignore=["db_engine"])
+    Args:
+        reader: Either "pandas" to read with `pandas.read_sql` or "arrow" to read into
+            Arrow buffers typed as declared in the data model.
+        data_model: Data model with the declared column data types.
+        chunksize: Number of rows to stream per chunk or None to read all at once.
+            Chunks are read with pandas and typed as declared in the data model.
+
+    Returns:
+        Reader with the signature of `pandas.read_sql`.
+    """
+    if chunksize is not None:
+        dtype = declared_dtypes(data_model)
+        return partial(read_sql_chunked, chunksize=chunksize, dtype=dtype)
+    if reader == "arrow":
+        return partial(read_sql_arrow, dtype=declared_dtypes(data_model))
+    return pd.read_sql
+
+
+def _probe_data(
+    params: SqlParams,
+    db_engine: Engine,
+    sql_queries: frozendict[str, str],
+    *,
+    watermarks: frozendict[str, str] | None = None,
+    max_workers: int = 1,
+    **kwargs: Any,
+) -> tuple[tuple[Any, ...], ...] | None:
+    """Probe the watermarks of all queries over the whole date range if any."""
+    probes = [
+        query for name, query in (watermarks or {}).items() if name in sql_queries
+    ]
+    if not probes:
+        return None
+    read = partial(read_watermark, params=params, db_engine=db_engine)
+    return tuple(map_threaded(read, probes, max_workers=max_workers))
+
+
+@measure_cached("fetch_data")
+@cache(
+    ignore=[
+        "db_engine",
+        "max_workers",
+        "reader",
+        "shard_size",
+        "chunksize",
+    ],
+    watermark=_probe_data,
+)
 def fetch_data(
     params: SqlParams,
     db_engine: Engine,
     sql_queries: frozendict[str, str],
     *,
     data_model: type[pa.DataFrameModel] = RawDataModel,
+    max_workers: int = 1,
+    reader: Literal["pandas", "arrow"] = "pandas",
+    partition: str | None = None,
+    shard_size: int | None = None,
+    watermarks: frozendict[str, str] | None = None,
+    pushdown: bool = False,
+    chunksize: int | None = None,
 ) -> pd.DataFrame:
     """Fetch all data from the database based on index-bound SQL queries.
 
     The `sql_queries` must contain the key "index" that queries the identifying columns.
+    All other queries are fetched concurrently with up to `max_workers` connections
+    from the connection pool of the engine. With `partition`, the queries are fetched
+    per period and completed periods are cached individually, see `read_queries`.
+    Periods and identifier shards of `shard_size` are fetched in parallel as well.
+    Queries with `watermarks` are only fetched again once their watermark moves.
+    With `pushdown`, all queries are instead composed into a single statement, that
+    joins them in the database and only transfers the rows of the index.
+    With `chunksize`, the queries are streamed in chunks, that are reduced to the
+    identifiers of the index and typed before the next chunk is read.
 
     Args:
         params: Key-value substitutions for parameterized queries.
         db_engine: Database connection engine.
         sql_queries: Name-query pairs to fetch.
         data_model: Data model for validation and conversion.
+        max_workers: Maximum number of queries to run concurrently.
+        reader: Read query results with "pandas" or directly into typed "arrow"
+            buffers.
+        partition: Period frequency alias of pandas, e.g. "M" for months, to split the
+            range from "start_date" to "end_date" into separately cached periods. Only
+            for queries whose rows do not depend on the range, e.g. not on the number
+            of days since "start_date".
+        shard_size: Maximum number of values of tuple parameters, e.g. identifiers,
+            per query to split them into shards. With periods or shards, the rows are
+            sorted by the identifiers, like in the index query.
+        watermarks: Name-query pairs of cheap queries, e.g. "max(updated_at)", that
+            probe the freshness of the equally named queries.
+        pushdown: Join the queries in the database instead of in memory. The rows are
+            then ordered by the identifiers.
+        chunksize: Number of rows to stream per chunk from a server-side cursor to
+            bound the memory, or None to read each query at once.
 
     Returns:
         DataFrame with collected data from all sources.
@@ -93,29 +404,70 @@ def fetch_data(
     # Format parameters for logging
     bind_contextvars(**{k: str(v) for k, v in params.items()})
 
-    # Fetch index with identifiers first
-    bind_contextvars(query_name="index")
-    logger.debug("Fetch index")
-    stmt = bind_sql_params(queries.pop("index"), **params)
-    index = pd.read_sql(stmt, db_engine, parse_dates=date_col)
-    identifiers = index.columns.to_list()
-    index = index.set_index(identifiers)
+    read = partial(
+        read_queries,
+        params=params,
+        db_engine=db_engine,
+        partition=partition,
+        shard_size=shard_size,
+        watermarks=watermarks,
+        max_workers=max_workers,
+        read_sql=make_reader(reader, data_model, chunksize),
+        parse_dates=date_col,
+    )
 
-    # Fetch and left join the feature and target columns on the identifiers
-    dfs: list[pd.DataFrame] = []
-    for name, query in tqdm(queries.items(), desc="Load queries"):
-        bind_contextvars(query_name=name)
-        logger.debug(f"Fetch {name}")
-        dfs.append(
-            pd.read_sql(
-                bind_sql_params(query, **params),
-                db_engine,
-                index_col=identifiers,
-                parse_dates=date_col,
-            )
-        )
+    # Coerce the columns of each query as soon as it is fetched, check after the join
+    by_column, by_frame = split_schema(data_model)
+    index = queries.pop("index")
+    split = partition is not None or shard_size is not None  # Concatenated by split
+    if pushdown:
+        identifiers = read_columns(index, params, db_engine)
+        columns = {k: read_columns(q, params, db_engine) for k, q in queries.items()}
+        (df,) = read({"joined": compose_join(index, queries, identifiers, columns)})
+        _validate_one_to_one(df, identifiers)
+        df = _sort_split(by_column.validate(df), identifiers, split)
+    else:
+        streamed = chunksize is not None
+        df = _join_in_memory(read, index, queries, streamed, split, by_column.validate)
     unbind_contextvars("query_name", *list(params))
-    df = index.join(dfs, validate="1:1").reset_index()
 
     logger.info("Validate raw data", extra={"num_samples": len(df)})
-    return data_model.validate(df)
+    return by_frame.validate(df)
+
+
+def _join_in_memory(
+    read: Callable[..., list[pd.DataFrame]],
+    index: str,
+    queries: dict[str, str],
+    streamed: bool,
+    split: bool,
+    parse: Callable[[pd.DataFrame], pd.DataFrame],
+) -> pd.DataFrame:
+    """Fetch the index and left join all other parsed queries onto it."""
+    # Fetch index with identifiers first
+    (df,) = read({"index": index})
+    keep = pd.MultiIndex.from_frame(df) if streamed else None  # Raw data types
+    df = parse(df)
+    identifiers = df.columns.to_list()
+    df = _sort_split(df, identifiers, split)
+
+    # Fetch and left join the feature and target columns on the identifiers
+    dfs = read(queries, keep=keep, parse=parse)
+    return join_one_to_one(df, dfs, on=identifiers)
+
+
+def _sort_split(df: pd.DataFrame, identifiers: list[str], split: bool) -> pd.DataFrame:
+    """Restore the order of the identifiers after concatenating the splits of a query.
+
+    The result is then independent of the splits, that are not part of the cache key.
+    """
+    if not split:
+        return df
+    return df.sort_values(identifiers, kind="stable", ignore_index=True)
+
+
+def _validate_one_to_one(df: pd.DataFrame, identifiers: list[str]) -> None:
+    """Raise like `pandas.DataFrame.join` if the join was not one-to-one."""
+    if df.duplicated(identifiers).any():
+        msg = "Merge keys are not unique; not a one-to-one merge"
+        raise MergeError(msg)
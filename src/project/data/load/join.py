@@ -0,0 +1,93 @@
+"""Left join query results on their identifier columns without building indexes."""
+
+from collections.abc import Sequence
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from pandas.errors import MergeError
+
+__all__ = [
+    "encode_keys",
+    "join_one_to_one",
+]
+
+
+def join_one_to_one(
+    left: pd.DataFrame, rights: Sequence[pd.DataFrame], on: list[str]
+) -> pd.DataFrame:
+    """Left join several DataFrames one-to-one on their identifier columns.
+
+    Like `left.set_index(on).join(rights, validate="1:1").reset_index()`, but instead
+    of a MultiIndex per DataFrame, the identifiers are encoded as dense integer keys.
+    These are checked for uniqueness in a single pass and map each row of the left
+    DataFrame to its position in the right ones. The columns are then taken straight
+    into the output DataFrame. Columns without missing rows keep their data type.
+
+    Args:
+        left: DataFrame with the identifier columns that determine the rows.
+        rights: DataFrames with the identifier columns and the columns to join.
+        on: Identifier columns.
+
+    Returns:
+        Joined DataFrame with the columns of all DataFrames in order.
+
+    Raises:
+        MergeError: If the identifiers of any DataFrame are not unique.
+        ValueError: If the DataFrames share columns other than the identifiers.
+
+    Examples:
+        >>> left = pd.DataFrame({"id": [1, 2, 3]})
+        >>> right = pd.DataFrame({"id": [3, 1], "x": [30, 10]})
+        >>> join_one_to_one(left, [right], on=["id"])
+           id     x
+        0   1  10.0
+        1   2   NaN
+        2   3  30.0
+    """
+    left_keys, *right_keys = encode_keys(left, *rights, on=on)
+    num_keys = len(left_keys) + sum(map(len, right_keys))
+    _raise_if_duplicated(left_keys, "left")
+
+    columns: dict[str, Any] = {col: left[col] for col in left.columns}
+    for right, keys in zip(rights, right_keys):
+        _raise_if_duplicated(keys, "right")
+        positions = np.full(num_keys, -1, dtype=np.intp)
+        positions[keys] = np.arange(len(right))
+        indexer = positions[left_keys]  # Position in the right rows or -1 if missing
+        for col in right.columns.difference(on, sort=False):
+            if col in columns:
+                msg = f"columns overlap but no suffix specified: [{col!r}]"
+                raise ValueError(msg)
+            columns[col] = right[col].array.take(indexer, allow_fill=True)
+    return pd.DataFrame(columns, index=left.index, copy=False)
+
+
+def encode_keys(*frames: pd.DataFrame, on: list[str]) -> list[np.ndarray]:
+    """Encode the identifiers of DataFrames as dense integer keys.
+
+    Equal identifiers, including missing values, map to equal keys across all
+    DataFrames. The keys are smaller than the total number of rows.
+
+    Args:
+        frames: DataFrames with the identifier columns.
+        on: Identifier columns.
+
+    Returns:
+        Keys of the rows for each DataFrame.
+    """
+    sizes = np.cumsum([len(df) for df in frames])[:-1]
+    keys = np.zeros(sum(len(df) for df in frames), dtype=np.int64)
+    for col in on:
+        values = pd.concat([df[col] for df in frames], ignore_index=True)
+        codes, uniques = pd.factorize(values, use_na_sentinel=False)
+        # Compress the combined keys to avoid an overflow with further columns
+        keys, _ = pd.factorize(keys * len(uniques) + codes)
+    return np.split(keys, sizes)
+
+
+def _raise_if_duplicated(keys: np.ndarray, side: str) -> None:
+    """Raise like `pandas.DataFrame.join` if the keys are not unique."""
+    if (np.bincount(keys) > 1).any():
+        msg = f"Merge keys are not unique in {side} dataset; not a one-to-one merge"
+        raise MergeError(msg)
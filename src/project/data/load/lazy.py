@@ -0,0 +1,106 @@
+"""Load data into Polars LazyFrames."""
+
+import logging
+from contextlib import nullcontext
+from functools import partial
+
+import pandera.polars as pa
+import polars as pl
+from frozendict import frozendict
+from sqlalchemy import Connection, Engine, TextClause
+from structlog.contextvars import bind_contextvars, unbind_contextvars
+
+from ...types import SqlParams
+from ...util import map_threaded
+from ..validate.lazy import RawLazyDataModel, validate_lazy
+from .core import bind_sql_params
+from .metrics import instrument, mark_fetch, measure
+
+__all__ = [
+    "fetch_data_lazy",
+    "read_sql_polars",
+]
+
+logger = logging.getLogger(__name__)
+
+
+def fetch_data_lazy(
+    params: SqlParams,
+    db_engine: Engine,
+    sql_queries: frozendict[str, str],
+    *,
+    data_model: type[pa.DataFrameModel] = RawLazyDataModel,
+    max_workers: int = 1,
+) -> pl.LazyFrame:
+    """Fetch all data from the database into Polars, like `fetch_data`.
+
+    All queries are read concurrently into Arrow-backed Polars DataFrames and left
+    joined one-to-one on the identifier columns of the "index" query. The joins and
+    the validation with the Polars backend of pandera run multithreaded in Polars.
+    The results are not cached.
+
+    Args:
+        params: Key-value substitutions for parameterized queries.
+        db_engine: Database connection engine.
+        sql_queries: Name-query pairs to fetch.
+        data_model: Polars data model for validation and conversion.
+        max_workers: Maximum number of queries to run concurrently.
+
+    Returns:
+        LazyFrame with collected data from all sources.
+
+    Raises:
+        polars.exceptions.ComputeError: If the identifiers of any query are not unique.
+    """
+    queries = dict(sql_queries)
+    bind_contextvars(**{k: str(v) for k, v in params.items()})
+    instrument(db_engine)
+    queries = {"index": queries.pop("index")} | queries  # Index first
+    read = partial(_read_query, params=params, db_engine=db_engine)
+    frames = map_threaded(read, queries, queries.values(), max_workers=max_workers)
+
+    # Left join the feature and target columns on the identifiers of the index
+    lf, *others = (df.lazy() for df in frames)
+    identifiers = lf.collect_schema().names()
+    for other in others:
+        lf = lf.join(other, on=identifiers, how="left", validate="1:1")
+    unbind_contextvars("query_name", *list(params))
+
+    logger.info("Validate raw data")
+    return validate_lazy(data_model, lf)
+
+
+def _read_query(
+    name: str, query: str, params: SqlParams, db_engine: Engine
+) -> pl.DataFrame:
+    """Read a single parameterized SQL query into Polars and measure it."""
+    bind_contextvars(query_name=name)
+    logger.debug(f"Fetch {name}")
+    with measure(name, cached=False) as metrics:
+        mark_fetch()
+        stmt = bind_sql_params(query, **params)
+        df = read_sql_polars(stmt, db_engine, parse_dates=["date"])
+        metrics.record(df)
+    return df
+
+
+def read_sql_polars(
+    sql: TextClause,
+    con: Engine | Connection,
+    *,
+    parse_dates: list[str] | None = None,
+) -> pl.DataFrame:
+    """Read an SQL query into a Polars DataFrame.
+
+    Args:
+        sql: SQL statement to execute.
+        con: Database connection engine or an open connection.
+        parse_dates: Columns to parse as dates if not already typed.
+
+    Returns:
+        DataFrame with the query result.
+    """
+    with con.connect() if isinstance(con, Engine) else nullcontext(con) as conn:
+        df = pl.read_database(sql, conn)
+    strings = [col for col in parse_dates or [] if df.schema.get(col) == pl.String]
+    return df.with_columns(pl.col(strings).str.to_datetime(time_unit="us"))
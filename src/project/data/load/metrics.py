@@ -0,0 +1,175 @@
+"""Measure the loading of individual queries for logging and experiment tracking."""
+
+import logging
+from collections import defaultdict
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from functools import wraps
+from time import perf_counter
+from typing import Any, Literal, cast
+
+import pandas as pd
+import polars as pl
+from sqlalchemy import Engine, event
+
+from .cache import CachedFunc
+
+__all__ = [
+    "LoadMetrics",
+    "QueryMetrics",
+    "collect_load_metrics",
+    "instrument",
+    "mark_fetch",
+    "measure",
+    "measure_cached",
+]
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class QueryMetrics:
+    """Metrics of loading a query for one period or shard."""
+
+    query: str
+    cache: Literal["hit", "miss", "off"] = "off"
+    wall_time: float = 0.0  # Seconds including cache and database access
+    time_to_execute: float | None = None  # Seconds until the query was executed
+    rows: int = 0
+    memory_bytes: int = 0  # In-memory size of the DataFrame
+    _fetch_start: float | None = field(default=None, repr=False, compare=False)
+
+    def record(self, df: pd.DataFrame | pl.DataFrame) -> None:
+        """Record the size of the loaded pandas or Polars DataFrame."""
+        self.rows = len(df)
+        if isinstance(df, pl.DataFrame):
+            self.memory_bytes = int(df.estimated_size())
+        else:
+            self.memory_bytes = int(df.memory_usage(deep=True).sum())
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the metrics without internal fields."""
+        return {k: v for k, v in asdict(self).items() if not k.startswith("_")}
+
+
+@dataclass
+class LoadMetrics:
+    """Metrics of all queries loaded within `collect_load_metrics`."""
+
+    queries: list[QueryMetrics] = field(default_factory=list)
+
+    def summary(self) -> dict[str, float]:
+        """Aggregate the metrics per query across periods and shards.
+
+        Returns:
+            Flat metrics, e.g. "load.target.wall_time", for experiment tracking.
+        """
+        totals: dict[str, float] = defaultdict(float)
+        for m in self.queries:
+            prefix = f"load.{m.query}."
+            totals[prefix + "wall_time"] += m.wall_time
+            totals[prefix + "time_to_execute"] += m.time_to_execute or 0.0
+            totals[prefix + "rows"] += m.rows
+            totals[prefix + "memory_bytes"] += m.memory_bytes
+            totals[prefix + "cache_hits"] += m.cache == "hit"
+            totals[prefix + "cache_misses"] += m.cache == "miss"
+        return dict(totals)
+
+
+_collected: ContextVar[LoadMetrics | None] = ContextVar("collected", default=None)
+_current: ContextVar[QueryMetrics | None] = ContextVar("current", default=None)
+
+
+@contextmanager
+def collect_load_metrics() -> Generator[LoadMetrics]:
+    """Collect the metrics of all queries loaded within the context.
+
+    Yields:
+        Metrics that are filled while loading.
+
+    Examples:
+        >>> with collect_load_metrics() as metrics:
+        ...     pass  # E.g. fetch_data(...)
+        >>> metrics.summary()
+        {}
+    """
+    metrics = LoadMetrics()
+    token = _collected.set(metrics)
+    try:
+        yield metrics
+    finally:
+        _collected.reset(token)
+
+
+@contextmanager
+def measure(query: str, cached: bool) -> Generator[QueryMetrics]:
+    """Measure the loading of a query and log the metrics at the end.
+
+    Args:
+        query: Name of the query.
+        cached: Whether the query is read from the cache if available.
+
+    Yields:
+        Metrics to be completed with the result by `QueryMetrics.record`.
+    """
+    metrics = QueryMetrics(query, cache="hit" if cached else "off")
+    token = _current.set(metrics)
+    start = perf_counter()
+    try:
+        yield metrics
+    finally:
+        metrics.wall_time = perf_counter() - start
+        _current.reset(token)
+        if (collected := _collected.get()) is not None:
+            collected.queries.append(metrics)
+        logger.info(f"Loaded {query}", extra=metrics.to_dict())
+
+
+def mark_fetch() -> None:
+    """Mark the measured query as fetched from the database instead of the cache."""
+    if (metrics := _current.get()) is not None:
+        metrics.cache = "miss" if metrics.cache == "hit" else metrics.cache
+        metrics._fetch_start = perf_counter()
+
+
+def measure_cached[**P](query: str) -> Callable[[CachedFunc[P]], CachedFunc[P]]:
+    """Decorate a function cached by `FrameMemory` to measure its calls like a query.
+
+    Each call is recorded as a cache hit or miss as returned by the cache itself, such
+    that concurrent calls do not affect each other. On a hit, no query is measured
+    within the call.
+
+    Args:
+        query: Name to record the calls under.
+
+    Returns:
+        Decorator that keeps the attributes of the cached function.
+    """
+
+    def decorator(func: CachedFunc[P]) -> CachedFunc[P]:
+        @wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> pd.DataFrame:
+            with measure(query, cached=True) as metrics:
+                df, hit = func.call_with_hit(*args, **kwargs)
+                metrics.cache = "hit" if hit else "miss"
+                metrics.record(df)
+            return df
+
+        return cast(CachedFunc[P], wrapper)
+
+    return decorator
+
+
+def instrument(db_engine: Engine) -> None:
+    """Measure the time until the queries of an engine are executed."""
+    if not event.contains(db_engine, "after_cursor_execute", _after_execute):
+        event.listen(db_engine, "after_cursor_execute", _after_execute)
+
+
+def _after_execute(*_: Any) -> None:
+    """Record the time until the first execution of the fetched query."""
+    metrics = _current.get()
+    if metrics and metrics._fetch_start and metrics.time_to_execute is None:
+        metrics.time_to_execute = perf_counter() - metrics._fetch_start
@@ -0,0 +1,91 @@
+"""Split SQL parameters into periods or shards, e.g. for incremental caching."""
+
+from datetime import date, datetime
+from itertools import batched, product
+
+import pandas as pd
+
+from ...types import SqlParam, SqlParams
+
+__all__ = [
+    "END_DATE",
+    "START_DATE",
+    "split_periods",
+    "split_shards",
+]
+
+START_DATE = "start_date"
+END_DATE = "end_date"
+
+
+def split_periods(params: SqlParams, freq: str | None) -> list[dict[str, SqlParam]]:
+    """Split the date range of the SQL parameters into one parameter set per period.
+
+    The inclusive range from "start_date" to "end_date" is divided at the boundaries
+    of the periods of the given frequency, e.g. "D" for days or "M" for months. The
+    first and last period are clipped to the range.
+
+    Args:
+        params: Key-value substitutions for parameterized queries.
+        freq: Period frequency alias of pandas or None to not split the range.
+
+    Returns:
+        Parameters for each period in chronological order.
+
+    Examples:
+        >>> params = {"start_date": date(2026, 1, 20), "end_date": date(2026, 3, 5)}
+        >>> for period in split_periods(params, "M"):
+        ...     print(period["start_date"], period["end_date"])
+        2026-01-20 2026-01-31
+        2026-02-01 2026-02-28
+        2026-03-01 2026-03-05
+    """
+    if freq is None:
+        return [dict(params)]
+
+    start, end = (_to_date(params[key]) for key in (START_DATE, END_DATE))
+    periods = pd.period_range(start, end, freq=freq)
+    return [
+        dict(params)
+        | {
+            START_DATE: max(period.start_time.date(), start),
+            END_DATE: min(period.end_time.date(), end),
+        }
+        for period in periods
+    ] or [dict(params)]
+
+
+def split_shards(params: SqlParams, size: int | None) -> list[dict[str, SqlParam]]:
+    """Split the tuple parameters into shards of at most the given size.
+
+    Tuple parameters, e.g. identifiers for "WHERE id IN :ids", are split into chunks.
+    With several tuple parameters, the shards cover all combinations of their chunks.
+
+    Args:
+        params: Key-value substitutions for parameterized queries.
+        size: Maximum number of values per tuple parameter or None to not split.
+
+    Returns:
+        Parameters for each shard in the order of the values.
+
+    Examples:
+        >>> for shard in split_shards({"ids": (1, 2, 3), "region": "north"}, 2):
+        ...     print(shard)
+        {'ids': (1, 2), 'region': 'north'}
+        {'ids': (3,), 'region': 'north'}
+    """
+    tuples = {k: v for k, v in params.items() if isinstance(v, tuple) and v}
+    if size is None or not tuples:
+        return [dict(params)]
+
+    chunks = (batched(values, size) for values in tuples.values())
+    return [dict(params) | dict(zip(tuples, combo)) for combo in product(*chunks)]
+
+
+def _to_date(value: SqlParam) -> date:
+    """Convert a date-like SQL parameter to a date."""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value))
@@ -0,0 +1,96 @@
+"""Compose SQL queries into single statements that are executed in the database."""
+
+from collections.abc import Mapping, Sequence
+
+__all__ = [
+    "compose_join",
+    "compose_schema",
+]
+
+
+def compose_join(
+    index: str,
+    queries: Mapping[str, str],
+    identifiers: Sequence[str],
+    columns: Mapping[str, Sequence[str]],
+) -> str:
+    """Compose the index and queries into one statement that left joins them.
+
+    Every query becomes a common table expression prefixed by "cte_". The queries are
+    left joined onto the index by the identifier columns, such that only rows of
+    identifiers in the index are returned by the database. The rows are ordered by the
+    identifiers.
+
+    Args:
+        index: SQL query of the identifying columns.
+        queries: Name-query pairs to join on the index.
+        identifiers: Names of the identifying columns.
+        columns: Names of the columns of each query.
+
+    Returns:
+        SQL query with the same parameters as the individual queries.
+
+    Raises:
+        ValueError: If the queries share columns other than the identifiers.
+
+    Examples:
+        >>> print(
+        ...     compose_join(
+        ...         "select 1 as id;", {"a": "select 1 as id"}, ["id"], {"a": ["id"]}
+        ...     )
+        ... )
+        with
+        "cte_index" as (
+        select 1 as id
+        ),
+        "cte_a" as (
+        select 1 as id
+        )
+        select * from "cte_index"
+        left join "cte_a" using ("id")
+        order by "id"
+    """
+    _raise_if_overlapping(identifiers, [columns[name] for name in queries])
+    ctes = {"index": index, **queries}
+    using = ", ".join(f'"{col}"' for col in identifiers)
+    return "\n".join(
+        [
+            "with",
+            ",\n".join(
+                f'"cte_{name}" as (\n{_strip(q)}\n)' for name, q in ctes.items()
+            ),
+            'select * from "cte_index"',
+            *(f'left join "cte_{name}" using ({using})' for name in queries),
+            f"order by {using}",
+        ]
+    )
+
+
+def compose_schema(query: str) -> str:
+    """Compose a statement that returns the columns of a query without any rows.
+
+    Args:
+        query: SQL query.
+
+    Returns:
+        SQL query with the same parameters and columns.
+    """
+    return f"select * from (\n{_strip(query)}\n) as schema_only where 1 = 0"
+
+
+def _strip(query: str) -> str:
+    """Strip the surrounding whitespace and the terminating semicolon of a query."""
+    return query.strip().removesuffix(";").rstrip()
+
+
+def _raise_if_overlapping(
+    identifiers: Sequence[str], columns: Sequence[Sequence[str]]
+) -> None:
+    """Raise like `join_one_to_one` if queries share columns other than identifiers."""
+    seen = set(identifiers)
+    for cols in columns:
+        for col in cols:
+            if col in seen and col not in identifiers:
+                msg = f"columns overlap but no suffix specified: [{col!r}]"
+                raise ValueError(msg)
+            seen.add(col)
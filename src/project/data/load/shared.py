@@ -0,0 +1,71 @@
+"""Share data between processes through memory-mapped files."""
+
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import joblib
+import pandas as pd
+
+__all__ = [
+    "ENV_VAR_SHARED_DATA",
+    "SharedData",
+    "attach_shared_data",
+    "share_data",
+]
+
+ENV_VAR_SHARED_DATA = "SHARED_DATA_PATH"
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class SharedData:
+    """Processed data shared by all jobs with the artifacts of loading it once.
+
+    Attributes:
+        X: Processed features.
+        y: Processed target.
+        raw_path: Parquet file of the raw data for each job to keep a copy of.
+        load_metrics: Summary of the load metrics, see `LoadMetrics.summary`.
+    """
+
+    X: pd.DataFrame
+    y: pd.Series
+    raw_path: Path
+    load_metrics: dict[str, float]
+
+
+def share_data(data: Any, path: str | Path) -> None:
+    """Write data, e.g. DataFrames, for other processes to attach to without copies.
+
+    All NumPy arrays, e.g. the columns of DataFrames, are stored uncompressed, such
+    that they can be memory-mapped. The file is written atomically.
+
+    Args:
+        data: Data to share.
+        path: Path of the file.
+    """
+    path = Path(path)
+    tmp = path.with_name(f".{os.getpid()}-{threading.get_ident()}-{path.name}")
+    joblib.dump(data, tmp)
+    os.replace(tmp, path)
+    logger.info(f"Shared {path.stat().st_size:,} bytes of data")
+
+
+def attach_shared_data() -> Any | None:
+    """Attach to the data shared at the path in the environment variable, if any.
+
+    All NumPy arrays are memory-mapped read-only. Processes attached to the same file
+    share the same memory and the data is not copied.
+
+    Returns:
+        Shared data or None if no data is shared.
+    """
+    path = os.environ.get(ENV_VAR_SHARED_DATA)
+    if not path:
+        return None
+    logger.debug(f"Attach shared data {path}")
+    return joblib.load(path, mmap_mode="r")
@@ -0,0 +1,4 @@
+-- Watermark of target.sql: Cached target data is reused while this result is unchanged
+-- Placeholder that only moves with the end date, thus not enabled in the loader stores
+-- In practice e.g. select max(updated_at) from target where date between ...
+select date(:end_date) as updated_at;
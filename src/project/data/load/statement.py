@@ -0,0 +1,65 @@
+"""Parse SQL statements once and reuse them for every set of parameters."""
+
+from functools import lru_cache
+from typing import Self
+
+from sqlalchemy import TextClause, bindparam, text
+
+from ...types import SqlParams
+
+__all__ = [
+    "SqlStatement",
+    "parameter_names",
+]
+
+STATEMENT_CACHE_SIZE = 1024
+
+
+class SqlStatement(str):
+    """SQL query that knows the names of its parameters.
+
+    Statements are ordinary strings, that can be composed and cached as before, but
+    their text is only parsed once. Binding parameters reuses the parsed statement for
+    the same expanding parameters. The database engine in turn caches the statement
+    compiled for its dialect, see `create_engine(query_cache_size=...)`.
+
+    Examples:
+        >>> stmt = SqlStatement("SELECT * FROM t WHERE id IN :ids AND d < :end_date")
+        >>> stmt.parameters
+        ('ids', 'end_date')
+        >>> stmt.bind({"ids": (1, 2), "region": "north"}).compile().params
+        {'ids': (1, 2), 'end_date': None}
+    """
+
+    parameters: tuple[str, ...]
+
+    def __new__(cls, query: str) -> Self:
+        """Create the statement and parse the names of its parameters."""
+        statement = super().__new__(cls, query)
+        statement.parameters = parameter_names(query)
+        return statement
+
+    def bind(self, params: SqlParams) -> TextClause:
+        """Bind the parameters used in the statement and expand tuples.
+
+        Args:
+            params: Key-value substitutions. Unused parameters are ignored.
+
+        Returns:
+            SQL statement with bound and expanded parameters.
+        """
+        used = {p: params[p] for p in self.parameters if p in params}
+        expanding = frozenset(p for p, v in used.items() if isinstance(v, tuple))
+        return _parse(str(self), expanding).bindparams(**used)
+
+
+@lru_cache(maxsize=STATEMENT_CACHE_SIZE)
+def parameter_names(query: str) -> tuple[str, ...]:
+    """Parse the names of the parameters in an SQL query in order of appearance."""
+    return tuple(text(query).compile().params)
+
+
+@lru_cache(maxsize=STATEMENT_CACHE_SIZE)
+def _parse(query: str, expanding: frozenset[str]) -> TextClause:
+    """Parse an SQL query with the expanding parameters declared but not bound."""
+    return text(query).bindparams(*(bindparam(p, expanding=True) for p in expanding))
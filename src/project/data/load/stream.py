@@ -0,0 +1,87 @@
+"""Stream SQL results in chunks to bound the memory of large queries."""
+
+from collections.abc import Mapping
+from typing import Any
+
+import pandas as pd
+from sqlalchemy import Engine, Executable
+
+__all__ = [
+    "filter_rows",
+    "read_sql_chunked",
+]
+
+COERCION_ERRORS = (TypeError, ValueError)
+
+
+def read_sql_chunked(
+    sql: Executable,
+    con: Engine,
+    *,
+    chunksize: int,
+    keep: pd.MultiIndex | None = None,
+    dtype: Mapping[str, Any] | None = None,
+    index_col: str | list[str] | None = None,
+    **kwargs: Any,
+) -> pd.DataFrame:
+    """Read an SQL query in chunks from a server-side cursor.
+
+    Only one chunk of raw rows is held in memory at a time. Every chunk is reduced to
+    the rows of the identifiers to keep and converted to the given data types before
+    the next chunk is read, such that the compact, typed blocks are concatenated.
+
+    Args:
+        sql: SQL statement to execute.
+        con: Database connection engine.
+        chunksize: Number of rows per chunk.
+        keep: Identifiers of the rows to keep with the identifier columns as names.
+        dtype: Pandas data types of the expected columns. Values that do not fit the
+            data type are kept as they are for the data model validation.
+        index_col: Column(s) to set as index.
+        kwargs: Keyword arguments passed on to `pandas.read_sql`, e.g. `parse_dates`.
+
+    Returns:
+        DataFrame with the query result.
+    """
+    options = {"stream_results": True, "max_row_buffer": chunksize}
+    with con.connect().execution_options(**options) as conn:
+        chunks = [
+            _coerce(filter_rows(chunk, keep), dtype or {})
+            for chunk in pd.read_sql(sql, conn, chunksize=chunksize, **kwargs)
+        ]
+    df = pd.concat(chunks, ignore_index=True)
+    return df if index_col is None else df.set_index(index_col)
+
+
+def filter_rows(df: pd.DataFrame, keep: pd.MultiIndex | None) -> pd.DataFrame:
+    """Select the rows of the identifiers to keep.
+
+    Args:
+        df: Data with the identifier columns.
+        keep: Identifiers of the rows to keep with the identifier columns as names or
+            None to keep all rows.
+
+    Returns:
+        Rows of the identifiers to keep.
+
+    Examples:
+        >>> keep = pd.MultiIndex.from_tuples([(1, "a")], names=["id", "key"])
+        >>> filter_rows(pd.DataFrame({"id": [1, 2], "key": ["a", "a"]}), keep)
+           id key
+        0   1   a
+    """
+    if keep is None:
+        return df
+    identifiers = pd.MultiIndex.from_frame(df[list(keep.names)])
+    return df[identifiers.isin(keep)]
+
+
+def _coerce(df: pd.DataFrame, dtypes: Mapping[str, Any]) -> pd.DataFrame:
+    """Convert the columns to the data types where possible."""
+    converted = {}
+    for col in df.columns.intersection(list(dtypes)):
+        try:
+            converted[col] = df[col].astype(dtypes[col])
+        except COERCION_ERRORS:
+            pass  # Leave it to the validation
+    return df.assign(**converted)
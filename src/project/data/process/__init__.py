@@ -1,5 +1,7 @@
 __all__ = [
     "process_data",
+    "process_data_lazy",
 ]
 
 from .core import process_data
+from .lazy import process_data_lazy
@@ -3,7 +3,7 @@ import logging
 import pandas as pd
 import pandera.pandas as pa
 
-from ..validate import ProcessedDataModel
+from ..validate import ProcessedDataModel, consolidate, validate_cached
 
 logger = logging.getLogger(__name__)
 
@@ -27,11 +27,12 @@ def process_data(
 
     # TODO Filter invalid rows and remove outliers.
     logger.debug("Preprocess raw data")
-    processed = raw.copy()
+    processed = raw  # Not modified in-place by the validation
 
-    # Validation and ML-conform conversion
+    # Validation and ML-conform conversion, reused for the same data, e.g. in sweeps
     logger.debug("Validate processed data")
-    X = data_model.validate(processed)
+    X = validate_cached(data_model, processed)
     y = X.pop(target_column)
 
-    return X, y
+    # Hand NumPy floats, e.g. of a compact data model, to the model as one array
+    return consolidate(X), y
@@ -0,0 +1,54 @@
+import logging
+
+import pandas as pd
+import pandera.polars as pa
+import polars as pl
+import polars.selectors as cs
+
+from ..validate.lazy import ProcessedLazyDataModel, validate_lazy
+
+logger = logging.getLogger(__name__)
+
+
+def process_data_lazy(
+    raw: pl.LazyFrame,
+    target_column: str,
+    *,
+    data_model: type[pa.DataFrameModel] = ProcessedLazyDataModel,
+) -> tuple[pd.DataFrame, pd.Series]:
+    """Process Polars data like `process_data` and convert it for Scikit-Learn.
+
+    The data is coerced to ML-conform data types with Polars expressions, validated,
+    and only then collected and converted to pandas. Numerics arrive as NumPy floats
+    with NaN for missing values.
+
+    Args:
+        raw: Raw unprocessed data.
+        target_column: Name of the target column.
+        data_model: Polars data model for validation and conversion.
+
+    Returns:
+        Feature DataFrame and Target Series.
+    """
+
+    # TODO Filter invalid rows and remove outliers.
+    logger.debug("Preprocess raw data")
+    utc = cs.datetime(time_zone="*").dt.convert_time_zone("UTC")
+    processed = raw.with_columns(utc.dt.replace_time_zone(None)).with_columns(
+        # Normalize datetime columns to microsecond resolution in UTC without time zone
+        cs.datetime().dt.cast_time_unit("us"),
+        # Missing values in booleans are not fully supported by Scikit-Learn
+        cs.boolean().fill_null(False),  # NaN are set to False(!)
+        # There should be no string columns, but all categorical
+        cs.string().cast(pl.Categorical),
+        # All numerics are promoted to float64 to prevent downstream type conversions
+        cs.numeric().cast(pl.Float64),
+    )
+
+    # Validation and ML-conform conversion
+    logger.debug("Validate processed data")
+    df = validate_lazy(data_model, processed).collect()
+
+    # Convert at the boundary to Scikit-Learn
+    logger.debug("Convert processed data")
+    return df.drop(target_column).to_pandas(), df.get_column(target_column).to_pandas()
@@ -1,9 +1,20 @@
 """Data models for validation of raw data and model inputs."""
 
 __all__ = [
+    "CompactProcessedDataModel",
+    "ProcessedLazyDataModel",
     "RawDataModel",
+    "RawLazyDataModel",
     "ProcessedDataModel",
+    "cache_validation",
+    "consolidate",
+    "split_schema",
+    "validate_cached",
 ]
 
-from .processed import ProcessedDataModel
+from .cache import cache_validation, validate_cached
+from .coerce import consolidate
+from .lazy import ProcessedLazyDataModel, RawLazyDataModel
+from .processed import CompactProcessedDataModel, ProcessedDataModel
 from .raw import RawDataModel
+from .split import split_schema
@@ -1,11 +1,15 @@
 import logging
 from typing import Any
 
+import numpy as np
 import pandas as pd
 import pandera.pandas as pa
 import pandera.typing.pandas as pat
 from pandera.pandas import Field as F
 
+from .chunks import iter_chunks
+from .coerce import apply_coercion, plan_coercion
+
 
 class DataModelBase(pa.DataFrameModel):
     """Data model base with standard config and column renaming prior to validation."""
@@ -13,7 +17,7 @@ class DataModelBase(pa.DataFrameModel):
     _pre_rename: dict[str, str] = dict()  # Rename selected columns
     index_: pat.Index[int] = F(unique=True, ge=0)  # DataFrame index
 
-    class Config:
+    class Config:  # ty: ignore[invalid-attribute-override]
         strict = "filter"  # Drop extra columns
         coerce = True  # Auto-convert data types where possible
 
@@ -26,13 +30,19 @@ class DataModelBase(pa.DataFrameModel):
     @pa.check("^.*[^_]$", regex=True, ignore_na=False)
     def has_at_least_one_value(cls, col: pat.Series[Any]) -> bool:
         """Columns with all NaNs suggest faulty data."""
-        return col.notna().any() or col.empty
+        return col.empty or any(chunk.notna().any() for chunk in iter_chunks(col))
 
     @pa.check(index_, ignore_na=False)
     def index_is_monotonically_increasing(cls, idx: pat.Index[int]) -> bool:
         """Index must be monotonically increasing to reduce risk of mistakes."""
         cls.get_logger().debug("Check for proper index")
-        return idx.tolist() == list(range(len(idx)))
+        index = pd.Index(idx, copy=False)  # Monotonicity and uniqueness in one pass
+        return index.empty or bool(
+            index[0] == 0
+            and index[-1] == len(index) - 1
+            and index.is_monotonic_increasing
+            and index.is_unique
+        )
 
     @pa.dataframe_check
     def dataframe_is_non_empty(cls, df: pd.DataFrame) -> bool:
@@ -49,31 +59,19 @@ class DataModelBaseML(DataModelBase):
     """Data model base enforcing ML conform data types after validation.
 
     Allowed data types to provide a deterministic and reproducible ML context are
-    Float64, Boolean, Categorical, Datetime.
+    NumPy float64 with NaN for missing values, Boolean, Categorical, Datetime. In
+    compact mode, the numerics of `_float_columns` are instead NumPy floats of
+    `_float_dtype`.
     """
 
+    _float_dtype: Any = np.dtype("float64")  # E.g. np.float32 for compact mode
+    _float_columns: list[str] | None = None  # Columns of _float_dtype, None for all
+
     @pa.dataframe_check
     def coerce_data_types(cls, df: pd.DataFrame) -> bool:
-        """Coerce data types in-place post validation."""
-
-        # Normalize datetime columns to microsecond resolution and drop time zone info
-        cls.get_logger().debug("Coerce datetime types")
-        dt = df.select_dtypes(["datetime", "datetimetz"]).columns
-        df[dt] = df[dt].apply(lambda x: x.dt.tz_localize(None).dt.as_unit("us"))
-
-        # Missing values in booleans are not fully supported by Scikit-Learn
-        cls.get_logger().debug("Impute boolean types")
-        bt = df.select_dtypes("boolean").columns
-        df[bt] = df[bt].fillna(False)  # NaN are set to False(!)
-
-        # There should be no string columns, but all categorical
-        cls.get_logger().debug("Coerce categorical types")
-        st = df.select_dtypes("string").columns
-        df[st] = df[st].astype(pd.CategoricalDtype())
-
-        # All numerics are promoted to float64 to prevent downstream type conversions
-        cls.get_logger().debug("Coerce numeric types")
-        nt = df.select_dtypes("number").columns
-        df[nt] = df[nt].astype(pd.Float64Dtype())
-
+        """Coerce data types in-place post validation, column by column."""
+        plan = plan_coercion(df, cls._float_dtype, cls._float_columns)
+        copied = apply_coercion(df, plan)
+        extra = {"num_columns": len(plan), "copied_bytes": copied}
+        cls.get_logger().debug("Coerce data types", extra=extra)
         return True
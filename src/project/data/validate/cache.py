@@ -0,0 +1,154 @@
+"""Reuse the results of validating data that was validated before."""
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+import pandas as pd
+import pandera.pandas as pa
+
+__all__ = [
+    "ValidationCache",
+    "cache_validation",
+    "fingerprint",
+    "validate_cached",
+]
+
+FIELD_ATTRIBUTES = ["name", "nullable", "unique", "coerce", "required", "checks"]
+logger = logging.getLogger(__name__)
+
+
+class ValidationCache:
+    """Cache validated DataFrames in memory by a fingerprint of the data and schema.
+
+    Validating a DataFrame with the same content and schema as before, e.g. the same
+    cached data in every trial of a hyperparameter search, skips the checks and returns
+    a view of the previous result. Only the most recently used results are kept.
+
+    Results are only cached with copy-on-write enabled, e.g. in the entrypoints, such
+    that the views share all data with the cached results until they are modified.
+    Otherwise, the data is validated as usual without keeping the result.
+
+    Args:
+        maxsize: Maximum number of validated DataFrames to keep, or zero to disable.
+    """
+
+    def __init__(self, maxsize: int = 4) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._results: OrderedDict[tuple[str, str], pd.DataFrame] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def validate(
+        self, schema: pa.DataFrameSchema | type[pa.DataFrameModel], df: pd.DataFrame
+    ) -> pd.DataFrame:
+        """Validate a DataFrame or return a copy of the result for the same data.
+
+        Args:
+            schema: Schema or data model to validate with.
+            df: Data to validate.
+
+        Returns:
+            Validated data that may be modified by the caller.
+        """
+        if not pd.get_option("mode.copy_on_write"):  # Views would share writes
+            return schema.validate(df)
+
+        key = (_schema_hash(schema), fingerprint(df))
+        with self._lock:
+            if (result := self._results.get(key)) is not None:
+                self._results.move_to_end(key)
+                self.hits += 1
+                logger.debug("Reuse validated data")
+                return result.copy(deep=False)
+
+        # Shallow copy to copy only the columns changed by the validation on write
+        result = schema.validate(df.copy(deep=False), inplace=True)
+        with self._lock:
+            self.misses += 1
+            self._results[key] = result
+            while len(self._results) > self.maxsize:
+                self._results.popitem(last=False)
+        return result.copy(deep=False)
+
+    def clear(self) -> None:
+        """Remove all validated DataFrames."""
+        with self._lock:
+            self._results.clear()
+
+
+def fingerprint(df: pd.DataFrame) -> str:
+    """Hash the content of a DataFrame including its index, columns, and data types.
+
+    Args:
+        df: Data to hash.
+
+    Returns:
+        Hexadecimal digest that only matches for equal data.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr((df.columns.to_list(), df.dtypes.to_list())).encode())
+    digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def _schema_hash(schema: pa.DataFrameSchema | type[pa.DataFrameModel]) -> str:
+    """Hash the columns, data types, and checks of a schema."""
+    if not isinstance(schema, pa.DataFrameSchema):
+        schema = schema.to_schema()
+    fields = [schema.index, *schema.columns.values()]
+    description = [repr(schema), *map(_describe, fields)]
+    return hashlib.blake2b(repr(description).encode(), digest_size=16).hexdigest()
+
+
+def _describe(field: Any) -> str:
+    """Describe a column or index of a schema by its exact data type and checks."""
+    dtype = getattr(getattr(field, "dtype", None), "type", None)  # E.g. categories
+    return repr([dtype, *(getattr(field, attr, None) for attr in FIELD_ATTRIBUTES)])
+
+
+_current: ContextVar[ValidationCache | None] = ContextVar("current", default=None)
+
+
+@contextmanager
+def cache_validation(maxsize: int = 4) -> Generator[ValidationCache]:
+    """Reuse the results of validating equal data within the context, e.g. a run.
+
+    The results are released at the end of the context.
+
+    Args:
+        maxsize: Maximum number of validated DataFrames to keep.
+
+    Yields:
+        Cache used by `validate_cached` within the context.
+    """
+    cache = ValidationCache(maxsize)
+    token = _current.set(cache)
+    try:
+        yield cache
+    finally:
+        _current.reset(token)
+        cache.clear()
+
+
+def validate_cached(
+    schema: pa.DataFrameSchema | type[pa.DataFrameModel], df: pd.DataFrame
+) -> pd.DataFrame:
+    """Validate a DataFrame with the cache of the current context, if any.
+
+    Args:
+        schema: Schema or data model to validate with.
+        df: Data to validate.
+
+    Returns:
+        Validated data that may be modified by the caller.
+    """
+    if (cache := _current.get()) is None:
+        return schema.validate(df)
+    return cache.validate(schema, df)
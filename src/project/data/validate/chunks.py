@@ -0,0 +1,70 @@
+"""Evaluate checks on large data in chunks of constant memory."""
+
+from collections.abc import Iterator
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from pandas.api.extensions import ExtensionArray
+
+__all__ = [
+    "CHUNK_SIZE",
+    "is_strictly_sorted",
+    "iter_chunks",
+]
+
+CHUNK_SIZE = 65_536  # Rows per chunk
+
+
+def iter_chunks[T: (pd.Series, pd.DataFrame)](obj: T, overlap: int = 0) -> Iterator[T]:
+    """Iterate over views of consecutive rows.
+
+    Args:
+        obj: Series or DataFrame to slice.
+        overlap: Number of rows that each chunk shares with the next one.
+
+    Yields:
+        Chunks of at most `CHUNK_SIZE + overlap` rows.
+    """
+    for start in range(0, len(obj), CHUNK_SIZE):
+        yield obj.iloc[start : start + CHUNK_SIZE + overlap]
+
+
+def is_strictly_sorted(df: pd.DataFrame, columns: list[Any]) -> bool:
+    """Check if the rows are strictly increasing by the columns in lexicographic order.
+
+    Strictly sorted rows are unique, such that sorted data, e.g. by identifiers, is
+    confirmed to be free of duplicates without hashing all rows at once.
+
+    Args:
+        df: Data to check.
+        columns: Columns to sort by in order of priority.
+
+    Returns:
+        Whether every row is greater than the previous one. Missing values are never
+        greater.
+
+    Examples:
+        >>> df = pd.DataFrame({"id": [1, 1, 2], "date": [1, 2, 1]})
+        >>> is_strictly_sorted(df, ["id", "date"]), is_strictly_sorted(df, ["date"])
+        (True, False)
+    """
+    return all(_is_chunk_sorted(chunk[columns]) for chunk in iter_chunks(df, 1))
+
+
+def _is_chunk_sorted(chunk: pd.DataFrame) -> bool:
+    """Check if the rows of a chunk are strictly increasing."""
+    greater = np.zeros(len(chunk) - 1, dtype=bool)
+    equal = np.ones(len(chunk) - 1, dtype=bool)
+    for _, col in chunk.items():
+        values: Any = col.array
+        greater |= equal & _to_bool(values[1:] > values[:-1])
+        equal &= _to_bool(values[1:] == values[:-1])
+    return bool(greater.all())
+
+
+def _to_bool(values: np.ndarray | ExtensionArray) -> np.ndarray:
+    """Convert comparison results to booleans with missing values as False."""
+    if isinstance(values, ExtensionArray):
+        return values.to_numpy(dtype=bool, na_value=False)
+    return np.asarray(values, dtype=bool)
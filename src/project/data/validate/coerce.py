@@ -0,0 +1,146 @@
+"""Coerce data types column by column without copying unchanged data."""
+
+from collections.abc import Callable, Collection
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+__all__ = [
+    "apply_coercion",
+    "consolidate",
+    "plan_coercion",
+]
+
+type Conversion = Callable[[pd.Series], pd.Series]
+
+DATETIME_DTYPE = np.dtype("datetime64[us]")
+FLOAT_DTYPE = np.dtype("float64")
+
+
+def _to_datetime(col: pd.Series) -> pd.Series:
+    """Normalize datetimes to microsecond resolution and drop time zone info."""
+    return col.dt.tz_localize(None).dt.as_unit("us")
+
+
+def _fill_false(col: pd.Series) -> pd.Series:
+    """Missing values in booleans are not fully supported by Scikit-Learn."""
+    return col.fillna(False)  # NaN are set to False(!)
+
+
+def _to_categorical(col: pd.Series) -> pd.Series:
+    """There should be no string columns, but all categorical."""
+    return col.astype(pd.CategoricalDtype())
+
+
+def _to_float(dtype: Any) -> Conversion:
+    """Convert numerics to a float type with NaN for missing values in NumPy types."""
+    return lambda col: col.astype(dtype)
+
+
+# Data types to select, whether a column needs a change, and the conversion
+CONVERSIONS: list[tuple[list[str], Callable[[pd.Series], bool], Conversion]] = [
+    (["datetime", "datetimetz"], lambda c: c.dtype != DATETIME_DTYPE, _to_datetime),
+    (["boolean"], lambda c: c.hasnans, _fill_false),
+    (["string"], lambda c: True, _to_categorical),
+]
+
+
+def plan_coercion(
+    df: pd.DataFrame,
+    float_dtype: Any = FLOAT_DTYPE,
+    float_columns: Collection[Any] | None = None,
+) -> dict[Any, Conversion]:
+    """Plan the conversions of all columns that do not have an ML-conform data type.
+
+    Columns are selected by their data types only, without copying any data. Columns
+    that already conform, e.g. NumPy float64 or booleans without missing values, are
+    left out.
+
+    Args:
+        df: Data to plan for.
+        float_dtype: NumPy float type of the numeric columns, with NaN for missing
+            values instead of a mask.
+        float_columns: Numeric columns of `float_dtype`, or None for all. All other
+            numeric columns are NumPy float64.
+
+    Returns:
+        Conversion by column name.
+
+    Examples:
+        >>> df = pd.DataFrame({"a": [1, 2], "b": [1.0, 2.0], "c": [1.0, None]})
+        >>> list(plan_coercion(df.astype({"c": "Float64"})))
+        ['a', 'c']
+    """
+    dtypes = df.iloc[:0]  # Select data types on an empty view
+    plan = {
+        col: convert
+        for include, is_needed, convert in CONVERSIONS
+        for col in dtypes.select_dtypes(include).columns
+        if is_needed(df[col])
+    }
+
+    # All numerics are promoted to float to prevent downstream type conversions
+    for col in dtypes.select_dtypes("number").columns:
+        is_compact = float_columns is None or col in float_columns
+        dtype = float_dtype if is_compact else FLOAT_DTYPE
+        if df[col].dtype != dtype:
+            plan[col] = _to_float(dtype)
+    return plan
+
+
+def apply_coercion(df: pd.DataFrame, plan: dict[Any, Conversion]) -> int:
+    """Convert the planned columns in-place one by one.
+
+    Each converted column replaces the original one on its own, such that at most one
+    column is held twice at any time and all other columns are not copied.
+
+    Args:
+        df: Data to convert.
+        plan: Conversion by column name, see `plan_coercion`.
+
+    Returns:
+        Number of bytes of the converted columns.
+    """
+    copied = 0
+    for col, convert in plan.items():
+        df[col] = converted = convert(df[col])
+        copied += converted.array.nbytes
+    return copied
+
+
+def consolidate(df: pd.DataFrame) -> pd.DataFrame:
+    """Store all NumPy float columns of the same data type in one contiguous block.
+
+    Columns converted one by one are stored separately, such that NumPy, e.g. in
+    Scikit-Learn, copies them into a new array on every access. Consolidated columns
+    are accessed as a single Fortran-ordered array without copies instead.
+
+    Args:
+        df: Data with columns to consolidate.
+
+    Returns:
+        Data with the same columns in the same order. Other columns are not copied.
+
+    Examples:
+        >>> df = pd.DataFrame({"a": [1.0]}).assign(c=[2.0])
+        >>> np.shares_memory(df.to_numpy(), df.to_numpy())
+        False
+        >>> df = consolidate(df)
+        >>> np.shares_memory(df.to_numpy(), df.to_numpy())
+        True
+    """
+    groups: dict[np.dtype, list[Any]] = {}
+    for col, dtype in df.dtypes.items():
+        if isinstance(dtype, np.dtype) and dtype.kind == "f":
+            groups.setdefault(dtype, []).append(col)
+
+    with pd.option_context("mode.copy_on_write", True):  # Keep other columns
+        blocks = [df.drop(columns=[col for cols in groups.values() for col in cols])]
+        for dtype, columns in groups.items():
+            values = np.empty((len(columns), len(df)), dtype=dtype)  # Block layout
+            for row, col in zip(values, columns):
+                row[:] = df[col].to_numpy()
+            index = pd.Index(columns)
+            blocks.append(pd.DataFrame(values.T, df.index, index, copy=False))
+        return pd.concat(blocks, axis=1)[df.columns]
@@ -0,0 +1,171 @@
+"""Data models for the validation of Polars LazyFrames.
+
+The columns are derived from the pandas data models, such that the schema is defined
+in one place only.
+"""
+
+import types
+
+import pandas as pd
+import pandera.pandas
+import pandera.polars as pa
+import polars as pl
+from pandera.api.checks import Check
+from pandera.api.dataframe.model_components import FieldInfo
+from pandera.polars import PolarsData
+
+from .processed import ProcessedDataModel
+from .raw import RawDataModel
+
+__all__ = [
+    "IdentifiedLazyDataModel",
+    "LazyDataModelBase",
+    "ProcessedLazyDataModel",
+    "RawLazyDataModel",
+    "derive_lazy_model",
+    "to_polars_dtypes",
+    "validate_lazy",
+]
+
+IDENTIFIERS = ["id", "date"]
+
+
+class LazyDataModelBase(pa.DataFrameModel):
+    """Data model base for Polars with the standard config of `DataModelBase`."""
+
+    class Config:  # ty: ignore[invalid-attribute-override]
+        strict = "filter"  # Drop extra columns
+        coerce = True  # Auto-convert data types where possible
+
+    @pa.check("^.*[^_]$", regex=True)
+    def has_at_least_one_value(cls, data: PolarsData) -> bool:
+        """Columns with all nulls suggest faulty data."""
+        has_value = (pl.len() == 0) | pl.col(data.key).is_not_null().any()
+        return bool(data.lazyframe.select(has_value).collect().item())
+
+    @pa.dataframe_check
+    def dataframe_is_non_empty(cls, data: PolarsData) -> bool:
+        """Training or inference will fail with zero samples."""
+        return bool(data.lazyframe.select(pl.len() > 0).collect().item())
+
+
+class IdentifiedLazyDataModel(LazyDataModelBase):
+    """Data model base for Polars data with unique identifier columns."""
+
+    @pa.dataframe_check
+    def identifiers_are_unique(cls, data: PolarsData) -> pl.LazyFrame:
+        """The identifier columns have no duplicates."""
+        return data.lazyframe.select(~pl.struct(IDENTIFIERS).is_duplicated())
+
+
+def to_polars_dtypes(
+    data_model: type[pandera.pandas.DataFrameModel],
+) -> dict[str, pl.DataType]:
+    """Translate the pandas data types of a data model into Polars data types.
+
+    Categoricals with fixed categories become enums, as Polars would otherwise infer
+    categoricals with arbitrary categories.
+
+    Args:
+        data_model: pandas data model.
+
+    Returns:
+        Polars data type of each column.
+    """
+    columns = data_model.to_schema().columns
+    dtypes = {name: column.dtype.type for name, column in columns.items()}
+    empty = pd.DataFrame(
+        {name: pd.Series(dtype=dtype) for name, dtype in dtypes.items()}
+    )
+    schema = pl.from_pandas(empty).schema
+    return {
+        name: pl.Enum(dtype.categories)
+        if isinstance(dtype, pd.CategoricalDtype) and dtype.categories is not None
+        else schema[name]
+        for name, dtype in dtypes.items()
+    }
+
+
+def _to_ml_conform(dtype: pl.DataType) -> pl.DataType:
+    """Numerics are Float64 and datetimes naive, as coerced by `process_data_lazy`."""
+    if dtype.is_numeric():
+        return pl.Float64()
+    if isinstance(dtype, pl.Datetime):
+        return pl.Datetime("us")
+    return dtype
+
+
+def derive_lazy_model(
+    data_model: type[pandera.pandas.DataFrameModel],
+    *,
+    ml_conform: bool = False,
+    doc: str | None = None,
+) -> type[IdentifiedLazyDataModel]:
+    """Derive a Polars data model from the columns of a pandas data model.
+
+    The data types, nullability, and built-in checks of the columns are carried over.
+    Custom checks are defined on the Polars base models instead, as they operate on
+    pandas data.
+
+    Args:
+        data_model: pandas data model to derive the columns from.
+        ml_conform: Whether the data types are coerced to ML-conform ones, where
+            booleans have no missing values.
+        doc: Docstring of the Polars data model.
+
+    Returns:
+        Polars data model.
+    """
+    annotations: dict[str, pl.DataType] = {}
+    fields: dict[str, FieldInfo] = {}
+    columns = data_model.to_schema().columns
+    for name, dtype in to_polars_dtypes(data_model).items():
+        column = columns[name]
+        annotations[name] = _to_ml_conform(dtype) if ml_conform else dtype
+        fields[name] = FieldInfo(
+            # Custom checks of the pandas data model do not support Polars
+            checks=[
+                check for check in column.checks if Check.is_builtin_check(check.name)
+            ],
+            # Missing booleans are filled in ML-conform data
+            nullable=column.nullable and not (ml_conform and dtype == pl.Boolean),
+        )
+    namespace = {"__annotations__": annotations, "__doc__": doc, "__module__": __name__}
+    return types.new_class(
+        data_model.__name__.replace("DataModel", "LazyDataModel"),
+        (IdentifiedLazyDataModel,),
+        exec_body=lambda ns: ns.update(namespace, **fields),
+    )
+
+
+RawLazyDataModel = derive_lazy_model(
+    RawDataModel, doc="Data model for raw data in Polars, equivalent to `RawDataModel`."
+)
+ProcessedLazyDataModel = derive_lazy_model(
+    ProcessedDataModel,
+    ml_conform=True,
+    doc="""Data model for processed and ML-conform data in Polars.
+
+    Numerics are Float64, datetimes have no time zone, and booleans no missing values,
+    as coerced by `process_data_lazy`.
+    """,
+)
+
+
+def validate_lazy(
+    data_model: type[pa.DataFrameModel], lf: pl.LazyFrame
+) -> pl.LazyFrame:
+    """Validate the schema and the values of a LazyFrame.
+
+    pandera only checks the schema of LazyFrames by default. Instead, the query plan
+    is collected once and all checks run on the collected data, as each check would
+    otherwise execute the plan again.
+
+    Args:
+        data_model: Polars data model for validation and conversion.
+        lf: Data to validate.
+
+    Returns:
+        Validated and converted data.
+    """
+    return data_model.validate(lf.collect()).lazy()
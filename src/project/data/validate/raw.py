@@ -6,6 +6,7 @@ import pandera.typing.pandas as pat
 from pandera.pandas import Field as F
 
 from .base import DataModelBase
+from .chunks import is_strictly_sorted
 
 
 class RawDataModel(DataModelBase):
@@ -22,8 +23,12 @@ class RawDataModel(DataModelBase):
     target: pd.Float64Dtype = F(nullable=True)
 
     @pa.dataframe_check
-    def identifiers_are_unique(cls, df: pd.DataFrame) -> pat.Series[bool]:
+    def identifiers_are_unique(cls, df: pd.DataFrame) -> pat.Series[bool] | bool:
         """The identifier columns have no duplicates."""
         cls.get_logger().debug("Check for duplicate identifiers")
+        if is_strictly_sorted(df, [cls.id, cls.date]):  # Constant memory if sorted
+            return True
+
+        # Find the duplicates by hashing otherwise and to report them
         truth_values = ~df.duplicated([cls.id, cls.date], False)
         return cast(pat.Series[bool], truth_values)
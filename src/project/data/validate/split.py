@@ -0,0 +1,44 @@
+"""Split the validation of a data model to validate parts of the data separately."""
+
+from copy import deepcopy
+
+import pandera.pandas as pa
+
+__all__ = [
+    "split_schema",
+]
+
+
+def split_schema(
+    data_model: type[pa.DataFrameModel],
+) -> tuple[pa.DataFrameSchema, pa.DataFrameSchema]:
+    """Split the schema of a data model into a column-wise and a frame-wise schema.
+
+    The column-wise schema parses and coerces the columns present in a part of the
+    data, e.g. the result of a single query, and ignores all other columns. The
+    frame-wise schema completes the validation of the assembled data with the required
+    columns, their data types and nullability, the column checks, the DataFrame
+    checks, e.g. unique identifiers, and the index, without coercing the values again.
+
+    Validating all parts with the column-wise schema and the assembled data with the
+    frame-wise schema is equivalent to validating the assembled data with the data
+    model. Values are checked only after the join, such that rows of a part that are
+    dropped by the join, e.g. identifiers missing in the index, are never checked.
+
+    Args:
+        data_model: Data model to split.
+
+    Returns:
+        Column-wise and frame-wise schema.
+    """
+    schema = data_model.to_schema()
+    by_column = deepcopy(schema).update_columns(
+        {name: {"required": False, "checks": []} for name in schema.columns}
+    )
+    by_column.checks, by_column.index, by_column.strict = [], None, False
+
+    by_frame = deepcopy(schema).update_columns(
+        {name: {"parsers": []} for name in schema.columns}
+    )
+    by_frame.parsers, by_frame.coerce = [], False
+    return by_column, by_frame
@@ -0,0 +1,48 @@
+import argparse
+from typing import Literal
+
+from ..data import memory
+
+
+def inspect() -> None:
+    """Print the entries of the data cache and their total size."""
+    manifest = memory.manifest()
+    print(f"Cache location: {memory.location}")
+    if manifest.empty:
+        print("No entries")
+        return
+
+    summary = manifest.groupby("function").agg(
+        entries=("path", "size"),
+        bytes=("bytes", "sum"),
+        hits=("hits", "sum"),
+        last_accessed=("accessed", "max"),
+    )
+    summary["last_accessed"] = summary["last_accessed"].astype("datetime64[s]")
+    print(summary.to_string())
+    print(f"Total: {len(manifest)} entries, {manifest['bytes'].sum():,} bytes")
+
+
+def prune(max_bytes: str, policy: Literal["lru", "lfu"] | None = None) -> None:
+    """Evict entries of the data cache until it is within the budget."""
+    evicted = memory.prune(max_bytes, policy)
+    freed = evicted["bytes"].sum() if not evicted.empty else 0
+    print(f"Evicted {len(evicted)} entries, {freed:,} bytes")
+
+
+def cli() -> None:
+    """Inspect and prune the data cache."""
+    parser = argparse.ArgumentParser(prog="cache", description=cli.__doc__)
+    commands = parser.add_subparsers(dest="command")
+    commands.add_parser("inspect", help=inspect.__doc__)
+    prune_parser = commands.add_parser("prune", help=prune.__doc__)
+    prune_parser.add_argument(
+        "max_bytes", help='Budget in bytes with optional unit, e.g. "10G". 0 clears'
+    )
+    prune_parser.add_argument("--policy", choices=["lru", "lfu"])
+    args = parser.parse_args()
+
+    if args.command == "prune":
+        prune(args.max_bytes, args.policy)
+    else:
+        inspect()
@@ -3,19 +3,23 @@ from collections.abc import Callable
 from datetime import date, timedelta
 from typing import cast
 
+import mlflow
 import numpy as np
 import pandas as pd
 import sklearn
 from pydantic import PositiveInt
 
-from ..config import make_cli, store
-from ..types import FittedPipeline, SqlParams
+from ..config import cpu_budget, make_cli, store
+from ..data import collect_load_metrics
+from ..types import FittedPipeline, RawData, SqlParams
+from ..util import limit_threads, write_parquet
 from ..version import PACKAGE, SERVICE
 
 logger = logging.getLogger(__name__)
 TODAY = date.today().isoformat()
 
 
+@pd.option_context("mode.copy_on_write", True)  # Copy data only on write
 @sklearn.config_context(transform_output="pandas")
 @store(
     name="prod",
@@ -48,8 +52,8 @@ TODAY = date.today().isoformat()
     zen_meta={"hydra": {"verbose": [PACKAGE]}},
 )
 def predict(
-    dataloader: Callable[[SqlParams], pd.DataFrame],
-    dataprocessor: Callable[[pd.DataFrame], tuple[pd.DataFrame, pd.Series]],
+    dataloader: Callable[[SqlParams], RawData],
+    dataprocessor: Callable[[RawData], tuple[pd.DataFrame, pd.Series]],
     model: FittedPipeline,
     start_date: date = cast(date, TODAY),
     num_samples: PositiveInt = 60,
@@ -68,14 +72,20 @@ def predict(
     """
     end_date = start_date + timedelta(days=num_samples - 1)
     sql_params = {"start_date": start_date, "end_date": end_date}
-    raw = dataloader(sql_params)
+    with collect_load_metrics() as load_metrics:
+        raw = dataloader(sql_params)
     X, _ = dataprocessor(raw)
 
+    logger.debug("Log data loading metrics")
+    with mlflow.start_run(run_name=f"predict_{start_date}", nested=True):
+        mlflow.log_metrics(load_metrics.summary())
+
     logger.debug("Write raw data")
-    raw.to_parquet("raw.parquet", index=False, compression="zstd")
+    write_parquet(raw, "raw.parquet")
 
     logger.debug("Perform inference")
-    y_pred = model.predict(X)
+    with limit_threads(model, cpu_budget().cores):
+        y_pred = model.predict(X)
 
     return y_pred
 
@@ -1,8 +1,11 @@
 import logging
 import os
+import shutil
 from collections.abc import Callable
+from dataclasses import asdict
 from datetime import date, timedelta
-from typing import cast
+from statistics import fmean
+from typing import Any, NoReturn, cast
 
 import mlflow
 import pandas as pd
@@ -10,12 +13,16 @@ import sklearn
 from mlflow.data.pandas_dataset import from_pandas
 from mlflow.models import infer_signature
 from pydantic import PastDate, PositiveInt
+from sklearn.model_selection import BaseCrossValidator
 from sklearn.pipeline import Pipeline
 from sklearn.utils import estimator_html_repr
 from structlog.contextvars import bind_contextvars, unbind_contextvars
 
-from ..config import make_cli, store
-from ..types import SqlParams
+from ..config import cpu_budget, current_trial, make_cli, store
+from ..data import attach_shared_data, collect_load_metrics
+from ..models import FoldResult, TransformerMemory, cross_validate, fit_warm_start
+from ..types import RawData, SqlParams
+from ..util import CpuBudget, limit_threads, write_parquet
 from ..version import PACKAGE, SERVICE
 
 logger = logging.getLogger(__name__)
@@ -23,6 +30,7 @@ YESTERDAY = (date.today() - timedelta(days=1)).isoformat()
 RUN_NAME = "${hydra:job.name}-${hydra:job.config_name}_${now:%Y%m%d}_${now:%H%M%S}"
 
 
+@pd.option_context("mode.copy_on_write", True)  # Copy data only on write
 @sklearn.config_context(transform_output="pandas")
 @store(
     name="prod",
@@ -61,9 +69,10 @@ RUN_NAME = "${hydra:job.name}-${hydra:job.config_name}_${now:%Y%m%d}_${now:%H%M%
     zen_meta={"hydra": {"verbose": [PACKAGE]}, "experiment": None},
 )
 def train(
-    dataloader: Callable[[SqlParams], pd.DataFrame],
-    dataprocessor: Callable[[pd.DataFrame], tuple[pd.DataFrame, pd.Series]],
+    dataloader: Callable[[SqlParams], RawData],
+    dataprocessor: Callable[[RawData], tuple[pd.DataFrame, pd.Series]],
     model: Pipeline,
+    validator: BaseCrossValidator | None = None,
     training_cutoff: PastDate = cast(PastDate, YESTERDAY),
     num_samples: PositiveInt = 365 * 5,
     register_model: str | None = None,
@@ -76,6 +85,7 @@ def train(
         dataloader: Callable to produce data given the SQL parameters.
         dataprocessor: Callable to process and split the data at the target column.
         model: Scikit-Learn ML pipeline.
+        validator: Cross-validator to score the model or None to skip.
         training_cutoff: End date of training data.
         num_samples: Number of days to include in training.
         register_model: Name of the MLflow model or None to skip.
@@ -83,34 +93,44 @@ def train(
         run_description: Description of the MLflow run.
 
     Returns:
-        The score of the evaluated fit.
+        The cross-validated score, or the training score without validator.
+
+    Raises:
+        optuna.TrialPruned: If the trial of the HPO job was pruned while fitting.
     """
     ENV = os.environ.get("ENV")
 
     start_date = training_cutoff - timedelta(days=num_samples - 1)
     sql_params = {"start_date": start_date, "end_date": training_cutoff}
-    raw = dataloader(sql_params)
-    X, y = dataprocessor(raw)
-
-    logger.debug("Write raw data")
-    raw.to_parquet("raw.parquet", index=False, compression="zstd")
+    X, y, load_metrics = _load_data(dataloader, dataprocessor, sql_params)
+    budget = cpu_budget(processes=_num_folds(validator))
 
     with mlflow.start_run(
         run_name=run_name, description=run_description, nested=True
     ) as run:
         bind_contextvars(run_id=run.info.run_id)
         logger.debug("Fit the model")
-        model.fit(X, y)
-        score = model.score(X, y)
+        tags = {"env": ENV, "training_cutoff": str(training_cutoff)}
+        with limit_threads(model, budget.cores):
+            if fit_warm_start(model, X, y, current_trial()):  # Report to trial
+                _prune(tags)
+            train_score = model.score(X, y)
+        memory = model.memory if isinstance(model.memory, TransformerMemory) else None
+        folds = _cross_validate(model, X, y, validator, budget, memory)
+        score = fmean(fold.score for fold in folds) if folds else train_score
+        model.set_params(memory=None)  # The step cache is only needed for fitting
 
         logger.debug("Log MLflow run")
         dataset = from_pandas(X)
         html = "<head><meta charset='UTF-8'></head>" + estimator_html_repr(model)
-        mlflow.set_tags({"env": ENV, "training_cutoff": str(training_cutoff)})
+        mlflow.set_tags(tags)
         mlflow.log_text(html, "estimator.html")
         mlflow.log_artifacts(".hydra", "hydra")
         mlflow.log_input(dataset, context="Train")
         mlflow.log_params(model.get_params() | {"steps": None})
+        mlflow.log_params({f"cpu.{k}": v for k, v in asdict(budget).items()})
+        mlflow.log_metrics(load_metrics)
+        _log_pipeline_cache(memory)
         mi = mlflow.sklearn.log_model(
             model,
             name="model",
@@ -123,7 +143,12 @@ def train(
                 "sklearn.compose._column_transformer.make_column_selector",
             ],
         )
-        mlflow.log_metric("train_score", score, model_id=mi.model_id, dataset=dataset)
+        mlflow.log_metric(
+            "train_score", train_score, model_id=mi.model_id, dataset=dataset
+        )
+        if folds:
+            _log_folds(folds)
+            mlflow.log_metric("cv_score", score, model_id=mi.model_id, dataset=dataset)
         unbind_contextvars("run_id")
 
     if register_model and mi.registered_model_version:
@@ -146,4 +171,82 @@ def train(
     return score
 
 
+def _load_data(
+    dataloader: Callable[[SqlParams], RawData],
+    dataprocessor: Callable[[RawData], tuple[pd.DataFrame, pd.Series]],
+    sql_params: SqlParams,
+) -> tuple[pd.DataFrame, pd.Series, dict[str, float]]:
+    """Attach to the data shared by all jobs of a multi-run, or load and process it.
+
+    Either way, the raw data is written to the job directory and the load metrics are
+    returned for logging.
+    """
+    if (shared := attach_shared_data()) is not None:
+        logger.info("Attach data shared by all jobs")
+        shutil.copyfile(shared.raw_path, "raw.parquet")
+        return shared.X, shared.y, shared.load_metrics
+
+    with collect_load_metrics() as load_metrics:
+        raw = dataloader(sql_params)
+        X, y = dataprocessor(raw)
+
+        logger.debug("Write raw data")
+        write_parquet(raw, "raw.parquet")
+    return X, y, load_metrics.summary()
+
+
+def _prune(tags: dict[str, Any]) -> NoReturn:
+    """End the run of a pruned trial without validating and logging the model."""
+    import optuna
+
+    logger.info("Skip the validation of the pruned model")
+    mlflow.set_tags(tags | {"pruned": True})
+    mlflow.end_run("KILLED")
+    unbind_contextvars("run_id")
+    raise optuna.TrialPruned
+
+
+def _cross_validate(
+    model: Pipeline,
+    X: pd.DataFrame,
+    y: pd.Series,
+    validator: BaseCrossValidator | None,
+    budget: CpuBudget,
+    memory: TransformerMemory | None,
+) -> list[FoldResult]:
+    """Cross-validate the model with the fold results cached in the memory, if any."""
+    if validator is None:
+        return []
+
+    logger.debug("Cross-validate the model")
+    return cross_validate(
+        model,
+        X,
+        y,
+        validator,
+        n_jobs=budget.processes,
+        threads=budget.threads,
+        memory=memory,
+    )
+
+
+def _num_folds(validator: BaseCrossValidator | None) -> int:
+    """Number of folds to cross-validate concurrently."""
+    return 1 if validator is None else validator.get_n_splits()
+
+
+def _log_pipeline_cache(memory: TransformerMemory | None) -> None:
+    """Log the numbers of reused and fitted pipeline steps, if cached."""
+    if memory is not None:
+        hits = {"hits": memory.hits, "misses": memory.misses}
+        mlflow.log_metrics({f"pipeline_cache.{k}": v for k, v in hits.items()})
+
+
+def _log_folds(folds: list[FoldResult]) -> None:
+    """Log the score and timings of each fold as the steps of MLflow metrics."""
+    for fold in folds:
+        metrics = {f"cv.{k}": v for k, v in asdict(fold).items() if k != "fold"}
+        mlflow.log_metrics(metrics, step=fold.fold)
+
+
 cli = make_cli(train)
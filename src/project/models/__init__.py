@@ -1,3 +1,13 @@
 """Custom model code."""
 
-__all__ = []
+__all__ = [
+    "FoldResult",
+    "Reporter",
+    "TransformerMemory",
+    "cross_validate",
+    "fit_warm_start",
+]
+
+from .memory import TransformerMemory
+from .validation import FoldResult, cross_validate
+from .warm_start import Reporter, fit_warm_start
@@ -0,0 +1,265 @@
+"""Share fitted pipeline steps between processes through a disk cache."""
+
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+import uuid
+from collections.abc import Callable, Generator, Sequence
+from contextlib import contextmanager, suppress
+from functools import wraps
+from pathlib import Path
+from typing import Any, Literal
+
+import joblib
+import pandas as pd
+from joblib.func_inspect import filter_args, get_func_name
+
+from ..util import parse_bytes, select_evicted
+
+__all__ = [
+    "TransformerMemory",
+]
+
+OUTPUT_FILE = "output.pkl"
+METADATA_FILE = "metadata.json"
+LOCK_FILE = "lock"
+MISSING = object()  # Sentinel of results that are not cached
+logger = logging.getLogger(__name__)
+
+
+class TransformerMemory:
+    """Cache fitted transformers of Scikit-Learn pipelines on disk across processes.
+
+    Pass it as `memory` to a `Pipeline`. Like `joblib.Memory`, every step is keyed by a
+    hash of the unfitted transformer with its parameters and of its input data, such
+    that unchanged leading steps are not fitted again, e.g. in the trials of a sweep.
+    Unlike `joblib.Memory`, concurrent calls with the same key, e.g. from the workers
+    of the joblib launcher, wait for the first call to store its result instead of
+    fitting the same step in parallel.
+
+    With a byte budget, the least recently (LRU) or least frequently (LFU) used steps
+    are evicted whenever a new step exceeds the budget, like in the data cache.
+
+    Args:
+        location: Directory of the cache. It is created on demand.
+        timeout: Seconds after which the lock of another process is considered stale,
+            e.g. if it was killed, and the step is fitted anyway.
+        poll_interval: Seconds between checks for the result of another process.
+        max_bytes: Budget for the total size of all steps, optionally with a unit,
+            e.g. "10G", or None for no limit.
+        policy: Eviction policy, either "lru" or "lfu".
+    """
+
+    def __init__(
+        self,
+        location: str | Path,
+        timeout: float = 3600.0,
+        poll_interval: float = 0.1,
+        *,
+        max_bytes: int | str | None = None,
+        policy: Literal["lru", "lfu"] = "lru",
+    ) -> None:
+        self.location = location
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self.max_bytes = None if max_bytes is None else parse_bytes(max_bytes)
+        self.policy = policy
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def directory(self) -> Path:
+        """Directory of the cached steps."""
+        return Path(self.location).expanduser() / "pipeline"
+
+    def cache[R](
+        self, func: Callable[..., R], ignore: Sequence[str] = ()
+    ) -> Callable[..., R]:
+        """Decorate a function, e.g. fitting a pipeline step, to cache its results.
+
+        Args:
+            func: Function to cache.
+            ignore: Names of arguments that do not affect the result.
+
+        Returns:
+            Cached function.
+        """
+        module, name = get_func_name(func)
+        directory = self.directory / ".".join([*module, name])
+
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> R:
+            """Return the cached result or call the function and cache its result."""
+            arguments = filter_args(func, list(ignore), args, kwargs)
+            entry = directory / joblib.hash(arguments)
+            with _lock(entry / LOCK_FILE, self.timeout, self.poll_interval):
+                if (result := self._read(entry)) is not MISSING:
+                    logger.debug("Read %s from cache", name)
+                    return result
+
+                self.misses += 1
+                result = func(*args, **kwargs)
+                self._write(entry, result)
+                return result
+
+        return wrapper
+
+    def manifest(self) -> pd.DataFrame:
+        """List the metadata of all cached steps.
+
+        Returns:
+            DataFrame with one row per step including size in bytes, access time,
+            number of hits, and path.
+        """
+        records = [_read_metadata(path.parent) for path in self._metadata_files()]
+        return pd.DataFrame.from_records(list(filter(None, records)))
+
+    def prune(
+        self,
+        max_bytes: int | str | None = None,
+        policy: Literal["lru", "lfu"] | None = None,
+    ) -> pd.DataFrame:
+        """Evict steps until the total size of the cache is within the budget.
+
+        Steps that are locked by a call, e.g. being read or written, are kept.
+
+        Args:
+            max_bytes: Budget in bytes, optionally with a unit, e.g. "10G". Defaults to
+                the budget of the cache, or zero to clear the cache if neither is set.
+            policy: Eviction policy. Defaults to the policy of the cache.
+
+        Returns:
+            Manifest of the evicted steps.
+        """
+        budget = parse_bytes(
+            max_bytes if max_bytes is not None else self.max_bytes or 0
+        )
+        manifest = self.manifest()
+        if manifest.empty:
+            return manifest
+
+        evicted = select_evicted(manifest, budget, policy or self.policy)
+        locked = evicted["path"].map(lambda p: Path(p, LOCK_FILE).exists())
+        evicted = evicted[~locked.astype(bool)]
+        for path in evicted["path"]:
+            shutil.rmtree(path, ignore_errors=True)
+        logger.debug("Evicted %d steps from cache", len(evicted))
+        return evicted.reset_index(drop=True)
+
+    def clear(self) -> None:
+        """Remove all cached steps."""
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def _metadata_files(self) -> list[Path]:
+        """List the metadata files of all cached steps."""
+        return list(self.directory.glob(f"*/*/{METADATA_FILE}"))
+
+    def _read(self, entry: Path) -> Any:
+        """Read a cached result and record the access, or return `MISSING`."""
+        try:
+            result = joblib.load(entry / OUTPUT_FILE)
+        except FileNotFoundError:  # Not cached yet or evicted concurrently
+            return MISSING
+
+        self.hits += 1
+        with suppress(FileNotFoundError):  # Evicted concurrently
+            # Metadata is lost if the process died after writing the result
+            metadata = _read_metadata(entry) or _describe(entry)
+            metadata |= {"accessed": time.time(), "hits": metadata["hits"] + 1}
+            _write_atomically(entry / METADATA_FILE, json.dumps(metadata))
+        return result
+
+    def _write(self, entry: Path, result: Any) -> None:
+        """Write a result and its metadata to the cache and keep the budget."""
+        entry.mkdir(parents=True, exist_ok=True)  # Unless evicted concurrently
+        _write_atomically(entry / OUTPUT_FILE, result)
+        _write_atomically(entry / METADATA_FILE, json.dumps(_describe(entry)))
+        if self.max_bytes is not None:
+            self.prune()
+
+
+def _write_atomically(path: Path, value: Any) -> None:
+    """Write text or a pickle to a temporary file first to not expose partial files."""
+    tmp = path.with_name(f".{os.getpid()}-{threading.get_ident()}-{path.name}")
+    if isinstance(value, str):
+        tmp.write_text(value, encoding="utf-8")
+    else:
+        joblib.dump(value, tmp)
+    os.replace(tmp, path)
+
+
+def _describe(entry: Path) -> dict[str, Any]:
+    """Describe a newly cached step by its size, access time, and number of hits."""
+    return {
+        "bytes": (entry / OUTPUT_FILE).stat().st_size,
+        "accessed": time.time(),
+        "hits": 0,
+        "path": str(entry),
+    }
+
+
+def _read_metadata(entry: Path) -> dict[str, Any] | None:
+    """Read the metadata of a step or None if it does not exist."""
+    try:
+        return json.loads((entry / METADATA_FILE).read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+
+
+@contextmanager
+def _lock(path: Path, timeout: float, poll_interval: float) -> Generator[None]:
+    """Hold a lock file that is created exclusively, also across processes.
+
+    The directory of the lock is created on demand, also if it was evicted while
+    waiting. Lock files older than the timeout, e.g. from killed processes, are
+    removed. On release, only the own lock is removed, not the one of another process
+    that considered it stale.
+    """
+    while True:
+        try:
+            fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            _remove_stale(path, timeout)
+            time.sleep(poll_interval)
+        except FileNotFoundError:  # Not created yet or evicted concurrently
+            path.parent.mkdir(parents=True, exist_ok=True)
+        else:
+            break
+    token = uuid.uuid4().hex  # Identifies the own lock, unlike a reused inode
+    os.write(fd, token.encode())
+    os.close(fd)
+    try:
+        yield
+    finally:
+        with suppress(FileNotFoundError):  # Removed as stale by another process
+            if path.read_text(encoding="utf-8") == token:
+                path.unlink()
+
+
+def _remove_stale(path: Path, timeout: float) -> None:
+    """Remove a lock file older than the timeout without removing a fresh one.
+
+    The lock is atomically moved aside before it is removed. If another process
+    replaced the stale lock by a fresh one in the meantime, the moved lock is put back
+    instead, unless the lock was created again already.
+    """
+    with suppress(FileNotFoundError):  # Released or removed concurrently
+        stale = path.stat()
+        if time.time() - stale.st_mtime <= timeout:
+            return
+        moved = path.with_name(f".{os.getpid()}-{threading.get_ident()}-{path.name}")
+        os.rename(path, moved)
+        if _identity(moved.stat()) == _identity(stale):
+            logger.warning("Remove stale lock %s", path)
+        else:
+            with suppress(FileExistsError):
+                os.link(moved, path)  # Put back without overwriting a new lock
+        moved.unlink()
+
+
+def _identity(stat: os.stat_result) -> tuple[int, int, int]:
+    """Identify a file by its device, inode, and modification time."""
+    return stat.st_dev, stat.st_ino, stat.st_mtime_ns
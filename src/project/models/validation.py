@@ -0,0 +1,124 @@
+"""Cross-validate pipelines with folds in parallel processes and cached on disk."""
+
+import logging
+import time
+from contextlib import nullcontext
+from dataclasses import dataclass, replace
+from typing import Any
+
+import joblib
+import pandas as pd
+from sklearn.base import clone
+from sklearn.model_selection import BaseCrossValidator
+from sklearn.pipeline import Pipeline
+from sklearn.utils.parallel import Parallel, delayed
+
+from ..util import limit_threads
+from .memory import TransformerMemory
+
+__all__ = [
+    "FoldResult",
+    "cross_validate",
+]
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class FoldResult:
+    """Score and timings in seconds of a fold."""
+
+    fold: int
+    score: float
+    fit_time: float
+    score_time: float
+    cached: bool = False
+
+
+def cross_validate(
+    model: Pipeline,
+    X: pd.DataFrame,
+    y: pd.Series,
+    cv: BaseCrossValidator,
+    *,
+    n_jobs: int = -1,
+    threads: int | None = None,
+    memory: TransformerMemory | None = None,
+) -> list[FoldResult]:
+    """Score clones of a pipeline on the folds of a cross-validator in parallel.
+
+    The folds run in separate processes. Large arrays, e.g. the features, are memory-
+    mapped by joblib and shared by all processes instead of copied into each. With a
+    memory, the results are cached by the fingerprint of the data, the parameters of
+    the pipeline, and the fold, such that re-runs skip the folds scored before.
+
+    Args:
+        model: Pipeline to clone for every fold.
+        X: Features.
+        y: Target.
+        cv: Cross-validator to split the data, e.g. `KFold`.
+        n_jobs: Maximum number of folds to run concurrently, or -1 for all cores.
+        threads: Number of threads of each fold, see `limit_threads`, or None to
+            leave them unlimited.
+        memory: Disk cache of the fold results, or None to score all folds.
+
+    Returns:
+        Results of all folds in the order of the cross-validator.
+    """
+    splits = list(cv.split(X, y))
+    n_jobs = min(joblib.effective_n_jobs(n_jobs), len(splits))
+    fingerprint = None  # Hashing all data is only worth it to look up results
+    if memory is not None:
+        fingerprint = joblib.hash((clone(model).set_params(memory=None), X, y))
+    logger.debug(f"Cross-validate {len(splits)} folds with {n_jobs} jobs")
+
+    # Propagates the Scikit-Learn config, e.g. pandas output, to the workers
+    return Parallel(n_jobs=n_jobs)(
+        delayed(_run_fold)(
+            clone(model), X, y, fold, train, test, fingerprint, threads, memory
+        )
+        for fold, (train, test) in enumerate(splits)
+    )
+
+
+def _run_fold(
+    model: Pipeline,
+    X: pd.DataFrame,
+    y: pd.Series,
+    fold: int,
+    train: Any,
+    test: Any,
+    fingerprint: str | None,
+    threads: int | None,
+    memory: TransformerMemory | None,
+) -> FoldResult:
+    """Score a fold with limited threads or read its result from the memory."""
+    with limit_threads(model, threads) if threads else nullcontext():
+        if memory is None:
+            return _fit_and_score(model, X, y, fold, train, test, fingerprint)
+
+        hits = memory.hits
+        fit_and_score = memory.cache(_fit_and_score, ignore=["model", "X", "y"])
+        result = fit_and_score(model, X, y, fold, train, test, fingerprint)
+    return replace(result, cached=memory.hits > hits)
+
+
+def _fit_and_score(
+    model: Pipeline,
+    X: pd.DataFrame,
+    y: pd.Series,
+    fold: int,
+    train: Any,
+    test: Any,
+    fingerprint: str | None,
+) -> FoldResult:
+    """Fit the model on the training split and score it on the test split.
+
+    The fingerprint of the data and the model identifies the result in the memory.
+    """
+    start = time.perf_counter()
+    model.fit(X.iloc[train], y.iloc[train])
+    fit_time = time.perf_counter() - start
+    score = model.score(X.iloc[test], y.iloc[test])
+    score_time = time.perf_counter() - start - fit_time
+    return FoldResult(fold, float(score), fit_time, score_time)
@@ -0,0 +1,95 @@
+"""Grow forests in stages to report intermediate scores while fitting."""
+
+import logging
+from typing import Any, Protocol
+
+from sklearn.pipeline import Pipeline
+
+__all__ = [
+    "Reporter",
+    "fit_warm_start",
+    "tree_stages",
+]
+
+logger = logging.getLogger(__name__)
+
+
+class Reporter(Protocol):
+    """Receiver of intermediate scores, e.g. an Optuna trial."""
+
+    def report(self, value: float, step: int) -> None:
+        """Report the score after a step."""
+        ...
+
+    def should_prune(self) -> bool:
+        """Whether to stop fitting after the last reported score."""
+        ...
+
+
+def tree_stages(n_estimators: int) -> list[int]:
+    """Numbers of trees after each stage of growing a forest.
+
+    The stages follow the 1-2-5 series, such that forests of different sizes report
+    their scores at the same numbers of trees and are comparable by pruners.
+
+    Args:
+        n_estimators: Final number of trees.
+
+    Returns:
+        Increasing numbers of trees ending with the final number.
+
+    Examples:
+        >>> tree_stages(500)
+        [10, 20, 50, 100, 200, 500]
+        >>> tree_stages(8)
+        [8]
+    """
+    series = [m * 10**e for e in range(1, len(str(n_estimators))) for m in (1, 2, 5)]
+    return [n for n in series if n < n_estimators] + [n_estimators]
+
+
+def fit_warm_start(
+    model: Pipeline, X: Any, y: Any, reporter: Reporter | None = None
+) -> bool:
+    """Fit a pipeline and grow its final forest in stages with `warm_start`.
+
+    The leading steps are fitted once. The forest then grows from the trees already
+    fitted, see `tree_stages`, and reports its out-of-bag score after each stage. Unlike
+    the score on the training data, it does not rise with every tree and is comparable
+    between trials. It stops early if the reporter prunes it, leaving a forest of fewer
+    trees. Without a reporter, or for final estimators without `warm_start` or without
+    `bootstrap`, and hence out-of-bag samples, the pipeline is fitted as usual.
+
+    Args:
+        model: Pipeline to fit in-place.
+        X: Features.
+        y: Target.
+        reporter: Receiver of the intermediate scores by number of trees.
+
+    Returns:
+        Whether fitting was stopped early.
+    """
+    forest = model[-1]
+    params = forest.get_params()
+    if reporter is None or "warm_start" not in params or not params.get("bootstrap"):
+        model.fit(X, y)
+        return False
+
+    Xt = X
+    if len(model) > 1:
+        head = model[:-1]
+        Xt = head.fit_transform(X, y)
+        model.steps[:-1] = head.steps  # Fitted steps are clones if the pipeline caches
+    forest.set_params(warm_start=True, oob_score=True)
+    try:
+        for n_estimators in tree_stages(params["n_estimators"]):
+            forest.set_params(n_estimators=n_estimators).fit(Xt, y)
+            reporter.report(forest.oob_score_, n_estimators)
+            if reporter.should_prune():
+                logger.info(f"Stop fitting at {n_estimators} trees")
+                return True
+    finally:
+        forest.set_params(
+            warm_start=params["warm_start"], oob_score=params["oob_score"]
+        )
+    return False
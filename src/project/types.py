@@ -4,6 +4,8 @@ from collections.abc import Mapping
 from datetime import date, datetime
 from typing import Annotated
 
+import pandas as pd
+import polars as pl
 from pydantic import AfterValidator
 from sklearn.pipeline import Pipeline
 from sklearn.utils.validation import check_is_fitted
@@ -12,6 +14,8 @@ SqlPrimitive = str | int | float | date | datetime
 SqlParam = SqlPrimitive | tuple[SqlPrimitive, ...]
 SqlParams = Mapping[str, SqlParam]
 
+RawData = pd.DataFrame | pl.LazyFrame  # Loaded with pandas or Polars
+
 FittedPipeline = Annotated[
     Pipeline,
     AfterValidator(lambda est: check_is_fitted(est) or est),
@@ -1,3 +1,16 @@
 """Utility functions and classes for all modules."""
 
-__all__ = []
+__all__ = [
+    "CpuBudget",
+    "limit_threads",
+    "map_threaded",
+    "parse_bytes",
+    "select_evicted",
+    "split_cores",
+    "write_parquet",
+]
+
+from .budget import CpuBudget, limit_threads, split_cores
+from .concurrent import map_threaded
+from .eviction import parse_bytes, select_evicted
+from .parquet import write_parquet
@@ -0,0 +1,88 @@
+"""Split the available cores between concurrent jobs, processes, and threads."""
+
+from collections.abc import Generator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any
+
+import joblib
+from sklearn.pipeline import Pipeline
+from threadpoolctl import threadpool_limits
+
+__all__ = [
+    "CpuBudget",
+    "limit_threads",
+    "split_cores",
+]
+
+
+@dataclass(frozen=True)
+class CpuBudget:
+    """Allocation of the cores to a job, its processes, and their threads.
+
+    Attributes:
+        jobs: Number of concurrent jobs, e.g. trials of a sweep, sharing all cores.
+        cores: Number of cores of one job, e.g. for the threads of fitting a model.
+        processes: Number of concurrent processes of one job, e.g. folds.
+        threads: Number of threads of each of these processes.
+    """
+
+    jobs: int
+    cores: int
+    processes: int
+    threads: int
+
+
+def split_cores(
+    jobs: int = 1, processes: int = 1, total: int | None = None
+) -> CpuBudget:
+    """Split the cores equally between concurrent jobs and then their processes.
+
+    Every job, process, and thread gets at least one core, such that the cores are
+    oversubscribed only if there are more jobs or processes than cores.
+
+    Args:
+        jobs: Number of concurrent jobs.
+        processes: Number of processes each job wants to run concurrently.
+        total: Number of available cores, or None to detect them. The detection
+            respects the CPU affinity and the quotas of containers.
+
+    Returns:
+        Allocation of the cores.
+
+    Examples:
+        >>> split_cores(jobs=8, processes=5, total=32)
+        CpuBudget(jobs=8, cores=4, processes=4, threads=1)
+        >>> split_cores(jobs=2, processes=5, total=32)
+        CpuBudget(jobs=2, cores=16, processes=5, threads=3)
+    """
+    total = total or joblib.cpu_count()
+    cores = max(1, total // jobs)
+    processes = max(1, min(processes, cores))
+    return CpuBudget(jobs, cores, processes, max(1, cores // processes))
+
+
+@contextmanager
+def limit_threads(estimator: Any, threads: int) -> Generator[None]:
+    """Limit the threads of an estimator and of the BLAS and OpenMP thread pools.
+
+    An unset `n_jobs` of the estimator, or of the final step of a pipeline, is set to
+    the number of threads while in the context. The thread pools of BLAS and OpenMP
+    are then limited to one thread, as each thread of the estimator would start its
+    own threads otherwise. Estimators without `n_jobs`, e.g. linear models, use all
+    threads in BLAS instead.
+
+    Args:
+        estimator: Scikit-Learn estimator or pipeline.
+        threads: Number of threads.
+    """
+    final = estimator[-1] if isinstance(estimator, Pipeline) else estimator
+    unset = final.get_params(deep=False).get("n_jobs", 0) is None
+    if unset:
+        final.set_params(n_jobs=threads)
+    try:
+        with threadpool_limits(limits=1 if unset else threads):
+            yield
+    finally:
+        if unset:
+            final.set_params(n_jobs=None)  # Do not persist the threads with the model
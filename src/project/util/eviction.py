@@ -0,0 +1,57 @@
+"""Keep disk caches within a byte budget by evicting their least valuable entries."""
+
+from typing import Literal
+
+import pandas as pd
+
+__all__ = [
+    "parse_bytes",
+    "select_evicted",
+]
+
+UNITS = {"": 1, "K": 1024, "M": 1024**2, "G": 1024**3, "T": 1024**4}
+
+
+def parse_bytes(size: str | int) -> int:
+    """Parse a size in bytes with an optional binary unit.
+
+    Args:
+        size: Number of bytes, optionally with a unit K, M, G, or T, e.g. "10G".
+
+    Returns:
+        Number of bytes.
+
+    Examples:
+        >>> parse_bytes("1.5G")
+        1610612736
+    """
+    text = str(size).strip().upper().removesuffix("B").removesuffix("I")
+    unit = text[-1:] if text[-1:] in UNITS else ""
+    return int(float(text.removesuffix(unit)) * UNITS[unit])
+
+
+def select_evicted(
+    entries: pd.DataFrame, max_bytes: int, policy: Literal["lru", "lfu"] = "lru"
+) -> pd.DataFrame:
+    """Select the entries to evict until the total size is within the budget.
+
+    The least recently used (LRU) or least frequently used (LFU) entries are evicted
+    first.
+
+    Args:
+        entries: Entries with their size "bytes", access time "accessed", and number
+            of "hits".
+        max_bytes: Budget for the total size of the kept entries.
+        policy: Eviction policy, either "lru" or "lfu".
+
+    Returns:
+        Entries to evict, the most valuable one first.
+
+    Examples:
+        >>> entries = pd.DataFrame({"bytes": [2, 2], "accessed": [1, 2], "hits": 0})
+        >>> select_evicted(entries, max_bytes=3)["accessed"].to_list()
+        [1]
+    """
+    order = ["accessed"] if policy == "lru" else ["hits", "accessed"]
+    entries = entries.sort_values(order, ascending=False, ignore_index=True)
+    return entries[entries["bytes"].cumsum() > max_bytes]
@@ -0,0 +1,26 @@
+"""Write pandas and Polars data to Parquet files alike."""
+
+from pathlib import Path
+
+import pandas as pd
+import polars as pl
+
+__all__ = [
+    "write_parquet",
+]
+
+
+def write_parquet(df: pd.DataFrame | pl.LazyFrame, path: str | Path) -> None:
+    """Write a DataFrame or LazyFrame to a zstd-compressed Parquet file.
+
+    The index of pandas DataFrames is not written. LazyFrames are streamed to the file
+    without collecting them first.
+
+    Args:
+        df: Data to write.
+        path: Path of the Parquet file.
+    """
+    if isinstance(df, pl.LazyFrame):
+        df.sink_parquet(path, compression="zstd")
+    else:
+        df.to_parquet(path, index=False, compression="zstd")
@@ -0,0 +1,51 @@
+import pytest
+from hydra.conf import HydraConf
+from hydra.core.hydra_config import HydraConfig
+from hydra.types import RunMode
+from omegaconf import OmegaConf
+
+from project.config import cpu_budget
+
+
+@pytest.fixture
+def hydra_config(monkeypatch):
+    """Set the Hydra config of a job for the duration of a test on eight cores."""
+    monkeypatch.setattr("joblib.cpu_count", lambda: 8)
+
+    def set_config(mode, launcher, sweeper):
+        cfg = OmegaConf.create({"hydra": OmegaConf.structured(HydraConf)})
+        cfg.hydra.mode = mode
+        cfg.hydra.launcher = launcher
+        cfg.hydra.sweeper = sweeper
+        HydraConfig.instance().set_config(cfg)
+
+    yield set_config
+    HydraConfig.instance().cfg = None
+
+
+def test_cpu_budget_gives_all_cores_outside_of_hydra(monkeypatch):
+    """Functions called directly are the only job."""
+    monkeypatch.setattr("joblib.cpu_count", lambda: 8)
+
+    assert cpu_budget(processes=2).cores == 8
+
+
+@pytest.mark.parametrize(
+    ("mode", "launcher", "sweeper", "expected"),
+    [
+        (RunMode.RUN, {"n_jobs": 4}, {}, 1),
+        (RunMode.MULTIRUN, {}, {}, 1),
+        (RunMode.MULTIRUN, {"n_jobs": 4}, {}, 4),
+        (RunMode.MULTIRUN, {"n_jobs": 4}, {"n_jobs": 2}, 2),
+    ],
+)
+def test_cpu_budget_splits_cores_between_concurrent_jobs(
+    hydra_config, mode, launcher, sweeper, expected
+):
+    """Only jobs of the joblib launcher run concurrently, limited by the sweeper."""
+    hydra_config(mode, launcher, sweeper)
+
+    budget = cpu_budget()
+
+    assert budget.jobs == expected
+    assert budget.cores == 8 // expected
@@ -0,0 +1,234 @@
+import optuna
+import pandas as pd
+import pytest
+from hydra.core.utils import JobReturn, JobStatus
+from omegaconf import OmegaConf
+from optuna.trial import TrialState
+
+from project.config import (
+    OptunaTrialCallback,
+    PrunedTrialStorage,
+    SharedDataCallback,
+    current_trial,
+)
+from project.data import ENV_VAR_SHARED_DATA, attach_shared_data, collect_load_metrics
+from project.data.load.metrics import measure
+
+
+@pytest.fixture(name="study")
+def _study(mocker):
+    """Study of a sweep in an in-memory storage that records pruned trials."""
+    storage = PrunedTrialStorage(optuna.storages.InMemoryStorage())
+    mocker.patch("optuna.storages.get_storage", return_value=storage)
+    return optuna.create_study(study_name="study", storage=storage)
+
+
+def make_config(params, job=0):
+    """Config of a job of the Optuna sweeper with the overrides of its parameters."""
+    return OmegaConf.create(
+        {
+            "hydra": {
+                "sweeper": {"study_name": "study", "storage": {"url": "sqlite://"}},
+                "overrides": {"task": [f"{k}={v}" for k, v in params.items()]},
+                "job": {"id": f"job_id_for_{job}", "num": job},
+            }
+        }
+    )
+
+
+def ask(study, x):
+    """Ask for a trial with the given parameter like the sweeper."""
+    study.enqueue_trial({"x": x})
+    trial = study.ask()
+    trial.suggest_float("x", 0, 1)
+    return trial
+
+
+def run_job(callback, config, func):
+    """Run a job between the callbacks like the launcher and return its result."""
+    callback.on_job_start(config, task_function=func)
+    job_return = JobReturn(status=JobStatus.COMPLETED)
+    try:
+        job_return.return_value = func(current_trial())
+    except Exception as e:
+        job_return.status, job_return.return_value = JobStatus.FAILED, e
+    callback.on_job_end(config, job_return)
+    return job_return
+
+
+def test_current_trial_is_none_outside_of_sweeps():
+    """Jobs not connected to an Optuna trial do not report scores."""
+    assert current_trial() is None
+
+
+def test_optuna_trial_callback_connects_jobs_to_trials_by_parameters(study):
+    """Each job gets the running trial with its parameters, not one of another sweep."""
+    ask(study, 0.5)  # E.g. of a concurrent sweep of the same study
+    trials = [ask(study, 0.25), ask(study, 0.25), ask(study, 0.75)]
+    callback = OptunaTrialCallback()
+    callback.on_multirun_start(make_config({}))
+
+    actual = [
+        run_job(callback, make_config({"x": trial.params["x"]}, job), lambda t: t)
+        for job, trial in enumerate(reversed(trials))
+    ]
+
+    numbers = [job_return.return_value.number for job_return in actual]
+    assert numbers == [3, 1, 2]
+    assert current_trial() is None
+
+
+def test_optuna_trial_callback_records_pruned_trials_without_value(study):
+    """Pruned jobs are completed for the sweeper, but recorded as pruned."""
+    pruned, completed = ask(study, 0.25), ask(study, 0.75)
+    callback = OptunaTrialCallback()
+    callback.on_multirun_start(make_config({}))
+
+    def prune(trial):
+        trial.report(0.5, step=0)  # Intermediate score, e.g. out-of-bag
+        raise optuna.TrialPruned
+
+    returns = [
+        run_job(callback, make_config(pruned.params, 0), prune),
+        run_job(callback, make_config(completed.params, 1), lambda t: 0.9),
+    ]
+    for trial, job_return in zip([pruned, completed], returns):  # Like the sweeper
+        study.tell(trial, [float(job_return.return_value)])
+
+    assert [job_return.status for job_return in returns] == [JobStatus.COMPLETED] * 2
+    assert [trial.state for trial in study.trials] == [
+        TrialState.PRUNED,
+        TrialState.COMPLETE,
+    ]
+    assert [trial.value for trial in study.trials] == [None, 0.9]
+    assert study.best_trial.number == completed.number
+
+
+def test_optuna_trial_callback_keeps_failed_jobs_failed(study):
+    """Jobs failing for other reasons than pruning are left to the sweeper."""
+    trial = ask(study, 0.25)
+    callback = OptunaTrialCallback()
+    callback.on_multirun_start(make_config({}))
+
+    def fail(trial):
+        raise ValueError
+
+    actual = run_job(callback, make_config(trial.params), fail)
+
+    assert actual.status == JobStatus.FAILED
+    assert current_trial() is None
+
+
+def test_optuna_trial_callback_ignores_jobs_without_trial(study):
+    """Jobs of parameters without a running trial, e.g. reruns, are not connected."""
+    ask(study, 0.25)
+    callback = OptunaTrialCallback()
+    callback.on_multirun_start(make_config({}))
+
+    actual = run_job(callback, make_config({"x": 0.5}), lambda t: t)
+
+    assert actual.return_value is None
+    assert study.trials[0].user_attrs == {}  # Not claimed
+
+
+def test_optuna_trial_callback_ignores_sweeps_without_study(study):
+    """Without a named study in a storage, jobs are not connected to trials."""
+    ask(study, 0.25)
+    callback = OptunaTrialCallback()
+    callback.on_multirun_start(OmegaConf.create({"hydra": {"sweeper": {}}}))
+
+    actual = run_job(callback, make_config({"x": 0.25}), lambda t: t)
+
+    assert actual.return_value is None
+
+
+def load_raw(params):
+    """Load raw data of the dates of the parameters, measured like a query."""
+    with measure("target", cached=False) as metrics:
+        dates = pd.date_range(params["start_date"], params["end_date"])
+        raw = pd.DataFrame({"date": dates, "target": range(len(dates))})
+        metrics.record(raw)
+    return raw
+
+
+def process_raw(raw):
+    """Split raw data into features and target."""
+    return raw[["date"]], raw["target"].astype("float64")
+
+
+def make_data_config(sweep_dir, training_cutoff="2026-01-10", data=True):
+    """Config of a job of a multi-run with the data config of the training."""
+    config = {"hydra": {"sweep": {"dir": str(sweep_dir)}}}
+    if data:
+        config |= {
+            "dataloader": {"_target_": f"{__name__}.load_raw", "_partial_": True},
+            "dataprocessor": {"_target_": f"{__name__}.process_raw", "_partial_": True},
+            "training_cutoff": training_cutoff,
+            "num_samples": 5,
+        }
+    return OmegaConf.create(config)
+
+
+@pytest.fixture(name="shared_callback")
+def _shared_callback(monkeypatch, tmp_path):
+    """Callback that shares the data of the multi-run from its start."""
+    monkeypatch.delenv(ENV_VAR_SHARED_DATA, raising=False)
+    callback = SharedDataCallback()
+    callback.on_multirun_start(make_data_config(tmp_path))
+    return callback
+
+
+def test_shared_data_callback_shares_artifacts_of_unshared_jobs(
+    shared_callback, tmp_path
+):
+    """Attached jobs get the same data, raw data, and load metrics as if they loaded."""
+    params = {"start_date": "2026-01-06", "end_date": "2026-01-10"}
+    with collect_load_metrics() as expected_metrics:  # Like an unshared job
+        raw = load_raw(params)
+        X, y = process_raw(raw)
+
+    shared_callback.on_job_start(make_data_config(tmp_path), task_function=print)
+    actual = attach_shared_data()
+
+    assert actual.X.equals(X)
+    assert actual.y.equals(y)
+    assert pd.read_parquet(actual.raw_path).equals(raw)
+    expected = expected_metrics.summary()
+    assert actual.load_metrics.keys() == expected.keys()
+    assert actual.load_metrics["load.target.rows"] == expected["load.target.rows"] == 5
+
+
+def test_shared_data_callback_lets_jobs_of_other_data_load_on_their_own(
+    shared_callback, tmp_path
+):
+    """Jobs that override the data config, e.g. the training cutoff, do not attach."""
+    config = make_data_config(tmp_path, training_cutoff="2026-01-11")
+
+    shared_callback.on_job_start(config, task_function=print)
+
+    assert attach_shared_data() is None
+
+
+def test_shared_data_callback_detaches_jobs_and_removes_data(shared_callback, tmp_path):
+    """The environment is reset after each job and the files after all jobs."""
+    config = make_data_config(tmp_path)
+    shared_callback.on_job_start(config, task_function=print)
+
+    shared_callback.on_job_end(config, JobReturn(status=JobStatus.COMPLETED))
+    assert attach_shared_data() is None
+    shared_callback.on_multirun_end(config)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_shared_data_callback_ignores_multiruns_without_data(monkeypatch, tmp_path):
+    """Multi-runs of tasks without data config, e.g. predictions, share nothing."""
+    monkeypatch.delenv(ENV_VAR_SHARED_DATA, raising=False)
+    callback = SharedDataCallback()
+    config = make_data_config(tmp_path, data=False)
+
+    callback.on_multirun_start(config)
+    callback.on_job_start(config, task_function=print)
+    callback.on_multirun_end(config)
+
+    assert attach_shared_data() is None
+    assert list(tmp_path.iterdir()) == []
@@ -1,7 +1,12 @@
+import asyncio
+
 from dirty_equals import IsInstance
-from sqlalchemy import Engine
+from inline_snapshot import snapshot
+from sqlalchemy import Engine, QueuePool
+from sqlalchemy.ext.asyncio import AsyncEngine
 
 from project.config import make_db_engine
+from project.config.stores.db_store import create_engine
 
 
 def test_db_store_supplies_engine():
@@ -9,3 +14,51 @@ def test_db_store_supplies_engine():
     actual = make_db_engine("memory")
     assert actual == IsInstance(Engine)
     actual.dispose()
+
+
+def test_db_store_supplies_async_engine():
+    """The asyncio entries of the store supply an SQLAlchemy AsyncEngine object."""
+    actual = make_db_engine("memory_async")
+    assert IsInstance(AsyncEngine) == actual  # AsyncEngine compares by its engine
+    asyncio.run(actual.dispose())
+
+
+def test_create_engine_applies_pool_and_execution_options(tmp_path):
+    """Pool sizes, execution options, and the cache size are passed to the engine."""
+    actual = create_engine(
+        f"sqlite:///{tmp_path / 'db.sqlite'}",
+        pool_size=3,
+        max_overflow=1,
+        pool_timeout=5,
+        pool_pre_ping=True,
+        execution_options={"stream_results": True},
+        connect_args={"timeout": 1},
+        query_cache_size=10,
+    )
+
+    assert actual.pool.size() == 3
+    assert actual.pool._max_overflow == 1
+    assert actual.pool._pre_ping
+    assert actual._compiled_cache.capacity == 10
+    assert actual.get_execution_options() == snapshot({"stream_results": True})
+    actual.dispose()
+
+
+def test_create_engine_warms_up_connections(tmp_path):
+    """Warmed-up connections are open and returned to the pool."""
+    actual = create_engine(f"sqlite:///{tmp_path / 'db.sqlite'}", warm_up=2)
+
+    assert actual.pool.checkedin() == 2
+    assert actual.pool.checkedout() == 0
+    actual.dispose()
+
+
+def test_db_store_supplies_file_engine_with_connection_pool(tmp_path, monkeypatch):
+    """The file-based sqlite engine pools connections for concurrent queries."""
+    monkeypatch.chdir(tmp_path)  # The database is created in the working directory
+
+    actual = make_db_engine("file")
+
+    assert actual == IsInstance(Engine)
+    assert actual.pool == IsInstance(QueuePool)
+    actual.dispose()
@@ -0,0 +1,113 @@
+import asyncio
+
+import pandas as pd
+import pandera.pandas as pa
+import pytest
+from dirty_equals import IsList
+from frozendict import frozendict
+from pandas.errors import MergeError
+from pandera.pandas import Field as F
+from pandera.typing.pandas import Series as S
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine
+from structlog.contextvars import get_contextvars
+
+from project.data import afetch_data, collect_load_metrics, fetch_data
+
+fetch_data_uncached = getattr(fetch_data, "uncached", None) or fetch_data
+
+SQL_QUERIES = frozendict(
+    {
+        "index": "SELECT * FROM identifier WHERE id in :valid_ids",
+        "features": "SELECT * FROM feature",
+        "target": "SELECT * FROM target",
+    }
+)
+
+
+class RawDataModel(pa.DataFrameModel):
+    id: S[pa.Int64]
+    date: S[pa.Timestamp]
+    feature: S[pd.Int64Dtype] = F(nullable=True, coerce=True)  # Nullable integer
+    target: S[pd.Int64Dtype] = F(nullable=True, coerce=True)
+
+
+@pytest.fixture(name="url")
+def _url(tmp_path):
+    """Fill a file data base with dummy data and return its URL without driver."""
+    url = f"sqlite:///{tmp_path / 'db.sqlite'}"
+    engine = create_engine(url)
+
+    data = pd.DataFrame(
+        {
+            "id": [1, 2, 3, 4],
+            "date": pd.date_range("2026-01-01", "2026-01-04"),
+            "feature": [42, 43, 44, 45],
+            "target": [0, 1, 2, 3],
+        }
+    )
+    data[["id", "date"]].to_sql("identifier", engine, index=False)
+    data.loc[[0, 1], ["id", "date", "feature"]].to_sql("feature", engine, index=False)
+    data.loc[[0, 1, 3], ["id", "date", "target"]].to_sql("target", engine, index=False)
+    engine.dispose()
+    return url
+
+
+def afetch(url, sql_queries=SQL_QUERIES, context=None, **kwargs):
+    """Run afetch_data on an aiosqlite engine in a new event loop."""
+
+    async def main():
+        """Fetch the data, copy the logging context, and dispose of the engine."""
+        engine = create_async_engine(url.replace("sqlite", "sqlite+aiosqlite", 1))
+        try:
+            return await afetch_data(
+                {"valid_ids": (1, 2, 4)}, engine, sql_queries, **kwargs
+            )
+        finally:
+            if context is not None:
+                context.update(get_contextvars())
+            await engine.dispose()
+
+    return asyncio.run(main())
+
+
+@pytest.mark.parametrize("reader", ["pandas", "arrow"])
+def test_afetch_data_equals_synchronous_result(url, reader):
+    """The asyncio version returns the same validated data as fetch_data."""
+    engine = create_engine(url)
+    expected = fetch_data_uncached(
+        {"valid_ids": (1, 2, 4)}, engine, SQL_QUERIES, data_model=RawDataModel
+    )
+    engine.dispose()
+
+    actual = afetch(url, data_model=RawDataModel, reader=reader)
+
+    pd.testing.assert_frame_equal(actual, expected)
+
+
+def test_afetch_data_collects_metrics_per_query(url):
+    """Every query is measured like in fetch_data."""
+    with collect_load_metrics() as metrics:
+        afetch(url, data_model=RawDataModel)
+
+    actual = sorted(m.query for m in metrics.queries)
+    assert actual == IsList("features", "index", "target")
+
+
+def test_afetch_data_unbinds_logging_context(url):
+    """Neither the query names nor the parameters remain bound for the caller."""
+    context = {}
+
+    afetch(url, context=context, data_model=RawDataModel)
+
+    assert context == {}
+
+
+def test_afetch_data_raises_on_merge_validation(url):
+    """Duplicated identifiers must fail the one-to-one join."""
+    sql_queries = SQL_QUERIES | {
+        "target": "SELECT * FROM target UNION ALL SELECT * FROM target"
+    }
+
+    with pytest.raises(MergeError):
+        afetch(url, sql_queries, data_model=RawDataModel)
@@ -0,0 +1,271 @@
+from itertools import count
+
+import pandas as pd
+import pytest
+from dirty_equals import IsPositive, IsStr
+from inline_snapshot import snapshot
+from joblib import expires_after
+
+from project.data.load.cache import ArrowBackend, FrameMemory, ParquetBackend
+from project.util import parse_bytes
+
+
+@pytest.fixture(name="df")
+def _df() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "id": pd.array([1, None], dtype=pd.Int64Dtype()),
+            "date": pd.to_datetime(["2026-01-01", "2026-01-02"]).tz_localize("UTC"),
+            "flt": pd.array([1.5, None], dtype=pd.Float32Dtype()),
+            "flag": pd.array([True, None], dtype=pd.BooleanDtype()),
+            "cat": pd.Categorical(["a", None], categories=["a", "b"]),
+        }
+    )
+
+
+@pytest.mark.parametrize(
+    "backend",
+    [
+        pytest.param(ParquetBackend(), id="parquet"),
+        pytest.param(ArrowBackend(), id="arrow"),
+        pytest.param(ArrowBackend(compression=None), id="arrow_uncompressed"),
+    ],
+)
+def test_cache_returns_identical_dataframe(tmp_path, mocker, df, backend):
+    """Cached DataFrames must be restored with all data types and categories."""
+    func = mocker.Mock(return_value=df)
+    func.__module__, func.__qualname__ = "module", "func"
+    cached = FrameMemory(tmp_path, backend=backend).cache(func)
+
+    first = cached(1)
+    actual = cached(1)
+
+    pd.testing.assert_frame_equal(actual, df)
+    assert first is df
+    func.assert_called_once_with(1)
+
+
+def test_cache_ignores_selected_arguments(tmp_path, df):
+    """Arguments that do not change the result, e.g. connections, are ignored."""
+    calls = []
+
+    @FrameMemory(tmp_path).cache(ignore=["con"])
+    def func(x: int, con: object = None) -> pd.DataFrame:
+        calls.append((x, con))
+        return df
+
+    func(1, con="a")
+    func(1, con="b")
+    func(2, con="c")
+
+    assert calls == snapshot([(1, "a"), (2, "c")])
+
+
+@pytest.mark.parametrize(
+    "backend",
+    [
+        pytest.param(ParquetBackend(), id="parquet"),
+        pytest.param(ArrowBackend(), id="arrow"),
+    ],
+)
+def test_cache_recomputes_entries_evicted_while_reading(tmp_path, mocker, df, backend):
+    """Entries removed by another process after reading their metadata are a miss."""
+    memory = FrameMemory(tmp_path, backend=backend)
+    func = mocker.Mock(return_value=df)
+    func.__module__, func.__qualname__ = "module", "func"
+    cached = memory.cache(func)
+    cached(1)
+    (path,) = tmp_path.rglob(f"data{backend.suffix}")
+    path.unlink()  # The metadata is still read
+
+    actual = cached(1)
+
+    pd.testing.assert_frame_equal(actual, df)
+    assert func.call_count == 2
+    assert path.exists()
+    assert (memory.stats.hits, memory.stats.misses) == (0, 2)
+
+
+def test_cache_refreshes_invalid_entries(tmp_path, df):
+    """Entries can be invalidated by their metadata, e.g. after expiry."""
+    calls = []
+
+    @FrameMemory(tmp_path).cache(cache_validation_callback=expires_after(seconds=0))
+    def func() -> pd.DataFrame:
+        calls.append(None)
+        return df
+
+    func()
+    func()
+
+    assert len(calls) == 2
+
+
+def test_cache_reuses_entries_until_watermark_moves(tmp_path, df):
+    """Entries are cached per watermark and refreshed once it changes."""
+    calls, state = [], {"updated": 1}
+
+    @FrameMemory(tmp_path).cache(watermark=lambda x: state["updated"])
+    def func(x: int) -> pd.DataFrame:
+        calls.append((x, state["updated"]))
+        return df
+
+    func(1)
+    func(1)
+    state["updated"] = 2
+    func(1)
+    func(1)
+
+    assert calls == snapshot([(1, 1), (1, 2)])
+
+
+def test_cache_clear_removes_all_entries_of_function(tmp_path, df):
+    """The cache can be purged with `func.clear()`."""
+    memory = FrameMemory(tmp_path)
+    calls = []
+
+    @memory.cache
+    def func() -> pd.DataFrame:
+        calls.append(None)
+        return df
+
+    func()
+    func.clear()
+    func.clear()  # No error on empty cache
+    func()
+
+    assert len(calls) == 2
+    assert func.uncached() is df
+
+
+def test_manifest_lists_entries_with_metadata(tmp_path, df):
+    """The manifest provides an overview of the cached data."""
+    memory = FrameMemory(tmp_path)
+
+    @memory.cache(ignore=["con"])
+    def func(params: dict, query: str, con: object, model: type = int) -> pd.DataFrame:
+        return df
+
+    func({"start_date": pd.Timestamp("2026-01-01"), "ids": (1, 2)}, "SELECT 1", None)
+    func({}, "SELECT * FROM table WHERE " + "x = 1 AND " * 10 + "TRUE", None, str)
+
+    actual = memory.manifest()
+
+    assert actual.to_dict("records") == [
+        {
+            "function": IsStr(regex=r".*\.func"),
+            "arguments": {
+                "params": {"start_date": "2026-01-01T00:00:00", "ids": [1, 2]},
+                "query": "SELECT 1",
+                "model": "builtins.int",
+            },
+            "rows": 2,
+            "columns": 5,
+            "bytes": IsPositive,
+            "watermark": None,
+            "created": IsStr,
+            "time": IsPositive,
+            "accessed": IsPositive,
+            "hits": 0,
+            "path": IsStr,
+        },
+        {
+            "function": IsStr(regex=r".*\.func"),
+            "arguments": {
+                "params": {},
+                "query": IsStr(regex="^[0-9a-f]{32}$"),
+                "model": "builtins.str",
+            },
+            "rows": 2,
+            "columns": 5,
+            "bytes": IsPositive,
+            "watermark": None,
+            "created": IsStr,
+            "time": IsPositive,
+            "accessed": IsPositive,
+            "hits": 0,
+            "path": IsStr,
+        },
+    ]
+
+
+def test_manifest_is_empty_for_new_cache(tmp_path):
+    """An empty cache must not fail to list its entries."""
+    actual = FrameMemory(tmp_path).manifest()
+    assert actual.empty
+
+
+def test_cache_collects_statistics(tmp_path, df):
+    """Hits, misses, and bytes served from the cache are counted."""
+    memory = FrameMemory(tmp_path)
+
+    @memory.cache
+    def func(x: int) -> pd.DataFrame:
+        return df
+
+    func(1)
+    func(1)
+    func(1)
+    func(2)
+
+    assert memory.stats.hits == 2
+    assert memory.stats.misses == 2
+    assert memory.stats.hit_rate == 0.5
+    assert memory.stats.bytes_read == memory.stats.bytes_written  # Same size
+    assert memory.stats.bytes_saved == 2 * df.memory_usage(deep=True).sum()
+    assert memory.manifest()["hits"].to_list() == [2, 0]
+
+
+def test_cache_statistics_without_calls(tmp_path):
+    """The hit rate of an unused cache must not fail."""
+    assert FrameMemory(tmp_path).stats.hit_rate == 0
+
+
+@pytest.mark.parametrize(
+    ("policy", "expected"),
+    [
+        pytest.param("lru", [2, 3], id="lru"),
+        pytest.param("lfu", [1, 3], id="lfu"),
+    ],
+)
+def test_cache_evicts_entries_over_budget(tmp_path, mocker, df, policy, expected):
+    """New entries evict the least recently or least frequently used entries."""
+    mocker.patch("project.data.load.cache.time.time", side_effect=count(1))
+    memory = FrameMemory(tmp_path, policy=policy)
+
+    @memory.cache
+    def func(x: int) -> pd.DataFrame:
+        return df
+
+    func(1)
+    size = memory.manifest()["bytes"].sum()
+    memory.max_bytes = 2 * size
+    func(1)
+    func(1)
+    func(2)
+    func(3)  # Exceeds the budget
+
+    actual = sorted(memory.manifest()["arguments"].str["x"])
+
+    assert actual == expected
+    assert memory.stats.evictions == 1
+
+
+def test_prune_evicts_entries_to_given_budget(tmp_path, df):
+    """The cache can be pruned to any budget, clearing it with a budget of zero."""
+    memory = FrameMemory(tmp_path, max_bytes=parse_bytes("1G"))
+
+    @memory.cache
+    def func(x: int) -> pd.DataFrame:
+        return df
+
+    func(1)
+    func(2)
+
+    first = memory.prune()
+    second = memory.prune("0")
+
+    assert first.empty
+    assert len(second) == 2
+    assert memory.manifest().empty
+    assert memory.prune().empty
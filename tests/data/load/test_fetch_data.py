@@ -1,16 +1,21 @@
+from datetime import date
+
 import pandas as pd
 import pandera.pandas as pa
 import pytest
-from dirty_equals import IsList
+from dirty_equals import IsDict, IsList, IsPositive
 from frozendict import frozendict
 from inline_snapshot import snapshot
 from pandas.errors import MergeError
 from pandera.errors import SchemaError
 from pandera.pandas import Field as F
 from pandera.typing.pandas import Series as S
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
+from structlog.contextvars import get_contextvars
 
-from project.data import fetch_data
+from project.data import collect_load_metrics, fetch_data
+from project.data.load import core
+from project.data.load.cache import FrameMemory
 
 fetch_data_uncached = getattr(fetch_data, "uncached", None) or fetch_data
 
@@ -46,6 +51,17 @@ def _engine():
     engine.dispose()
 
 
+@pytest.fixture(name="cached_periods")
+def _cached_periods(mocker, tmp_path):
+    """Cache the periods of all queries in a temporary cache instead of the user's."""
+    read_period = FrameMemory(location=tmp_path).cache(
+        core.read_period.uncached,
+        ignore=["name", "db_engine", "read_sql"],
+        watermark=core._probe_period,
+    )
+    mocker.patch.object(core, "read_period", read_period)
+
+
 def test_fetch_data_parametrizes_queries_correctly(engine):
     """Expanded and missing parameters must be handled correctly in SQL queries."""
     sql_queries = frozendict(
@@ -184,3 +200,404 @@ def test_fetch_data_raises_on_incorrect_data_type_during_data_model_validation(e
             sql_queries=sql_queries,
             data_model=RawDataModel,
         )
+
+
+def test_fetch_data_concurrently_equals_sequential_result(tmp_path, mocker):
+    """Concurrent queries return the same data and log with their own query names."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'db.sqlite'}")
+    data = pd.DataFrame(
+        {
+            "id": [1, 2, 3],
+            "date": pd.date_range("2026-01-01", "2026-01-03"),
+            "feature": [42, 43, 44],
+            "target": [0, 1, 2],
+        }
+    )
+    data.to_sql("data", engine, index=False)
+    sql_queries = frozendict(
+        {
+            "index": "SELECT id, date FROM data",
+            "features": "SELECT id, date, feature FROM data",
+            "target": "SELECT id, date, target FROM data",
+        }
+    )
+    read_sql = pd.read_sql
+    query_names = {}
+
+    def read_sql_logged(stmt, *args, **kwargs):
+        query_names[str(stmt)] = get_contextvars()["query_name"]
+        return read_sql(stmt, *args, **kwargs)
+
+    mocker.patch.object(pd, "read_sql", read_sql_logged)
+
+    sequential = fetch_data_uncached(
+        params={},
+        db_engine=engine,
+        sql_queries=sql_queries,
+        data_model=RawDataModel,
+    )
+    concurrent = fetch_data_uncached(
+        params={},
+        db_engine=engine,
+        sql_queries=sql_queries,
+        data_model=RawDataModel,
+        max_workers=2,
+    )
+
+    pd.testing.assert_frame_equal(concurrent, sequential)
+    assert query_names == {query: name for name, query in sql_queries.items()}
+    engine.dispose()
+
+
+def test_fetch_data_reads_into_arrow_with_same_result(engine):
+    """The Arrow reader must not change the validated data."""
+    sql_queries = frozendict(
+        {
+            "index": "SELECT * FROM identifier",
+            "features": "SELECT * FROM feature",
+            "target": "SELECT * FROM target",
+        }
+    )
+    expected = fetch_data_uncached(
+        params={},
+        db_engine=engine,
+        sql_queries=sql_queries,
+        data_model=RawDataModel,
+    )
+
+    actual = fetch_data_uncached(
+        params={},
+        db_engine=engine,
+        sql_queries=sql_queries,
+        data_model=RawDataModel,
+        reader="arrow",
+    )
+
+    pd.testing.assert_frame_equal(actual, expected)
+
+
+@pytest.mark.usefixtures("cached_periods")
+def test_fetch_data_only_fetches_missing_periods_when_partitioned(engine, mocker):
+    """Shifted date ranges reuse the cached periods and only fetch the others."""
+    read_query = mocker.spy(core, "read_query")
+    where = "WHERE date(date) BETWEEN :start_date AND :end_date"
+    sql_queries = frozendict(
+        {
+            "index": f"SELECT * FROM identifier {where}",
+            "features": f"SELECT * FROM feature {where}",
+            "target": f"SELECT * FROM target {where}",
+        }
+    )
+    kwargs = dict(db_engine=engine, sql_queries=sql_queries, data_model=RawDataModel)
+    params = {"start_date": date(2026, 1, 2), "end_date": date(2026, 1, 4)}
+    fetch_data_uncached(
+        params={"start_date": date(2026, 1, 1), "end_date": date(2026, 1, 3)},
+        partition="D",
+        **kwargs,
+    )
+    expected = fetch_data_uncached(params=params, **kwargs)
+    read_query.reset_mock()
+
+    actual = fetch_data_uncached(params=params, partition="D", **kwargs)
+
+    pd.testing.assert_frame_equal(actual, expected)
+    fetched = {str(call.args[2]["start_date"]) for call in read_query.call_args_list}
+    assert fetched == snapshot({"2026-01-03", "2026-01-04"})
+    assert read_query.call_count == 6
+
+
+@pytest.mark.usefixtures("cached_periods")
+@pytest.mark.parametrize("split", [{"partition": "D"}, {"shard_size": 1}])
+def test_fetch_data_in_periods_or_shards_keeps_order_of_index(tmp_path, split):
+    """Rows of all splits are in the order of the identifiers, not of the splits."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'data.db'}")
+    dates = pd.to_datetime(["2026-01-01", "2026-01-02"] * 2)
+    data = pd.DataFrame({"id": [1, 1, 2, 2], "date": dates, "feature": 1, "target": 0})
+    data[["id", "date"]].to_sql("identifier", engine, index=False)
+    data[["id", "date", "feature"]].to_sql("feature", engine, index=False)
+    data[["id", "date", "target"]].to_sql("target", engine, index=False)
+    where = (
+        "WHERE date(date) IN :dates AND date(date) BETWEEN :start_date AND :end_date"
+    )
+    kwargs = dict(
+        params={
+            "dates": ("2026-01-01", "2026-01-02"),
+            "start_date": date(2026, 1, 1),
+            "end_date": date(2026, 1, 2),
+        },
+        db_engine=engine,
+        sql_queries=frozendict(
+            {
+                "index": f"SELECT * FROM identifier {where} ORDER BY id, date",
+                "features": f"SELECT * FROM feature {where}",
+                "target": f"SELECT * FROM target {where}",
+            }
+        ),
+        data_model=RawDataModel,
+    )
+    expected = fetch_data_uncached(**kwargs)
+
+    actual = fetch_data_uncached(**split, **kwargs)
+
+    pd.testing.assert_frame_equal(actual, expected)
+    assert actual["id"].to_list() == [1, 1, 2, 2]
+    engine.dispose()
+
+
+@pytest.mark.usefixtures("cached_periods")
+def test_fetch_data_refetches_only_periods_with_moved_watermark(mocker, tmp_path):
+    """Cached periods are reused until their watermark moves, including the latest."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'data.db'}")
+    dates = pd.date_range("2026-01-01", "2026-01-03")
+    data = pd.DataFrame({"id": [1, 2, 3], "date": dates, "feature": 1, "target": 0})
+    data[["id", "date"]].to_sql("identifier", engine, index=False)
+    data[["id", "date", "feature"]].to_sql("feature", engine, index=False)
+    data[["id", "date", "target"]].to_sql("target", engine, index=False)
+    updates = pd.DataFrame({"date": dates.strftime("%Y-%m-%d"), "updated_at": 1})
+    updates.to_sql("updates", engine, index=False)
+
+    read_query = mocker.spy(core, "read_query")
+    where = "WHERE date(date) BETWEEN :start_date AND :end_date"
+    kwargs = dict(
+        params={"start_date": date(2026, 1, 1), "end_date": date(2026, 1, 3)},
+        db_engine=engine,
+        sql_queries=frozendict(
+            {
+                "index": f"SELECT * FROM identifier {where}",
+                "feature": f"SELECT * FROM feature {where}",
+                "target": f"SELECT * FROM target {where}",
+            }
+        ),
+        data_model=RawDataModel,
+        partition="D",
+        watermarks=frozendict(
+            {"target": f"SELECT max(updated_at) FROM updates {where}"}
+        ),
+    )
+
+    def fetched_periods() -> list[tuple[str, str]]:
+        read_query.reset_mock()
+        fetch_data_uncached(**kwargs)
+        calls = read_query.call_args_list
+        return sorted((c.args[0], str(c.args[2]["start_date"])) for c in calls)
+
+    first = fetched_periods()
+    unchanged = fetched_periods()
+    with engine.begin() as conn:
+        conn.execute(
+            text("UPDATE updates SET updated_at = 2 WHERE date = '2026-01-02'")
+        )
+    updated = fetched_periods()
+
+    assert len(first) == 9
+    assert unchanged == snapshot([("feature", "2026-01-03"), ("index", "2026-01-03")])
+    assert updated == snapshot(
+        [("feature", "2026-01-03"), ("index", "2026-01-03"), ("target", "2026-01-02")]
+    )
+    engine.dispose()
+
+
+def test_fetch_data_probes_watermarks_of_requested_queries(engine):
+    """The whole data is cached by the watermarks of its queries, if there are any."""
+    params = {"start_date": "2026-01-01", "end_date": "2026-01-02"}
+    watermarks = frozendict(
+        {
+            "target": "SELECT max(target), count(*) FROM target",
+            "other": "SELECT 1",
+        }
+    )
+
+    without = core._probe_data(params, engine, frozendict(target=""))
+    actual = core._probe_data(
+        params, engine, frozendict(target=""), watermarks=watermarks
+    )
+
+    assert without is None
+    assert actual == snapshot(((3, 3),))
+
+
+def test_fetch_data_joins_in_database_with_same_result(engine, mocker):
+    """Pushing the join down into the database only transfers the rows of the index."""
+    where = "WHERE date(date) BETWEEN :start_date AND :end_date"
+    sql_queries = frozendict(
+        {
+            "index": f"SELECT * FROM identifier {where} AND id > :id;",
+            "features": f"SELECT * FROM feature {where}",
+            "target": f"SELECT * FROM target {where} -- Trailing comment",
+        }
+    )
+    kwargs = dict(
+        params={"start_date": "2026-01-01", "end_date": "2026-01-04", "id": 1},
+        db_engine=engine,
+        sql_queries=sql_queries,
+        data_model=RawDataModel,
+    )
+    expected = fetch_data_uncached(**kwargs)
+    read_sql = mocker.spy(pd, "read_sql")
+
+    actual = fetch_data_uncached(pushdown=True, **kwargs)
+
+    pd.testing.assert_frame_equal(actual, expected)
+    assert read_sql.call_count == 1
+    assert len(read_sql.spy_return) == 3
+
+
+def test_fetch_data_raises_on_merge_validation_in_database(engine):
+    """The join in the database is validated to be one-to-one as well."""
+    sql_queries = frozendict(
+        {
+            "index": "SELECT * FROM identifier",
+            "features": "SELECT * FROM feature UNION ALL SELECT * FROM feature;",
+            "target": "SELECT * FROM target",
+        }
+    )
+
+    with pytest.raises(MergeError, match="not unique"):
+        fetch_data_uncached(
+            params={},
+            db_engine=engine,
+            sql_queries=sql_queries,
+            data_model=RawDataModel,
+            pushdown=True,
+        )
+
+
+def test_fetch_data_raises_on_overlapping_columns_in_database(engine):
+    """Columns other than the identifiers are not joined twice in the database."""
+    sql_queries = frozendict(
+        {
+            "index": "SELECT id, date FROM identifier",
+            "features": "SELECT * FROM feature",
+            "target": "SELECT id, date, target AS feature FROM target",
+        }
+    )
+
+    with pytest.raises(ValueError, match="columns overlap"):
+        fetch_data_uncached(
+            params={},
+            db_engine=engine,
+            sql_queries=sql_queries,
+            data_model=RawDataModel,
+            pushdown=True,
+        )
+
+
+def test_fetch_data_ignores_values_of_rows_not_in_index(engine):
+    """Rows dropped by the join are not checked, only the ones of the index."""
+
+    class CheckedDataModel(RawDataModel):
+        feature: S[pd.Int64Dtype] = F(ge=0, nullable=True, coerce=True)
+
+    sql_queries = frozendict(
+        {
+            "index": "SELECT * FROM identifier WHERE id = 1",
+            "features": "SELECT id, date, iif(id = 1, feature, -1) AS feature "
+            "FROM feature",
+            "target": "SELECT * FROM target",
+        }
+    )
+
+    actual = fetch_data_uncached(
+        params={},
+        db_engine=engine,
+        sql_queries=sql_queries,
+        data_model=CheckedDataModel,
+    )
+
+    assert actual["feature"].to_list() == [42]
+
+
+def test_fetch_data_in_shards_equals_unsharded_result(engine, mocker):
+    """Tuple parameters split into shards yield the same data in the same order."""
+    where = "WHERE id IN :ids AND date(date) BETWEEN :start_date AND :end_date"
+    sql_queries = frozendict(
+        {
+            "index": f"SELECT * FROM identifier {where}",
+            "features": f"SELECT * FROM feature {where}",
+            "target": f"SELECT * FROM target {where}",
+        }
+    )
+    params = {"ids": (1, 2, 3, 4), "start_date": "2026-01-01", "end_date": "2026-01-04"}
+    kwargs = dict(db_engine=engine, sql_queries=sql_queries, data_model=RawDataModel)
+    expected = fetch_data_uncached(params=params, **kwargs)
+    read_query = mocker.spy(core, "read_query")
+
+    actual = fetch_data_uncached(params=params, shard_size=3, **kwargs)
+
+    pd.testing.assert_frame_equal(actual, expected)
+    assert read_query.call_count == 3 * 2
+
+
+@pytest.mark.usefixtures("cached_periods")
+def test_fetch_data_collects_metrics_per_query_and_period(engine):
+    """Every query and period is measured, including cache hits and misses."""
+    where = "WHERE date(date) BETWEEN :start_date AND :end_date"
+    kwargs = dict(
+        params={"start_date": date(2026, 1, 1), "end_date": date(2026, 1, 2)},
+        db_engine=engine,
+        sql_queries=frozendict(
+            {
+                "index": f"SELECT * FROM identifier {where}",
+                "features": f"SELECT * FROM feature {where}",
+                "target": f"SELECT * FROM target {where}",
+            }
+        ),
+        data_model=RawDataModel,
+        partition="D",
+    )
+    with collect_load_metrics() as first:
+        fetch_data_uncached(**kwargs)
+
+    with collect_load_metrics() as metrics:
+        fetch_data_uncached(**kwargs)
+
+    actual = [(m.query, m.cache, m.rows) for m in first.queries + metrics.queries]
+    assert actual == snapshot(
+        [
+            ("index", "miss", 1),
+            ("index", "off", 1),
+            ("features", "miss", 1),
+            ("features", "off", 1),
+            ("target", "miss", 1),
+            ("target", "off", 1),
+            ("index", "hit", 1),
+            ("index", "off", 1),
+            ("features", "hit", 1),
+            ("features", "off", 1),
+            ("target", "hit", 1),
+            ("target", "off", 1),
+        ]
+    )
+    assert all(m.wall_time > 0 for m in metrics.queries)
+    assert all(
+        (m.time_to_execute is not None) == (m.cache != "hit") for m in metrics.queries
+    )
+    assert metrics.summary()["load.target.cache_hits"] == 1
+    assert metrics.summary() == IsDict(
+        {"load.target.rows": 2, "load.target.memory_bytes": IsPositive}
+    ).settings(partial=True)
+
+
+@pytest.mark.usefixtures("cached_periods")
+@pytest.mark.parametrize("partition", [None, "D"])
+def test_fetch_data_streams_chunks_with_same_result(engine, partition):
+    """Streaming chunks and dropping rows not in the index does not change the data."""
+    where = "WHERE date(date) BETWEEN :start_date AND :end_date"
+    kwargs = dict(
+        params={"start_date": date(2026, 1, 2), "end_date": date(2026, 1, 4)},
+        db_engine=engine,
+        sql_queries=frozendict(
+            {
+                "index": f"SELECT * FROM identifier {where} AND id < 4",
+                "features": f"SELECT * FROM feature {where}",
+                "target": f"SELECT * FROM target {where}",
+            }
+        ),
+        data_model=RawDataModel,
+        partition=partition,
+    )
+    expected = fetch_data_uncached(**kwargs)
+
+    actual = fetch_data_uncached(chunksize=1, **kwargs)
+
+    pd.testing.assert_frame_equal(actual, expected)
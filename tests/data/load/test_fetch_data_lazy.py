@@ -0,0 +1,97 @@
+import pandas as pd
+import pandera.polars as pa
+import polars as pl
+import pytest
+from dirty_equals import IsList
+from frozendict import frozendict
+from pandera.polars import Field as F
+from polars.exceptions import ComputeError
+from polars.testing import assert_frame_equal
+from sqlalchemy import create_engine
+
+from project.data import collect_load_metrics, fetch_data_lazy
+
+SQL_QUERIES = frozendict(
+    {
+        "index": "SELECT * FROM identifier WHERE id in :valid_ids",
+        "features": "SELECT * FROM feature",
+        "target": "SELECT * FROM target",
+    }
+)
+
+
+class RawDataModel(pa.DataFrameModel):
+    id: pl.Int64
+    date: pl.Datetime
+    feature: pl.Int64 = F(nullable=True)
+    target: pl.Int64 = F(nullable=True)
+
+
+@pytest.fixture(name="engine")
+def _engine(tmp_path):
+    """Fill a file data base with dummy data and return its engine."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'db.sqlite'}")
+    data = pd.DataFrame(
+        {
+            "id": [1, 2, 3, 4],
+            "date": pd.date_range("2026-01-01", "2026-01-04"),
+            "feature": [42, 43, 44, 45],
+            "target": [0, 1, 2, 3],
+        }
+    )
+    data[["id", "date"]].to_sql("identifier", engine, index=False)
+    data.loc[[0, 1], ["id", "date", "feature"]].to_sql("feature", engine, index=False)
+    data.loc[[0, 1, 3], ["id", "date", "target"]].to_sql("target", engine, index=False)
+    yield engine
+    engine.dispose()
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_fetch_data_lazy_joins_and_validates_queries(engine, max_workers):
+    """The queries are left joined on the index like in fetch_data."""
+    expected = pl.DataFrame(
+        {
+            "id": [1, 2, 4],
+            "date": pl.datetime_range(
+                pl.datetime(2026, 1, 1), pl.datetime(2026, 1, 4), eager=True
+            ).gather([0, 1, 3]),
+            "feature": [42, 43, None],
+            "target": [0, 1, 3],
+        }
+    )
+
+    actual = fetch_data_lazy(
+        {"valid_ids": (1, 2, 4)},
+        engine,
+        SQL_QUERIES,
+        data_model=RawDataModel,
+        max_workers=max_workers,
+    )
+
+    assert isinstance(actual, pl.LazyFrame)
+    assert_frame_equal(actual.collect(), expected, check_dtypes=False)
+
+
+def test_fetch_data_lazy_collects_metrics_per_query(engine):
+    """Every query is measured like in fetch_data."""
+    with collect_load_metrics() as metrics:
+        fetch_data_lazy(
+            {"valid_ids": (1,)}, engine, SQL_QUERIES, data_model=RawDataModel
+        )
+
+    assert sorted(m.query for m in metrics.queries) == IsList(
+        "features", "index", "target"
+    )
+    assert all(m.memory_bytes > 0 for m in metrics.queries)
+
+
+def test_fetch_data_lazy_raises_on_merge_validation(engine):
+    """Duplicated identifiers must fail the one-to-one join."""
+    sql_queries = SQL_QUERIES | {
+        "target": "SELECT * FROM target UNION ALL SELECT * FROM target"
+    }
+
+    with pytest.raises(ComputeError, match="1:1"):
+        fetch_data_lazy(
+            {"valid_ids": (1,)}, engine, sql_queries, data_model=RawDataModel
+        )
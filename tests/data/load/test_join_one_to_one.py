@@ -0,0 +1,66 @@
+import pandas as pd
+import pytest
+from pandas.errors import MergeError
+
+from project.data.load.join import join_one_to_one
+
+LEFT = pd.DataFrame(
+    {
+        "id": [1, 2, 3, 4],
+        "date": pd.to_datetime(["2026-01-01", "2026-01-02", "2026-01-03", None]),
+    }
+)
+
+
+def test_join_one_to_one_equals_pandas_join():
+    """The result matches the left join on a MultiIndex, including missing keys."""
+    rights = [
+        pd.DataFrame(
+            {
+                "id": [4, 1, 9, 3],
+                "date": pd.to_datetime(
+                    [None, "2026-01-01", "2026-01-02", "2026-01-03"]
+                ),
+                "feature": [1.0, 2.0, 3.0, 4.0],
+                "category": ["a", "b", "c", "d"],
+                "count": pd.array([1, None, 3, 4], dtype="Int64"),
+            }
+        ),
+        pd.DataFrame({"id": [2, 1], "date": LEFT["date"][[1, 0]], "target": [0, 1]}),
+    ]
+    expected = (
+        LEFT.set_index(["id", "date"])
+        .join([df.set_index(["id", "date"]) for df in rights], validate="1:1")
+        .reset_index()
+    )
+
+    actual = join_one_to_one(LEFT, rights, on=["id", "date"])
+
+    pd.testing.assert_frame_equal(actual, expected)
+
+
+def test_join_one_to_one_keeps_data_types_without_missing_rows():
+    """Integer columns are only converted to floats if rows are missing."""
+    right = LEFT.assign(target=[0, 1, 2, 3]).iloc[::-1]
+
+    actual = join_one_to_one(LEFT, [right], on=["id", "date"])
+
+    pd.testing.assert_frame_equal(actual, LEFT.assign(target=[0, 1, 2, 3]))
+
+
+@pytest.mark.parametrize("side", ["left", "right"])
+def test_join_one_to_one_raises_on_duplicated_keys(side):
+    """Duplicated identifiers on either side raise like pandas."""
+    duplicated = pd.concat([LEFT, LEFT.iloc[:1]], ignore_index=True)
+    left, right = (duplicated, LEFT) if side == "left" else (LEFT, duplicated)
+
+    with pytest.raises(MergeError, match=f"not unique in {side} dataset"):
+        join_one_to_one(left, [right.assign(feature=1)], on=["id", "date"])
+
+
+def test_join_one_to_one_raises_on_overlapping_columns():
+    """Columns other than the identifiers must not appear twice."""
+    right = LEFT.assign(feature=1)
+
+    with pytest.raises(ValueError, match="columns overlap"):
+        join_one_to_one(LEFT, [right, right], on=["id", "date"])
@@ -2,7 +2,7 @@ from pathlib import Path
 
 from inline_snapshot import snapshot
 
-from project.data import load_sql_files
+from project.data import load_sql_files, load_watermark_files
 
 
 def test_load_sql_files_selectively_loads_sql_files(tmp_path: Path):
@@ -18,6 +18,17 @@ def test_load_sql_files_selectively_loads_sql_files(tmp_path: Path):
     assert dict(actual) == expected
 
 
+def test_load_sql_files_parses_parameters(tmp_path: Path):
+    """Loaded queries know their parameters without parsing them again."""
+    (tmp_path / "a.sql").write_text(
+        "SELECT * FROM t WHERE id IN :ids", encoding="utf-8"
+    )
+
+    actual = load_sql_files(str(tmp_path / "*.sql"))
+
+    assert actual["a"].parameters == snapshot(("ids",))
+
+
 def test_load_sql_files_returns_empty_dict_for_no_files(tmp_path: Path):
     """The loader should not fail if there are no files."""
     expected = snapshot({})
@@ -46,3 +57,12 @@ def test_load_sql_files_has_deterministic_order(tmp_path: Path):
     actual = load_sql_files(str(tmp_path / "*.sql"))
 
     assert list(actual.keys()) == expected
+
+
+def test_load_watermark_files_probe_existing_queries():
+    """Every watermark query must belong to a query of the same name."""
+    queries = load_sql_files()
+
+    actual = load_watermark_files()
+
+    assert set(actual) <= set(queries) - {"index"}
@@ -0,0 +1,99 @@
+import pandas as pd
+from dirty_equals import IsPositive
+from inline_snapshot import snapshot
+
+from project.data.load.cache import FrameMemory, ParquetBackend
+from project.data.load.metrics import (
+    LoadMetrics,
+    QueryMetrics,
+    collect_load_metrics,
+    mark_fetch,
+    measure,
+    measure_cached,
+)
+
+
+def test_load_metrics_are_summed_per_query():
+    """Periods and shards of a query are aggregated for experiment tracking."""
+    metrics = LoadMetrics(
+        [
+            QueryMetrics("a", cache="hit", wall_time=1.0, rows=2, memory_bytes=3),
+            QueryMetrics("a", cache="miss", wall_time=2.0, time_to_execute=0.5),
+            QueryMetrics("b", wall_time=4.0, time_to_execute=1.0, rows=5),
+        ]
+    )
+
+    actual = metrics.summary()
+
+    assert actual == snapshot(
+        {
+            "load.a.wall_time": 3.0,
+            "load.a.time_to_execute": 0.5,
+            "load.a.rows": 2.0,
+            "load.a.memory_bytes": 3.0,
+            "load.a.cache_hits": 1.0,
+            "load.a.cache_misses": 1.0,
+            "load.b.wall_time": 4.0,
+            "load.b.time_to_execute": 1.0,
+            "load.b.rows": 5.0,
+            "load.b.memory_bytes": 0.0,
+            "load.b.cache_hits": 0.0,
+            "load.b.cache_misses": 0.0,
+        }
+    )
+
+
+def test_measure_is_only_collected_within_context():
+    """Measurements outside of `collect_load_metrics` are only logged."""
+    mark_fetch()  # No error outside of a measurement
+
+    with measure("a", cached=True):
+        pass
+    with collect_load_metrics() as metrics, measure("b", cached=True):
+        mark_fetch()
+
+    assert metrics.queries == [QueryMetrics("b", cache="miss", wall_time=IsPositive)]
+
+
+def test_measure_cached_records_hits_of_cached_function(tmp_path):
+    """Calls served from the cache are measured although no query is fetched."""
+    memory = FrameMemory(location=tmp_path)
+
+    @measure_cached("data")
+    @memory.cache
+    def load(n: int) -> pd.DataFrame:
+        return pd.DataFrame({"a": range(n)})
+
+    with collect_load_metrics() as metrics:
+        load(2)
+        load(2)
+
+    actual = [(m.query, m.cache, m.rows) for m in metrics.queries]
+    assert actual == [("data", "miss", 2), ("data", "hit", 2)]
+    assert load.uncached(3).shape == (3, 1)  # Attributes of the cache are kept
+
+
+def test_measure_cached_records_hits_during_other_misses(tmp_path, mocker):
+    """Each call gets its own hit or miss, although the cache counts all calls."""
+    memory = FrameMemory(location=tmp_path)
+
+    @measure_cached("data")
+    @memory.cache
+    def load(n: int) -> pd.DataFrame:
+        return pd.DataFrame({"a": range(n)})
+
+    load(2)
+    read = ParquetBackend.read
+
+    def read_during_miss(backend, path):
+        load(3)  # E.g. in another thread while reading the hit
+        return read(backend, path)
+
+    mocker.patch.object(
+        ParquetBackend, "read", autospec=True, side_effect=read_during_miss
+    )
+    with collect_load_metrics() as metrics:
+        load(2)
+
+    actual = [(m.query, m.cache, m.rows) for m in metrics.queries]
+    assert actual == [("data", "miss", 3), ("data", "hit", 2)]
@@ -0,0 +1,140 @@
+import pandas as pd
+import pytest
+from inline_snapshot import snapshot
+from sqlalchemy import create_engine, text
+
+from project.data.load.arrow import declared_dtypes, read_sql_arrow
+from project.data.validate import RawDataModel
+
+
+@pytest.fixture(scope="module", name="engine")
+def _engine():
+    """Run a data base with loosely typed dummy data for the tests."""
+    engine = create_engine("sqlite:///:memory:")
+    data = pd.DataFrame(
+        {
+            "id": [1, 2, 3],
+            "date": ["2026-01-01", "2026-01-02", "2026-01-03"],
+            "flt": [1.5, None, 3.0],
+            "uint": [5.0, None, 7.0],
+            "flag": [1, 0, None],
+            "cat": ["Apple", None, "Banana"],
+            "text": ["a", "b", "c"],
+        }
+    )
+    data.to_sql("data", engine, index=False)
+
+    yield engine
+
+    engine.dispose()
+
+
+def test_read_sql_arrow_returns_declared_dtypes(engine):
+    """Columns arrive typed, even if the database returns other Python types."""
+    dtypes = {
+        "id": pd.Int64Dtype(),
+        "flt": pd.Float32Dtype(),
+        "uint": pd.UInt64Dtype(),
+        "flag": pd.BooleanDtype(),
+        "cat": pd.CategoricalDtype(["Apple", "Banana"]),
+        "missing": pd.Int64Dtype(),  # Columns not in the result are ignored
+    }
+    expected = snapshot(
+        {
+            "id": "Int64",
+            "date": "object",
+            "flt": "Float32",
+            "uint": "UInt64",
+            "flag": "boolean",
+            "cat": "category",
+            "text": "object",
+        }
+    )
+
+    actual = read_sql_arrow(text("SELECT * FROM data"), engine, dtype=dtypes)
+
+    assert actual.dtypes.astype(str).to_dict() == expected
+    assert actual["uint"].to_list() == [5, pd.NA, 7]
+    assert actual["flag"].to_list() == [True, False, pd.NA]
+
+
+def test_read_sql_arrow_keeps_values_that_do_not_fit_the_dtype(engine):
+    """Invalid data must reach the data model validation to report it properly."""
+    dtypes = {"text": pd.Int64Dtype()}
+    expected = snapshot(["a", "b", "c"])
+
+    actual = read_sql_arrow(text("SELECT text FROM data"), engine, dtype=dtypes)
+
+    assert actual["text"].to_list() == expected
+
+
+@pytest.mark.parametrize(
+    ("query", "dtypes", "expected"),
+    [
+        ("SELECT uint AS num FROM data", {"num": pd.UInt64Dtype()}, "UInt64"),
+        (  # Only some batches fit the data type
+            "SELECT iif(id < 3, CAST(id AS TEXT), text) AS num FROM data",
+            {"num": pd.Int64Dtype()},
+            "object",
+        ),
+        (  # Batches are inferred to different types
+            "SELECT iif(id < 3, NULL, flt) AS num FROM data",
+            {},
+            "float64",
+        ),
+    ],
+    ids=["typed", "untyped", "inferred"],
+)
+def test_read_sql_arrow_in_batches_equals_result_at_once(
+    engine, query, dtypes, expected
+):
+    """Converting the rows batch by batch does not change the data."""
+    at_once = read_sql_arrow(text(query), engine, dtype=dtypes)
+
+    actual = read_sql_arrow(text(query), engine, dtype=dtypes, batch_size=1)
+
+    pd.testing.assert_frame_equal(actual, at_once)
+    assert actual["num"].dtype == expected
+
+
+def test_read_sql_arrow_parses_dates_and_sets_index(engine):
+    """The reader is a replacement of `pandas.read_sql` for the data loader."""
+    stmt = text("SELECT id, date, text FROM data")
+    expected = pd.read_sql(stmt, engine, index_col=["id", "date"], parse_dates=["date"])
+
+    actual = read_sql_arrow(
+        stmt, engine, index_col=["id", "date"], parse_dates=["date", "missing"]
+    )
+
+    pd.testing.assert_frame_equal(actual, expected)
+
+
+def test_read_sql_arrow_returns_empty_dataframe_with_columns(engine):
+    """Queries without result still need to provide their columns for joining."""
+    stmt = text("SELECT id, flt FROM data WHERE id < 0")
+    dtypes = {"id": pd.Int64Dtype(), "flt": pd.Float32Dtype()}
+    expected = snapshot({"id": "Int64", "flt": "Float32"})
+
+    actual = read_sql_arrow(stmt, engine, dtype=dtypes)
+
+    assert actual.empty
+    assert actual.dtypes.astype(str).to_dict() == expected
+
+
+def test_declared_dtypes_lists_data_types_of_data_model():
+    """The data types are forwarded to the reader to fetch data already typed."""
+    expected = snapshot(
+        {
+            "id": "Int64",
+            "date": "datetime64[us, UTC]",
+            "col1": "Float32",
+            "col2": "UInt64",
+            "col3": "boolean",
+            "col4": "category",
+            "target": "Float64",
+        }
+    )
+
+    actual = declared_dtypes(RawDataModel)
+
+    assert {k: str(v) for k, v in actual.items()} == expected
@@ -0,0 +1,64 @@
+import pandas as pd
+import pytest
+from inline_snapshot import snapshot
+from sqlalchemy import create_engine, text
+
+from project.data.load.stream import read_sql_chunked
+
+
+@pytest.fixture(scope="module", name="engine")
+def _engine():
+    """Run a data base with a few rows of different types."""
+    engine = create_engine("sqlite:///:memory:")
+    data = pd.DataFrame(
+        {
+            "id": [1, 2, 3, 4, 5],
+            "key": ["a", "b", "a", "b", "a"],
+            "num": [1.0, None, 3.0, 4.0, 5.0],
+            "text": ["x", "y", "z", "x", "y"],
+        }
+    )
+    data.to_sql("data", engine, index=False)
+    yield engine
+    engine.dispose()
+
+
+def test_read_sql_chunked_equals_read_sql(engine):
+    """Streaming in chunks returns the same result as reading at once."""
+    sql = text("SELECT * FROM data")
+    expected = pd.read_sql(sql, engine, index_col="id")
+
+    actual = read_sql_chunked(sql, engine, chunksize=2, index_col="id")
+
+    pd.testing.assert_frame_equal(actual, expected)
+
+
+def test_read_sql_chunked_keeps_only_selected_rows_typed(engine):
+    """Chunks are reduced to the identifiers to keep and typed as declared."""
+    keep = pd.MultiIndex.from_tuples(
+        [(1, "a"), (4, "b"), (5, "b")], names=["id", "key"]
+    )
+    dtype = {"num": pd.Int64Dtype(), "text": pd.CategoricalDtype(["x", "y", "z"])}
+
+    actual = read_sql_chunked(
+        text("SELECT * FROM data"), engine, chunksize=2, keep=keep, dtype=dtype
+    )
+
+    assert actual.to_dict("list") == snapshot(
+        {"id": [1, 4], "key": ["a", "b"], "num": [1, 4], "text": ["x", "x"]}
+    )
+    assert actual.dtypes.astype(str).to_dict() == snapshot(
+        {"id": "int64", "key": "object", "num": "Int64", "text": "category"}
+    )
+
+
+def test_read_sql_chunked_keeps_values_that_do_not_fit(engine):
+    """Values that cannot be converted are left for the data model validation."""
+    actual = read_sql_chunked(
+        text("SELECT * FROM data WHERE id > 4"),
+        engine,
+        chunksize=2,
+        dtype={"text": pd.Int64Dtype()},
+    )
+
+    assert actual["text"].to_list() == ["y"]
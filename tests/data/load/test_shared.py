@@ -0,0 +1,50 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from project.data import ENV_VAR_SHARED_DATA, attach_shared_data, share_data
+
+
+@pytest.fixture
+def data():
+    """Processed features and target with different column types."""
+    X = pd.DataFrame(
+        {
+            "a": pd.array([1.0, None], dtype="Float64"),
+            "b": [True, False],
+            "c": pd.Categorical(["x", "y"]),
+        }
+    )
+    return X, pd.Series([1.0, 2.0], name="target")
+
+
+def test_attach_shared_data_is_none_if_not_shared(monkeypatch):
+    """Without shared data, the data is loaded as usual."""
+    monkeypatch.delenv(ENV_VAR_SHARED_DATA, raising=False)
+
+    assert attach_shared_data() is None
+
+
+def test_attach_shared_data_returns_equal_data(monkeypatch, tmp_path, data):
+    """The attached data is equal to the shared data."""
+    share_data(data, tmp_path / "data.joblib")
+    monkeypatch.setenv(ENV_VAR_SHARED_DATA, str(tmp_path / "data.joblib"))
+
+    X, y = attach_shared_data()
+
+    assert X.equals(data[0])
+    assert y.equals(data[1])
+
+
+def test_attach_shared_data_maps_memory_read_only(monkeypatch, tmp_path, data):
+    """The columns are memory-mapped from the file and not copied."""
+    share_data(data, tmp_path / "data.joblib")
+    monkeypatch.setenv(ENV_VAR_SHARED_DATA, str(tmp_path / "data.joblib"))
+
+    X, y = attach_shared_data()
+
+    arrays = [X["a"].array._data, X["b"].to_numpy(), X["c"].array.codes, y.to_numpy()]
+    for array in arrays:
+        assert not array.flags.writeable
+        while not isinstance(array, np.memmap):  # Fails at a base of None
+            array = array.base
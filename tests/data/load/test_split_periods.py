@@ -0,0 +1,50 @@
+from datetime import date, datetime
+
+import pytest
+
+from project.data.load.partition import split_periods
+
+
+def test_split_periods_keeps_parameters_without_frequency():
+    """Without partitioning the parameters must remain unchanged."""
+    params = {"start_date": "2026-01-01", "other": (1, 2)}
+
+    actual = split_periods(params, None)
+
+    assert actual == [params]
+
+
+@pytest.mark.parametrize(
+    "start",
+    [
+        pytest.param("2026-01-30", id="str"),
+        pytest.param(date(2026, 1, 30), id="date"),
+        pytest.param(datetime(2026, 1, 30, 12), id="datetime"),
+    ],
+)
+def test_split_periods_clips_periods_to_date_range(start):
+    """Date-like parameters are split into periods within the inclusive date range."""
+    params = {"start_date": start, "end_date": date(2026, 2, 2), "other": 1}
+    expected = [
+        {"start_date": date(2026, 1, 30), "end_date": date(2026, 1, 31), "other": 1},
+        {"start_date": date(2026, 2, 1), "end_date": date(2026, 2, 2), "other": 1},
+    ]
+
+    actual = split_periods(params, "M")
+
+    assert actual == expected
+
+
+def test_split_periods_keeps_parameters_of_empty_date_range():
+    """Reversed date ranges are left to the database to return no data."""
+    params = {"start_date": date(2026, 2, 1), "end_date": date(2026, 1, 1)}
+
+    actual = split_periods(params, "D")
+
+    assert actual == [params]
+
+
+def test_split_periods_raises_on_missing_date_range():
+    """Partitioning requires the date range parameters."""
+    with pytest.raises(KeyError, match="start_date"):
+        split_periods({"end_date": date(2026, 1, 1)}, "D")
@@ -0,0 +1,27 @@
+from inline_snapshot import snapshot
+
+from project.data.load.partition import split_shards
+
+
+def test_split_shards_without_size_or_tuples_returns_params():
+    """Without a shard size or tuple parameters, there is only one shard."""
+    params = {"ids": (1, 2, 3), "empty": (), "name": "a"}
+
+    assert split_shards(params, None) == [params]
+    assert split_shards({"name": "a"}, 1) == [{"name": "a"}]
+
+
+def test_split_shards_combines_chunks_of_all_tuples():
+    """Several tuple parameters are split into all combinations of their chunks."""
+    params = {"ids": (1, 2, 3), "regions": ("n", "s", "w"), "empty": ()}
+
+    actual = split_shards(params, 2)
+
+    assert actual == snapshot(
+        [
+            {"ids": (1, 2), "regions": ("n", "s"), "empty": ()},
+            {"ids": (1, 2), "regions": ("w",), "empty": ()},
+            {"ids": (3,), "regions": ("n", "s"), "empty": ()},
+            {"ids": (3,), "regions": ("w",), "empty": ()},
+        ]
+    )
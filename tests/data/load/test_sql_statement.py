@@ -0,0 +1,36 @@
+from inline_snapshot import snapshot
+
+from project.data.load import statement
+from project.data.load.statement import SqlStatement
+
+
+def test_sql_statement_reuses_parsed_statement_for_other_values():
+    """Binding other values of the same kind does not parse the query again."""
+    stmt = SqlStatement("SELECT * FROM t WHERE id IN :ids AND region = :region")
+    stmt.bind({"ids": (1, 2), "region": "north"})
+    before = statement._parse.cache_info()
+
+    actual = stmt.bind({"ids": (3, 4, 5), "region": "south"})
+
+    assert statement._parse.cache_info().hits == before.hits + 1
+    assert actual.compile().params == snapshot({"ids": (3, 4, 5), "region": "south"})
+
+
+def test_sql_statement_expands_only_tuple_parameters():
+    """Tuples are expanded for "IN" clauses, other values are bound as they are."""
+    stmt = SqlStatement("SELECT * FROM t WHERE id IN :ids AND region = :region")
+
+    actual = stmt.bind({"ids": (1,), "region": "north"})
+
+    assert {k: v.expanding for k, v in actual._bindparams.items()} == snapshot(
+        {"ids": True, "region": False}
+    )
+
+
+def test_sql_statement_leaves_missing_parameters_unbound():
+    """Parameters that are not given stay unbound and unused ones are ignored."""
+    stmt = SqlStatement("SELECT * FROM t WHERE region = :region")
+
+    actual = stmt.bind({"ids": (1, 2)})
+
+    assert actual.compile().params == snapshot({"region": None})
@@ -1,12 +1,15 @@
+import numpy as np
 import pandas as pd
 import pandera.pandas as pa
 import pytest
 from dirty_equals import IsTuple
 from inline_snapshot import snapshot
 from pandera.errors import SchemaError
+from pandera.pandas import Field as F
 from pandera.typing.pandas import Series as S
 
 from project.data import process_data
+from project.data.validate.base import DataModelBaseML
 
 
 class DataModelDummy(pa.DataFrameModel):
@@ -14,6 +17,14 @@ class DataModelDummy(pa.DataFrameModel):
     target: S[pa.Int64]
 
 
+class CompactProcessedDataModelDummy(DataModelBaseML):
+    _float_dtype = np.dtype("float32")
+    _float_columns = ["col1", "col2"]
+    col1: pd.Int64Dtype
+    col2: pd.Float64Dtype = F(nullable=True)
+    target: pd.Int64Dtype
+
+
 def test_process_data_raises_on_validation_error():
     """The output of the preprocessing must be validated."""
     inputs = pd.DataFrame({"target": [1, 2, 3]})
@@ -33,3 +44,24 @@ def test_process_data_validates_and_splits_input():
     assert actual == IsTuple(length=2)
     assert actual[0].to_dict("list") == expected_X
     assert actual[1].to_frame().to_dict("list") == expected_y
+
+
+def test_process_data_does_not_modify_input():
+    """The input is not copied up front, but must remain unchanged."""
+    inputs = pd.DataFrame({"target": [5, 6, 7], "col1": ["3", "2", "1"]})
+    expected = inputs.copy()
+
+    process_data(inputs, "target", data_model=DataModelDummy)
+
+    pd.testing.assert_frame_equal(inputs, expected)
+
+
+def test_process_data_returns_compact_features_as_one_array():
+    """Compact numerics are handed to the model without copies."""
+    inputs = pd.DataFrame({"target": [5, 6], "col1": [1, 2], "col2": [3.0, None]})
+
+    X, y = process_data(inputs, "target", data_model=CompactProcessedDataModelDummy)
+
+    assert X.dtypes.to_list() == [np.dtype("float32")] * 2
+    assert np.shares_memory(X.to_numpy(), X.to_numpy())
+    assert y.dtype == np.dtype("float64")
@@ -0,0 +1,55 @@
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import polars as pl
+import pytest
+from pandera.errors import SchemaError
+
+from project.data import process_data_lazy
+
+
+@pytest.fixture(name="lf_raw")
+def _lf_raw() -> pl.LazyFrame:
+    """Validated raw data in Polars."""
+    return pl.LazyFrame(
+        {
+            "id": [1, 2],
+            "date": [datetime(2026, 1, 1, 1), datetime(2026, 1, 1, 2)],
+            "col1": [1.5, 2.5],
+            "col2": [3, None],
+            "col3": [True, None],
+            "col4": ["Apple", None],
+            "target": [1.0, 2.0],
+        },
+        schema_overrides={
+            "date": pl.Datetime("us", "Europe/Berlin"),
+            "col1": pl.Float32,
+            "col2": pl.UInt64,
+            "col4": pl.Enum(["Apple", "Banana", "Cherry", "Date"]),
+        },
+    )
+
+
+def test_process_data_lazy_converts_to_pandas_for_scikit_learn(lf_raw):
+    """Features and target arrive as ML-conform NumPy types in pandas."""
+    X, y = process_data_lazy(lf_raw, "target")
+
+    assert X.dtypes.to_dict() == {
+        "id": np.dtype("float64"),
+        "date": np.dtype("datetime64[us]"),
+        "col1": np.dtype("float64"),
+        "col2": np.dtype("float64"),
+        "col3": np.dtype("bool"),
+        "col4": pd.CategoricalDtype(["Apple", "Banana", "Cherry", "Date"], True),
+    }
+    assert X["col3"].to_list() == [True, False]
+    assert np.isnan(X.loc[1, "col2"])
+    assert X.loc[0, "date"] == pd.Timestamp("2026-01-01T01:00")
+    assert y.to_list() == [1.0, 2.0]
+
+
+def test_process_data_lazy_raises_on_validation_error(lf_raw):
+    """The output of the preprocessing must be validated."""
+    with pytest.raises(SchemaError):
+        process_data_lazy(lf_raw.with_columns(col1=-pl.col("col1")), "target")
@@ -0,0 +1,30 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from project.data.validate.chunks import CHUNK_SIZE, is_strictly_sorted
+
+
+def test_is_strictly_sorted_finds_duplicates_across_chunks():
+    """Chunks overlap by one row, such that no pair of rows is missed."""
+    ids = np.arange(2 * CHUNK_SIZE)
+    ids[CHUNK_SIZE] = ids[CHUNK_SIZE - 1]
+    df = pd.DataFrame({"id": ids})
+
+    assert is_strictly_sorted(df.iloc[: CHUNK_SIZE - 1], ["id"])
+    assert not is_strictly_sorted(df, ["id"])
+
+
+@pytest.mark.parametrize(
+    ("values", "expected"),
+    [
+        (pd.array([1, 2, 3], dtype="Int64"), True),
+        (pd.array([1, None, 3], dtype="Int64"), False),
+        (pd.to_datetime(["2026-01-01", "2026-01-02"]).tz_localize("UTC"), True),
+        (pd.to_datetime(["2026-01-01", None]), False),
+    ],
+)
+def test_is_strictly_sorted_handles_extension_and_missing_values(values, expected):
+    """Nullable and time zone aware columns are compared without conversion."""
+    actual = is_strictly_sorted(pd.DataFrame({"col": values}), ["col"])
+    assert actual == expected
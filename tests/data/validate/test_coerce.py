@@ -0,0 +1,73 @@
+import numpy as np
+import pandas as pd
+
+from project.data.validate.coerce import apply_coercion, consolidate, plan_coercion
+
+
+def test_plan_coercion_leaves_out_conforming_columns():
+    """Only columns with a data type to change or missing booleans are planned."""
+    df = pd.DataFrame(
+        {
+            "float": [1.0, 2.0],
+            "int": [1, 2],
+            "bool": pd.array([True, False], dtype="boolean"),
+            "bool_nan": pd.array([True, None], dtype="boolean"),
+            "date": pd.to_datetime(["2026-01-01", "2026-01-02"]).as_unit("us"),
+            "date_ns": pd.to_datetime(["2026-01-01", "2026-01-02"]),
+            "str": pd.array(["a", "b"], dtype="string"),
+        }
+    )
+    actual = list(plan_coercion(df))
+    assert actual == ["date_ns", "bool_nan", "str", "int"]
+
+
+def test_apply_coercion_copies_only_converted_columns():
+    """Converted columns replace the original ones, all others are shared."""
+    df = pd.DataFrame({"keep": np.arange(1000.0), "int": np.arange(1000)})
+    keep = df["keep"].to_numpy()
+
+    actual = apply_coercion(df, plan_coercion(df))
+
+    assert actual == 1000 * 8  # NumPy float64 values without mask
+    assert df["int"].dtype == np.dtype("float64")
+    assert np.shares_memory(df["keep"].to_numpy(), keep)
+
+
+def test_plan_coercion_converts_numerics_to_numpy_floats():
+    """In compact mode, numerics become NumPy floats with NaN for missing values."""
+    df = pd.DataFrame(
+        {
+            "float32": np.zeros(2, dtype="float32"),
+            "float": pd.array([1.0, None], dtype="Float64"),
+        }
+    )
+    plan = plan_coercion(df, np.dtype("float32"))
+    apply_coercion(df, plan)
+
+    assert list(plan) == ["float"]
+    assert df.dtypes.to_list() == [np.dtype("float32")] * 2
+    assert np.isnan(df.loc[1, "float"])
+
+
+def test_plan_coercion_converts_only_selected_numerics_to_numpy_floats():
+    """Numerics not selected as compact are float64 like without compact mode."""
+    df = pd.DataFrame({"feature": [1.5, 2.5], "id": [2**24 + 1, 2**24 + 3]})
+
+    apply_coercion(df, plan_coercion(df, np.dtype("float32"), ["feature"]))
+
+    assert df.dtypes.to_list() == [np.dtype("float32"), np.dtype("float64")]
+    assert df["id"].to_list() == [2**24 + 1, 2**24 + 3]
+
+
+def test_consolidate_stores_floats_in_one_array():
+    """Floats of the same type are accessed as one array, other columns are kept."""
+    df = pd.DataFrame({"a": [1.0, 2.0], "b": ["x", "y"]})
+    df = df.assign(c=np.array([3, 4], dtype="float32"), d=[5.0, np.nan])
+
+    actual = consolidate(df)
+
+    pd.testing.assert_frame_equal(actual, df)
+    with pd.option_context("mode.copy_on_write", True):  # Select without copies
+        values = actual[["a", "d"]].to_numpy()
+        assert np.shares_memory(values, actual[["a", "d"]].to_numpy())
+    assert np.shares_memory(actual["b"].to_numpy(), df["b"].to_numpy())
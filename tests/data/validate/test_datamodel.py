@@ -1,11 +1,13 @@
 from typing import Annotated
 
+import numpy as np
 import pandas as pd
 import pytest
 from pandera.errors import SchemaError
 from pandera.pandas import Field as F
 
 from project.data.validate.base import DataModelBase, DataModelBaseML
+from project.data.validate.chunks import CHUNK_SIZE
 
 
 class DummyModel(DataModelBase):
@@ -85,6 +87,23 @@ class TestDataModelBase:
         with pytest.raises(SchemaError, match="monotonically_increasing"):
             DummyModel.validate(inputs)
 
+    @pytest.mark.parametrize("index", [[0, 2, 3], [1, 2, 3]])
+    def test_validate_raises_on_gaps_in_index(self, df_dummy_base, index):
+        """The index must be a range from zero without gaps."""
+        inputs = df_dummy_base.set_axis(index)
+        with pytest.raises(SchemaError, match="monotonically_increasing"):
+            DummyModel.validate(inputs)
+
+    def test_validate_finds_values_beyond_the_first_chunk(self):
+        """Columns are checked in chunks until the first value."""
+
+        class DummyModelChunks(DataModelBase):
+            col: pd.Float64Dtype = F(nullable=True)
+
+        inputs = pd.DataFrame({"col": [None] * (CHUNK_SIZE + 1) + [1.0]})
+        actual = DummyModelChunks.validate(inputs)
+        assert actual["col"].count() == 1
+
 
 class TestDataModelBaseML:
     def test_validate_drops_time_zone(self):
@@ -163,6 +182,19 @@ class TestDataModelBaseML:
             col3: pd.Float64Dtype
 
         inputs = pd.DataFrame({"col": [2], "col2": [3], "col3": [4]})
-        expected = inputs.copy().astype(pd.Float64Dtype())
+        expected = inputs.copy().astype("float64")
+        actual = DummyModelML.validate(inputs)
+        pd.testing.assert_frame_equal(actual, expected)
+
+    def test_validate_coerces_numerical_columns_to_compact_floats(self):
+        """In compact mode, numerics are plain NumPy floats with NaN."""
+
+        class DummyModelML(DataModelBaseML):
+            _float_dtype = np.dtype("float32")
+            col: pd.Int64Dtype = F(nullable=True)
+            col2: pd.Float64Dtype
+
+        inputs = pd.DataFrame({"col": [2, None], "col2": [3.0, 4.0]})
+        expected = pd.DataFrame({"col": [2, np.nan], "col2": [3, 4]}, dtype="float32")
         actual = DummyModelML.validate(inputs)
         pd.testing.assert_frame_equal(actual, expected)
@@ -0,0 +1,104 @@
+from datetime import datetime
+
+import polars as pl
+import pytest
+from pandera.errors import SchemaError
+
+from project.data.validate import (
+    ProcessedDataModel,
+    ProcessedLazyDataModel,
+    RawDataModel,
+    RawLazyDataModel,
+)
+from project.data.validate.lazy import validate_lazy
+
+
+@pytest.fixture(name="lf_raw")
+def _lf_raw() -> pl.LazyFrame:
+    """Raw data as loaded from the database with the Polars reader."""
+    return pl.LazyFrame(
+        {
+            "id": [1, 2],
+            "date": [datetime(2026, 1, 1), datetime(2026, 1, 1)],
+            "col1": [1.5, 2.5],
+            "col2": [3.0, None],
+            "col3": [1, None],
+            "col4": ["Apple", None],
+            "target": [1, 2],
+            "extra": [0, 0],
+        }
+    )
+
+
+def test_validate_lazy_coerces_and_filters_columns(lf_raw):
+    """Columns are converted to the declared data types and extra ones dropped."""
+    actual = validate_lazy(RawLazyDataModel, lf_raw)
+
+    assert isinstance(actual, pl.LazyFrame)
+    assert actual.collect_schema() == pl.Schema(
+        {
+            "id": pl.Int64,
+            "date": pl.Datetime("us", "UTC"),
+            "col1": pl.Float32,
+            "col2": pl.UInt64,
+            "col3": pl.Boolean,
+            "col4": pl.Enum(["Apple", "Banana", "Cherry", "Date"]),
+            "target": pl.Float64,
+        }
+    )
+
+
+@pytest.mark.parametrize(
+    ("update", "match"),
+    [
+        ({"id": pl.lit(1)}, "identifiers_are_unique"),
+        ({"col2": pl.lit(None, pl.Float64)}, "has_at_least_one_value"),
+        ({"col1": pl.lit(-1.0)}, "greater_than_or_equal_to"),
+    ],
+)
+def test_validate_lazy_checks_values(lf_raw, update, match):
+    """The values are checked, not only the schema of the LazyFrame."""
+    with pytest.raises(SchemaError, match=match):
+        validate_lazy(RawLazyDataModel, lf_raw.with_columns(**update))
+
+
+def test_validate_lazy_raises_on_empty_data(lf_raw):
+    """Data with no samples should be caught at validation time."""
+    with pytest.raises(SchemaError, match="non_empty"):
+        validate_lazy(RawLazyDataModel, lf_raw.clear())
+
+
+@pytest.mark.parametrize(
+    ("data_model", "lazy_data_model", "filled"),
+    [
+        (RawDataModel, RawLazyDataModel, []),
+        (ProcessedDataModel, ProcessedLazyDataModel, ["col3"]),
+    ],
+)
+def test_lazy_data_model_matches_pandas_data_model(data_model, lazy_data_model, filled):
+    """The Polars schema has the columns, nullability, and checks of the pandas one."""
+    expected = data_model.to_schema().columns
+    actual = lazy_data_model.to_schema().columns
+
+    assert list(actual) == list(expected)
+    for name, column in actual.items():
+        assert column.nullable == (expected[name].nullable and name not in filled)
+        assert [(check.name, check.statistics) for check in column.checks] == [
+            (check.name, check.statistics) for check in expected[name].checks
+        ]
+
+
+def test_processed_lazy_data_model_is_ml_conform():
+    """Numerics are Float64, datetimes naive, and booleans have no missing values."""
+    actual = ProcessedLazyDataModel.to_schema()
+
+    assert {name: column.dtype.type for name, column in actual.columns.items()} == {
+        "id": pl.Float64,
+        "date": pl.Datetime("us"),
+        "col1": pl.Float64,
+        "col2": pl.Float64,
+        "col3": pl.Boolean,
+        "col4": pl.Enum(["Apple", "Banana", "Cherry", "Date"]),
+        "target": pl.Float64,
+    }
+    assert not actual.columns["col3"].nullable
@@ -0,0 +1,41 @@
+import numpy as np
+import pandas as pd
+import pytest
+from inline_snapshot import snapshot
+
+from project.data.validate import CompactProcessedDataModel
+
+
+class TestCompactProcessedDataModel:
+    def test_validate_keeps_integers_and_target_exact(self):
+        """Only float features are compact, integers beyond 2**24 are not rounded."""
+        large = 2**24 + 1
+        inputs = pd.DataFrame(
+            {
+                "id": [large, large + 2],
+                "date": ["2024-01-01", "2024-01-01"],
+                "col1": [0.5, 1.5],
+                "col2": [large, None],
+                "col3": [True, None],
+                "col4": ["Apple", None],
+                "target": [large, 0.1],
+            }
+        )
+        expected = snapshot(
+            {
+                "id": "float64",
+                "date": "datetime64[us]",
+                "col1": "float32",
+                "col2": "float64",
+                "col3": "boolean",
+                "col4": "category",
+                "target": "float64",
+            }
+        )
+
+        actual = CompactProcessedDataModel.validate(inputs)
+
+        assert actual.dtypes.astype(str).to_dict() == expected
+        assert actual["id"].to_list() == [large, large + 2]
+        assert actual["col2"].to_list() == [large, pytest.approx(np.nan, nan_ok=True)]
+        assert actual["target"].to_list() == [large, 0.1]
@@ -21,3 +21,19 @@ class TestRawDataModel:
         )
         with pytest.raises(SchemaError, match="identifiers_are_unique"):
             RawDataModel.validate(inputs)
+
+    def test_validate_accepts_same_id_on_other_dates(self):
+        """Only pairs of identifiers have to be unique, not each identifier."""
+        inputs = pd.DataFrame(
+            {
+                "id": [1, 1],
+                "date": ["2024-01-01", "2024-01-02"],
+                "col1": [0, 0],
+                "col2": [0, 0],
+                "col3": [0, 0],
+                "col4": ["Apple", None],
+                "target": [0, 0],
+            }
+        )
+        actual = RawDataModel.validate(inputs)
+        assert len(actual) == 2
@@ -0,0 +1,86 @@
+import pandas as pd
+import pytest
+from pandera.errors import SchemaError
+
+from project.data.load.join import join_one_to_one
+from project.data.validate import RawDataModel, split_schema
+
+INDEX = pd.DataFrame({"id": [0, 1, 2], "date": ["2024-01-01"] * 3})
+FEATURES = pd.DataFrame(
+    {
+        "id": [2, 1, 0],
+        "date": ["2024-01-01"] * 3,
+        "col1": [0, 1, 2],
+        "col2": [0, None, 0],
+        "col3": [True, None, False],
+        "col4": ["Apple", None, "Cherry"],
+    }
+)
+TARGET = pd.DataFrame({"id": [0, 1], "date": ["2024-01-01"] * 2, "target": [0, 1]})
+
+
+def test_split_schema_equals_validation_of_joined_data():
+    """Validating every query and then the joined data equals the data model."""
+    by_column, by_frame = split_schema(RawDataModel)
+    parts = [by_column.validate(df) for df in (INDEX, FEATURES, TARGET)]
+    expected = RawDataModel.validate(
+        join_one_to_one(INDEX, [FEATURES, TARGET], on=["id", "date"])
+    )
+
+    actual = by_frame.validate(join_one_to_one(parts[0], parts[1:], on=["id", "date"]))
+
+    pd.testing.assert_frame_equal(actual, expected)
+
+
+def test_split_schema_checks_values_after_join():
+    """Column checks apply to the joined data."""
+    by_column, by_frame = split_schema(RawDataModel)
+    features = FEATURES.assign(col1=8_000)
+    parts = [by_column.validate(df) for df in (INDEX, features, TARGET)]
+
+    with pytest.raises(SchemaError, match="less_than"):
+        by_frame.validate(join_one_to_one(parts[0], parts[1:], on=["id", "date"]))
+
+
+def test_split_schema_ignores_values_of_rows_dropped_by_join():
+    """Rows of identifiers not in the index are not checked, like by the data model."""
+    by_column, by_frame = split_schema(RawDataModel)
+    outside = pd.DataFrame({"id": [9], "date": ["2024-01-01"], "col1": [-1]})
+    features = pd.concat([FEATURES, outside], ignore_index=True)
+    parts = [by_column.validate(df) for df in (INDEX, features, TARGET)]
+    expected = RawDataModel.validate(
+        join_one_to_one(INDEX, [features, TARGET], on=["id", "date"])
+    )
+
+    actual = by_frame.validate(join_one_to_one(parts[0], parts[1:], on=["id", "date"]))
+
+    pd.testing.assert_frame_equal(actual, expected)
+
+
+def test_split_schema_checks_missing_values_after_join():
+    """A column with values only in rows dropped by the join has no values."""
+    by_column, by_frame = split_schema(RawDataModel)
+    target = pd.DataFrame({"id": [9], "date": ["2024-01-01"], "target": [0]})
+    parts = [by_column.validate(df) for df in (INDEX, FEATURES, target)]
+
+    with pytest.raises(SchemaError, match="has_at_least_one_value"):
+        by_frame.validate(join_one_to_one(parts[0], parts[1:], on=["id", "date"]))
+
+
+def test_split_schema_checks_nullability_after_join():
+    """Rows missing in a query violate non-nullable columns of the joined data."""
+    by_column, by_frame = split_schema(RawDataModel)
+    parts = [by_column.validate(df) for df in (INDEX, FEATURES.iloc[:2], TARGET)]
+
+    with pytest.raises(SchemaError, match="col1"):
+        by_frame.validate(join_one_to_one(parts[0], parts[1:], on=["id", "date"]))
+
+
+def test_split_schema_checks_identifiers_after_join():
+    """The DataFrame checks apply to the joined data only."""
+    by_column, by_frame = split_schema(RawDataModel)
+    duplicated = pd.concat([FEATURES, FEATURES], ignore_index=True)
+    by_column.validate(duplicated)
+
+    with pytest.raises(SchemaError, match="identifiers_are_unique"):
+        by_frame.validate(by_column.validate(duplicated.assign(target=0)))
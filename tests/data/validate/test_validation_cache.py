@@ -0,0 +1,133 @@
+import numpy as np
+import pandas as pd
+import pandera.pandas as pa
+import pytest
+from pandera.errors import SchemaError
+from pandera.pandas import Field as F
+from pandera.typing.pandas import Series as S
+
+from project.data.validate.cache import (
+    ValidationCache,
+    cache_validation,
+    fingerprint,
+    validate_cached,
+)
+
+
+class DataModelDummy(pa.DataFrameModel):
+    col1: S[pa.Float64] = F(coerce=True)
+
+
+class DataModelStricter(pa.DataFrameModel):
+    col1: S[pa.Float64] = F(coerce=True, ge=2)
+
+
+@pytest.fixture(name="copy_on_write")
+def _copy_on_write():
+    """Enable copy-on-write like the entrypoints."""
+    with pd.option_context("mode.copy_on_write", True):
+        yield
+
+
+@pytest.mark.usefixtures("copy_on_write")
+def test_validation_cache_reuses_result_for_equal_data(mocker):
+    """Equal data in a new DataFrame is not validated again."""
+    cache = ValidationCache()
+    expected = cache.validate(DataModelDummy, pd.DataFrame({"col1": [1, 2, 3]}))
+    spy = mocker.spy(DataModelDummy, "validate")
+
+    actual = cache.validate(DataModelDummy, pd.DataFrame({"col1": [1, 2, 3]}))
+
+    spy.assert_not_called()
+    pd.testing.assert_frame_equal(actual, expected)
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert np.shares_memory(actual["col1"].to_numpy(), expected["col1"].to_numpy())
+
+
+def test_validation_cache_keeps_nothing_without_copy_on_write(mocker):
+    """Without copy-on-write, views of cached results could be modified in-place."""
+    cache = ValidationCache()
+    cache.validate(DataModelDummy, pd.DataFrame({"col1": [1, 2, 3]}))
+    spy = mocker.spy(DataModelDummy, "validate")
+
+    cache.validate(DataModelDummy, pd.DataFrame({"col1": [1, 2, 3]}))
+
+    spy.assert_called_once()
+    assert (cache.hits, cache.misses) == (0, 0)
+
+
+@pytest.mark.parametrize("copy_on_write", [True, False], ids=["cow", "no_cow"])
+def test_validation_cache_returns_independent_copies(copy_on_write):
+    """Changes to a returned result do not affect the input or later results."""
+    cache = ValidationCache()
+    inputs = pd.DataFrame({"col1": [1.0, 2.0, 3.0]})  # Not converted by the validation
+    with pd.option_context("mode.copy_on_write", copy_on_write):
+        missed = cache.validate(DataModelDummy, inputs)
+        missed.loc[0, "col1"] = 42
+        hit = cache.validate(DataModelDummy, inputs)
+        hit.loc[1, "col1"] = 42
+
+        actual = cache.validate(DataModelDummy, inputs)
+
+    assert actual["col1"].to_list() == [1, 2, 3]
+    assert inputs["col1"].to_list() == [1, 2, 3]
+
+
+@pytest.mark.usefixtures("copy_on_write")
+def test_validation_cache_distinguishes_schemas():
+    """Data that passed one schema is validated again with another one."""
+    cache = ValidationCache()
+    inputs = pd.DataFrame({"col1": [1, 2, 3]})
+    cache.validate(DataModelDummy, inputs)
+
+    with pytest.raises(SchemaError, match="greater_than_or_equal_to"):
+        cache.validate(DataModelStricter.to_schema(), inputs)
+
+
+@pytest.mark.usefixtures("copy_on_write")
+def test_validation_cache_evicts_least_recently_used():
+    """Only the given number of results are kept."""
+    cache = ValidationCache(maxsize=1)
+    cache.validate(DataModelDummy, pd.DataFrame({"col1": [1]}))
+    cache.validate(DataModelDummy, pd.DataFrame({"col1": [2]}))
+
+    cache.validate(DataModelDummy, pd.DataFrame({"col1": [1]}))
+    cache.clear()
+    cache.validate(DataModelDummy, pd.DataFrame({"col1": [1]}))
+
+    assert (cache.hits, cache.misses) == (0, 4)
+
+
+@pytest.mark.usefixtures("copy_on_write")
+def test_validate_cached_reuses_results_within_context_only(mocker):
+    """Results are kept by the cache of the context and released at its end."""
+    inputs = pd.DataFrame({"col1": [1, 2, 3]})
+    spy = mocker.spy(DataModelDummy, "validate")
+
+    with cache_validation() as cache:
+        validate_cached(DataModelDummy, inputs)
+        validate_cached(DataModelDummy, inputs)
+    validate_cached(DataModelDummy, inputs)
+
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert spy.call_count == 2
+    assert cache.validate(DataModelDummy, inputs) is not None
+    assert cache.misses == 2  # Cleared at the end of the context
+
+
+@pytest.mark.parametrize(
+    "other",
+    [
+        pd.DataFrame({"col1": [1, 2, 4]}),
+        pd.DataFrame({"col2": [1, 2, 3]}),
+        pd.DataFrame({"col1": [1.0, 2.0, 3.0]}),
+        pd.DataFrame({"col1": [1, 2, 3]}, index=[1, 2, 3]),
+    ],
+    ids=["values", "columns", "dtypes", "index"],
+)
+def test_fingerprint_changes_with_content(other):
+    """Values, column names, data types, and index are part of the fingerprint."""
+    inputs = pd.DataFrame({"col1": [1, 2, 3]})
+
+    assert fingerprint(inputs) == fingerprint(inputs.copy())
+    assert fingerprint(inputs) != fingerprint(other)
@@ -0,0 +1,206 @@
+import os
+import threading
+import time
+
+import numpy as np
+from sklearn.dummy import DummyRegressor
+from sklearn.linear_model import LinearRegression
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import StandardScaler
+
+from project.models import TransformerMemory
+from project.models.memory import _lock, _remove_stale
+from project.util import map_threaded
+
+
+def make_pipeline(memory, with_mean=True, regressor=None):
+    """Pipeline with one transformer and one predictor."""
+    scaler = StandardScaler(with_mean=with_mean)
+    regressor = regressor or DummyRegressor()
+    return Pipeline([("scaler", scaler), ("regressor", regressor)], memory=memory)
+
+
+def test_transformer_memory_fits_unchanged_steps_once(tmp_path):
+    """Pipelines with the same leading steps reuse the fitted transformers."""
+    memory = TransformerMemory(tmp_path)
+    X, y = np.arange(10.0).reshape(5, 2), np.arange(5.0)
+
+    first = make_pipeline(memory).fit(X, y)
+    second = make_pipeline(memory, regressor=LinearRegression()).fit(X, y)
+
+    assert (memory.misses, memory.hits) == (1, 1)
+    assert second["scaler"].mean_.tolist() == first["scaler"].mean_.tolist()
+
+
+def test_transformer_memory_fits_changed_steps_again(tmp_path):
+    """Different step parameters or input data are cached separately."""
+    memory = TransformerMemory(tmp_path)
+    X, y = np.arange(10.0).reshape(5, 2), np.arange(5.0)
+
+    make_pipeline(memory).fit(X, y)
+    make_pipeline(memory, with_mean=False).fit(X, y)
+    make_pipeline(memory).fit(X + 1, y)
+
+    assert (memory.misses, memory.hits) == (3, 0)
+
+
+def test_transformer_memory_calls_concurrent_duplicates_once(tmp_path):
+    """Concurrent calls with the same arguments wait for the first one."""
+    memory = TransformerMemory(tmp_path, poll_interval=0.01)
+    calls = []
+
+    @memory.cache
+    def func(x):
+        calls.append(x)
+        time.sleep(0.1)
+        return x * 2
+
+    actual = map_threaded(func, [1] * 4, max_workers=4)
+
+    assert list(actual) == [2] * 4
+    assert calls == [1]
+
+
+def test_transformer_memory_ignores_arguments(tmp_path):
+    """Ignored arguments do not affect the key."""
+    memory = TransformerMemory(tmp_path)
+
+    func = memory.cache(lambda x, message: x, ignore=["message"])
+    func(1, message="a")
+    func(1, message="b")
+
+    assert (memory.misses, memory.hits) == (1, 1)
+
+
+def test_transformer_memory_removes_stale_locks(tmp_path):
+    """A lock of a killed process does not block later calls forever."""
+    memory = TransformerMemory(tmp_path, timeout=1, poll_interval=0.01)
+    func = memory.cache(lambda x: x)
+    func(1)
+    (lock,) = [path.parent / "lock" for path in memory.directory.rglob("output.pkl")]
+    lock.touch()
+    os.utime(lock, (time.time() - 10, time.time() - 10))
+
+    thread = threading.Thread(target=func, args=(1,))
+    thread.start()
+    thread.join(timeout=5)
+
+    assert not thread.is_alive()
+    assert not lock.exists()
+
+
+def test_transformer_memory_keeps_stale_lock_replaced_concurrently(tmp_path, mocker):
+    """A fresh lock taken by another process after the check of its age is kept."""
+    lock = tmp_path / "lock"
+    lock.touch()
+    os.utime(lock, (time.time() - 10, time.time() - 10))
+    rename = os.rename
+
+    def take_over_then_rename(src, dst):
+        src.unlink()  # Another process removes the stale lock and locks again
+        src.touch()
+        rename(src, dst)
+
+    mocker.patch("os.rename", side_effect=take_over_then_rename)
+    _remove_stale(lock, timeout=1)
+
+    assert [path.name for path in tmp_path.iterdir()] == ["lock"]
+    assert time.time() - lock.stat().st_mtime < 5
+
+
+def test_lock_creates_directory_evicted_concurrently(tmp_path, mocker):
+    """The directory of a lock is created again if it is removed before locking."""
+    lock = tmp_path / "entry" / "lock"
+    mkdir = mocker.spy(type(tmp_path), "mkdir")
+
+    with _lock(lock, timeout=1, poll_interval=0.01):
+        assert lock.exists()
+
+    assert mkdir.call_count == 1
+    assert not lock.exists()
+
+
+def test_lock_keeps_lock_taken_over_by_another_process(tmp_path):
+    """Releasing a lock considered stale does not remove the lock of another process."""
+    lock = tmp_path / "lock"
+
+    with _lock(lock, timeout=1, poll_interval=0.01):
+        lock.unlink()  # Another process removes the lock as stale and locks again
+        lock.touch()
+
+    assert lock.exists()
+
+
+def test_transformer_memory_evicts_steps_beyond_budget(tmp_path):
+    """The least recently used steps are evicted if a new step exceeds the budget."""
+    memory = TransformerMemory(tmp_path, max_bytes="2.5K")
+    func = memory.cache(lambda x: np.zeros(100) + x)  # About 1K each
+    func(1)
+    func(2)
+    func(1)  # More recently used than the second step
+
+    func(3)
+    func(1)
+    func(2)
+
+    assert (memory.misses, memory.hits) == (4, 2)
+    assert sorted(memory.manifest()["hits"]) == [0, 2]  # The third step is evicted
+
+
+def test_transformer_memory_prunes_to_given_budget(tmp_path):
+    """The cache can be pruned to any budget, clearing it with a budget of zero."""
+    memory = TransformerMemory(tmp_path)
+    func = memory.cache(lambda x: x)
+    func(1)
+    func(2)
+
+    first = memory.prune("1G")
+    second = memory.prune()
+
+    assert first.empty
+    assert len(second) == 2
+    assert memory.manifest().empty
+    assert memory.prune().empty
+
+
+def test_transformer_memory_fits_step_evicted_concurrently_again(tmp_path):
+    """A step removed by another process after listing it is fitted again."""
+    memory = TransformerMemory(tmp_path)
+    func = memory.cache(lambda x: x)
+    func(1)
+    (output,) = memory.directory.rglob("output.pkl")
+    output.unlink()  # Metadata is still listed
+
+    actual = func(1)
+
+    assert actual == 1
+    assert (memory.misses, memory.hits) == (2, 0)
+
+
+def test_transformer_memory_restores_lost_metadata(tmp_path):
+    """A step whose metadata was not written is listed again on its next read."""
+    memory = TransformerMemory(tmp_path)
+    func = memory.cache(lambda x: x)
+    func(1)
+    (metadata,) = memory.directory.rglob("metadata.json")
+    metadata.unlink()  # The process died after writing the result
+    assert memory.manifest().empty
+
+    actual = func(1)
+
+    assert actual == 1
+    assert (memory.misses, memory.hits) == (1, 1)
+    assert memory.manifest()["hits"].tolist() == [1]
+    assert len(memory.prune()) == 1
+
+
+def test_transformer_memory_clears_cache(tmp_path):
+    """Cleared steps are fitted again."""
+    memory = TransformerMemory(tmp_path)
+    func = memory.cache(lambda x: x)
+    func(1)
+
+    memory.clear()
+    func(1)
+
+    assert (memory.misses, memory.hits) == (2, 0)
@@ -0,0 +1,75 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.linear_model import LinearRegression, Ridge
+from sklearn.model_selection import KFold, cross_val_score
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import StandardScaler
+
+from project.models import TransformerMemory, cross_validate
+
+
+@pytest.fixture
+def data():
+    """Features and noisy target with a linear relation."""
+    rng = np.random.default_rng(42)
+    X = pd.DataFrame(rng.random((60, 2)), columns=pd.Index(["a", "b"]))
+    return X, X @ [1.0, 2.0] + rng.normal(0, 0.1, 60)
+
+
+def make_pipeline(regressor=None, memory=None):
+    """Pipeline with one transformer and one predictor."""
+    steps = [("scaler", StandardScaler()), ("regressor", regressor or Ridge())]
+    return Pipeline(steps, memory=memory)
+
+
+@pytest.mark.parametrize(("n_jobs", "threads"), [(1, None), (2, None), (2, 1)])
+def test_cross_validate_scores_all_folds(data, n_jobs, threads):
+    """The scores of all folds equal the ones of Scikit-Learn in the same order."""
+    cv = KFold(3, shuffle=True, random_state=42)
+    expected = cross_val_score(make_pipeline(), *data, cv=cv).tolist()
+
+    actual = cross_validate(make_pipeline(), *data, cv, n_jobs=n_jobs, threads=threads)
+
+    assert [fold.fold for fold in actual] == [0, 1, 2]
+    assert [fold.score for fold in actual] == pytest.approx(expected)
+    assert all(fold.fit_time > 0 and not fold.cached for fold in actual)
+
+
+def test_cross_validate_does_not_hash_data_without_memory(data, mocker):
+    """The fingerprint of the data is only computed to look up cached folds."""
+    hash_ = mocker.patch("joblib.hash")
+
+    cross_validate(make_pipeline(), *data, KFold(3), n_jobs=1)
+
+    hash_.assert_not_called()
+
+
+def test_cross_validate_reads_folds_from_memory(data, tmp_path):
+    """Re-runs with the same data and parameters skip the scored folds."""
+    memory = TransformerMemory(tmp_path)
+    model = make_pipeline(memory=memory)
+    first = cross_validate(model, *data, KFold(3), n_jobs=1, memory=memory)
+
+    actual = cross_validate(model, *data, KFold(3), n_jobs=1, memory=memory)
+
+    assert all(fold.cached for fold in actual)
+    assert [fold.score for fold in actual] == [fold.score for fold in first]
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        lambda model, X, y: (model.set_params(regressor=LinearRegression()), X, y),
+        lambda model, X, y: (model, X + 1, y),
+    ],
+    ids=["parameters", "data"],
+)
+def test_cross_validate_scores_changes_again(data, tmp_path, change):
+    """Different parameters or data are scored again."""
+    memory = TransformerMemory(tmp_path)
+    cross_validate(make_pipeline(), *data, KFold(3), n_jobs=1, memory=memory)
+
+    actual = cross_validate(*change(make_pipeline(), *data), KFold(3), memory=memory)
+
+    assert not any(fold.cached for fold in actual)
@@ -0,0 +1,106 @@
+import numpy as np
+import pytest
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.linear_model import LinearRegression
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import StandardScaler
+
+from project.models import TransformerMemory, fit_warm_start
+
+
+class FakeTrial:
+    """Record the reported scores and prune after a number of reports."""
+
+    def __init__(self, prune_after=None):
+        self.reports = {}
+        self.prune_after = prune_after
+
+    def report(self, value, step):
+        self.reports[step] = value
+
+    def should_prune(self):
+        return len(self.reports) == self.prune_after
+
+
+@pytest.fixture
+def data():
+    """Features and target with a linear relation."""
+    X = np.random.default_rng(42).random((50, 2))
+    return X, X @ [1.0, 2.0]
+
+
+def make_pipeline(regressor, memory=None):
+    """Pipeline with one transformer and one predictor."""
+    return Pipeline(
+        [("scaler", StandardScaler()), ("regressor", regressor)], memory=memory
+    )
+
+
+def test_fit_warm_start_grows_forest_in_stages(data):
+    """The forest reports its out-of-bag score per stage and ends with all trees."""
+    trial = FakeTrial()
+    model = make_pipeline(RandomForestRegressor(n_estimators=50, random_state=42))
+
+    actual = fit_warm_start(model, *data, trial)
+
+    assert not actual
+    assert list(trial.reports) == [10, 20, 50]
+    assert len(model["regressor"].estimators_) == 50
+    assert not model["regressor"].warm_start
+    assert not model["regressor"].oob_score
+    assert trial.reports[50] == model["regressor"].oob_score_
+    assert trial.reports[50] < model.score(*data)  # Not scored on the training data
+
+
+def test_fit_warm_start_stops_if_pruned(data):
+    """A pruned forest stops growing."""
+    trial = FakeTrial(prune_after=1)
+    model = make_pipeline(RandomForestRegressor(n_estimators=50, random_state=42))
+
+    actual = fit_warm_start(model, *data, trial)
+
+    assert actual
+    assert list(trial.reports) == [10]
+    assert len(model["regressor"].estimators_) == 10
+
+
+def test_fit_warm_start_keeps_cached_steps(data, tmp_path):
+    """Leading steps fitted as clones of a caching pipeline are part of the model."""
+    regressor = RandomForestRegressor(n_estimators=10, random_state=42)
+    model = make_pipeline(regressor, memory=TransformerMemory(tmp_path))
+
+    fit_warm_start(model, *data, FakeTrial())
+
+    assert model["scaler"].mean_.shape == (2,)
+
+
+def test_fit_warm_start_grows_single_forest(data):
+    """A pipeline of only a forest grows on the features directly."""
+    trial = FakeTrial()
+    regressor = RandomForestRegressor(n_estimators=20, random_state=42)
+
+    fit_warm_start(Pipeline([("regressor", regressor)]), *data, trial)
+
+    assert list(trial.reports) == [10, 20]
+
+
+@pytest.mark.parametrize("trial", [None, FakeTrial()])
+def test_fit_warm_start_fits_as_usual(data, trial):
+    """Without a trial or a forest, the pipeline is fitted at once."""
+    model = make_pipeline(LinearRegression())
+
+    actual = fit_warm_start(model, *data, trial)
+
+    assert not actual
+    assert model.score(*data) == pytest.approx(1.0)
+
+
+def test_fit_warm_start_fits_forest_without_bootstrap_as_usual(data):
+    """Forests without out-of-bag samples cannot report unbiased scores."""
+    trial = FakeTrial()
+    regressor = RandomForestRegressor(n_estimators=20, bootstrap=False)
+
+    fit_warm_start(make_pipeline(regressor), *data, trial)
+
+    assert trial.reports == {}
+    assert len(regressor.estimators_) == 20
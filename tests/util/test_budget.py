@@ -0,0 +1,63 @@
+import pytest
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.linear_model import Ridge
+from sklearn.pipeline import make_pipeline
+from sklearn.preprocessing import StandardScaler
+from threadpoolctl import threadpool_info
+
+from project.util import CpuBudget, limit_threads, split_cores
+
+
+@pytest.mark.parametrize(
+    ("jobs", "processes", "expected"),
+    [
+        (1, 1, CpuBudget(jobs=1, cores=8, processes=1, threads=8)),
+        (2, 4, CpuBudget(jobs=2, cores=4, processes=4, threads=1)),
+        (3, 2, CpuBudget(jobs=3, cores=2, processes=2, threads=1)),
+        (16, 5, CpuBudget(jobs=16, cores=1, processes=1, threads=1)),
+    ],
+)
+def test_split_cores_allocates_at_least_one_core_each(jobs, processes, expected):
+    """Cores are split equally without oversubscribing them."""
+    assert split_cores(jobs, processes, total=8) == expected
+
+
+def test_split_cores_detects_available_cores(monkeypatch):
+    """Without a total, all available cores are split."""
+    monkeypatch.setattr("joblib.cpu_count", lambda: 6)
+
+    assert split_cores(jobs=2).cores == 3
+
+
+def test_limit_threads_sets_and_restores_unset_n_jobs():
+    """Threads go to the final step while in the context and are not persisted."""
+    model = make_pipeline(StandardScaler(), RandomForestRegressor())
+
+    with limit_threads(model, 3):
+        assert model[-1].n_jobs == 3
+        limits = {pool["num_threads"] for pool in threadpool_info()}
+
+    assert model[-1].n_jobs is None
+    assert limits <= {1}
+
+
+def test_limit_threads_keeps_set_n_jobs():
+    """Explicit `n_jobs` is left as is and BLAS gets the threads instead."""
+    model = RandomForestRegressor(n_jobs=2)
+
+    with limit_threads(model, 3):
+        assert model.n_jobs == 2
+        limits = {pool["num_threads"] for pool in threadpool_info()}
+
+    assert model.n_jobs == 2
+    assert limits <= {1, 3}
+
+
+def test_limit_threads_leaves_estimators_without_n_jobs_unchanged():
+    """Estimators without `n_jobs` only have their BLAS threads limited."""
+    model = Ridge()
+
+    with limit_threads(model, 2):
+        assert "n_jobs" not in model.get_params()
+
+    assert "n_jobs" not in model.get_params()
@@ -0,0 +1,70 @@
+import threading
+
+import pytest
+from inline_snapshot import snapshot
+from structlog.contextvars import bind_contextvars, get_contextvars, unbind_contextvars
+
+from project.util import map_threaded
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_map_threaded_preserves_input_order(max_workers):
+    """Results must be returned in the order of the inputs like the builtin map."""
+    expected = snapshot([0, 1, 4, 9, 16, 25, 36, 49])
+
+    actual = map_threaded(lambda x: x**2, range(8), max_workers=max_workers)
+
+    assert list(actual) == expected
+
+
+def test_map_threaded_runs_sequentially_in_calling_thread():
+    """A single worker must not require thread-bound resources to be thread-safe."""
+    caller = threading.get_ident()
+
+    actual = map_threaded(lambda _: threading.get_ident(), range(3))
+
+    assert set(actual) == {caller}
+
+
+def test_map_threaded_runs_calls_concurrently():
+    """All calls must run at the same time with enough workers."""
+    barrier = threading.Barrier(3, timeout=5)
+
+    actual = map_threaded(lambda _: barrier.wait() >= 0, range(3), max_workers=3)
+
+    assert all(actual)
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_map_threaded_isolates_logging_context(max_workers):
+    """Workers inherit the context of the caller, but do not leak their own."""
+
+    def func(name: str) -> dict:
+        bind_contextvars(query_name=name)
+        return get_contextvars()
+
+    bind_contextvars(caller="main")
+    expected = snapshot(
+        [
+            {"caller": "main", "query_name": "a"},
+            {"caller": "main", "query_name": "b"},
+        ]
+    )
+
+    actual = list(map_threaded(func, ["a", "b"], max_workers=max_workers))
+
+    assert actual == expected
+    assert get_contextvars() == {"caller": "main"}
+    unbind_contextvars("caller")
+
+
+def test_map_threaded_raises_exceptions_of_workers():
+    """Failing calls must not go unnoticed."""
+
+    def func(x: int) -> int:
+        if x == 1:
+            raise ValueError("Failed call")
+        return x
+
+    with pytest.raises(ValueError, match="Failed call"):
+        list(map_threaded(func, range(4), max_workers=2))
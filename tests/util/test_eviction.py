@@ -0,0 +1,39 @@
+import pandas as pd
+import pytest
+
+from project.util import parse_bytes, select_evicted
+
+
+@pytest.mark.parametrize(
+    ("size", "expected"),
+    [
+        pytest.param(1024, 1024, id="int"),
+        pytest.param("100", 100, id="str"),
+        pytest.param("2k", 2048, id="kilo"),
+        pytest.param("3 MiB", 3 * 1024**2, id="mebi"),
+        pytest.param("1.5GB", 1536 * 1024**2, id="giga"),
+    ],
+)
+def test_parse_bytes(size, expected):
+    """Sizes can be given with binary units."""
+    assert parse_bytes(size) == expected
+
+
+@pytest.mark.parametrize(
+    ("policy", "expected"),
+    [("lru", ["a", "b"]), ("lfu", ["c", "a"])],
+)
+def test_select_evicted_by_policy(policy, expected):
+    """The least recently or the least frequently used entries are evicted first."""
+    entries = pd.DataFrame(
+        {
+            "name": ["a", "b", "c"],
+            "bytes": [1, 1, 1],
+            "accessed": [1, 2, 3],
+            "hits": [1, 2, 0],
+        }
+    )
+
+    actual = select_evicted(entries, max_bytes=1, policy=policy)
+
+    assert sorted(actual["name"]) == sorted(expected)
@@ -0,0 +1,15 @@
+import pandas as pd
+import polars as pl
+import pytest
+
+from project.util import write_parquet
+
+
+@pytest.mark.parametrize("frame", [pd.DataFrame, pl.LazyFrame])
+def test_write_parquet_writes_pandas_and_polars_data(tmp_path, frame):
+    """Loaded data is written alike, without the index of pandas."""
+    path = tmp_path / "raw.parquet"
+
+    write_parquet(frame({"a": [1, 2]}), path)
+
+    pd.testing.assert_frame_equal(pd.read_parquet(path), pd.DataFrame({"a": [1, 2]}))